@@ -18,6 +18,90 @@ def COHORT():
     return Proj.MP()["PCODE"]
 
 
+def MORT_LOOKUP():
+
+    """Mortality table as a dense (age x sex) array
+
+    Rows are indexed by the age itself and columns by the position of the
+    sex in ``mort_table.columns``. The trailing column of zeros is hit by
+    code -1, i.e. a sex not found in the table."""
+
+    ages = np.arange(mort_table.index.max() + 1)
+    rates = mort_table.reindex(ages).to_numpy(dtype = float)
+
+    return np.hstack([rates, np.zeros((len(ages), 1))])
+
+
+def LAPSE_LOOKUP():
+
+    """Lapse table as dense arrays indexed by policy year,
+    one per basis (Projection, Reserves)"""
+
+    years = np.arange(lapse_table.index.max() + 1)
+    return {basis: lapse_table[basis].reindex(years).to_numpy(dtype = float)
+            for basis in lapse_table.columns}
+
+
+def COMM_LOOKUP():
+
+    """Commission rates as dense arrays indexed by policy year,
+    one per basis (Projection, Reserves)"""
+
+    years = np.arange(comm_rates.index.max() + 1)
+    return {basis: comm_rates[basis].reindex(years).to_numpy(dtype = float)
+            for basis in comm_rates.columns}
+
+
+def GSV_LOOKUP():
+
+    """GSV factors as a dense (premium term x policy year) array
+
+    Row ``i`` holds the factors of the "i-PPT" column of ``GSV_Factor``.
+    Premium terms without a column, and the trailing row used for terms
+    beyond the longest one, are zero."""
+
+    terms = [int(str(i).split("-")[0]) for i in GSV_Factor.columns]
+    years = np.arange(GSV_Factor.index.max() + 1)
+    fac = np.zeros((max(terms) + 2, len(years)))
+
+    for i, ppt in zip(GSV_Factor.columns, terms):
+        fac[ppt] = GSV_Factor[i].reindex(years).to_numpy(dtype = float)
+
+    return fac
+
+
+def INCM_FAC_LOOKUP():
+
+    """Income benefit rates as a dense (premium term x age at entry x 2) array
+
+    The last axis holds the "First 5 years" and "Last 5 years" rates.
+    Premium terms without rates, and the trailing row used for terms
+    beyond the longest one, are zero."""
+
+    terms = list(IncomeBenefit.columns.get_level_values(0).unique())
+    ages = np.arange(IncomeBenefit.index.max() + 1)
+    fac = np.zeros((max(terms) + 2, len(ages), 2))
+
+    for ppt in terms:
+        fac[ppt] = IncomeBenefit[ppt][["First 5 years", "Last 5 years"]].reindex(ages).to_numpy(dtype = float)
+
+    return fac
+
+
+def RATE_CURVE():
+
+    """Yield curve by projection month, one array of monthly rates per
+    column of ``yield_curve`` (Interest Rates, Discount Rates)
+
+    Entry ``t`` holds (1 + rate) ** (1/12) - 1 for the rate of year ceil(t/12)."""
+
+    months = np.arange(12 * yield_curve.index.max() + 1)
+    rates = yield_curve.reindex(np.ceil(months/12))
+
+    return {curve: (1 + rates[curve].to_numpy(dtype = float))**(1/12) - 1
+            for curve in yield_curve.columns}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -11,47 +11,45 @@ _spaces = []
 # ---------------------------------------------------------------------------
 # Cells
 
-def RESULTS(export: bool = False, name: str = "results", file_type: str = ".csv"):
+def RESULTS(export: bool = False, name: str = "results", file_type: str = ".csv", engine: str = "modelx"):
 
     """All results
         export (bool): whether to export the results (setting this to False returns the pd.Dataframe)
         name (str): name to the file being exported
-        file_type (str): set to '.csv' by default. Other option is '.xlsx'
+        file_type (str): set to '.csv' by default. Other options are '.xlsx', '.parquet' and '.feather'
+        engine (str): set to 'modelx' by default (cell-by-cell). Other option is 'numpy',
+            which evaluates whole (policy x month) grids in Projection_Vec and Reserves_Vec
     """
 
     from datetime import datetime
     print(f"{Input.inspect.stack()[0][3]}({export}, {name}) called at: {datetime.now().strftime('%H:%M:%S')}")
 
     t_len = range(Projection.PROJ_LEN().max())
-    Data = dict(); DataColumns = []; ExtendedFx = []; ForbiddenCells = []
-    elements = {"Input": list(Input.cells),
-                "Reserves": list(Reserves.cells),
-                "Projection": list(Projection.cells)}
+    Plan = RESULT_PLAN(); Objects = dict()
+    Values = Input.np.empty((len(t_len), len(Plan)))
+
+    if engine == "numpy":
+        VecSpaces = {"Reserves": Reserves_Vec, "Projection": Projection_Vec}
+        for j, (DataColumn, Cell, Args) in enumerate(tqdm(Plan)):
+            VecSpace = VecSpaces.get(Cell.parent.name)
+            if VecSpace is None or Args or Cell.name not in VecSpace.cells:
+                raise ValueError(f"{DataColumn} has no vectorised counterpart for engine = 'numpy'")
+            Grid = VecSpace.cells[Cell.name]()
+            Values[:, j] = Grid[:len(t_len)] if Grid.ndim == 1 else Grid[:, :len(t_len)].sum(axis = 0)
+    elif engine == "modelx":
+        for j, (DataColumn, Cell, Args) in enumerate(tqdm(Plan)):
+            try:
+                Values[:, j] = [Input.np.asarray(Cell(t, *Args)).sum() for t in t_len]
+            except (TypeError, ValueError):
+                Objects[DataColumn] = Input.pd.Series([Cell(t, *Args) for t in t_len], index = t_len, dtype = object)
+    else:
+        raise ValueError(f"invalid engine passed: {engine}")
 
-    for userspace in elements:
-        for cell in elements[userspace]:
-            if eval(f"{userspace}.{cell}.parameters == ('t',)"):
-                DataColumns.append(f"{userspace}.{cell}")
-            elif eval(f"{userspace}.{cell}.parameters == ()"):
-                pass
-            elif f"{userspace}.{cell}" not in ForbiddenCells:
-                ExtendedFx.append(f"{userspace}.{cell}")
+    DF = Input.pd.DataFrame(Values, index = t_len, columns = [DataColumn for DataColumn, Cell, Args in Plan])
+    for DataColumn in Objects:
+        DF[DataColumn] = Objects[DataColumn]
+    del(Values, Objects)
 
-    for DataColumn in tqdm(DataColumns+ExtendedFx):
-        if DataColumn not in ExtendedFx:
-            try:
-                Data[DataColumn] = Input.pd.Series([eval(f"sum({DataColumn}({t}))") for t in t_len], index = t_len)
-            except TypeError as e:
-                Data[DataColumn] = Input.pd.Series([eval(f"{DataColumn}({t})") for t in t_len], index = t_len)
-        else:
-            args = eval(f'{DataColumn}.doc.replace(" ", "").split(",")')
-            for arg in args:
-                try:
-                    Data[f"{DataColumn}({arg})"] = Input.pd.Series([eval(f"sum({DataColumn}({t}, '{arg}'))") for t in t_len], index = t_len)
-                except TypeError as e:
-                    Data[f"{DataColumn}({arg})"] = Input.pd.Series([eval(f"{DataColumn}({t}, '{arg}')") for t in t_len], index = t_len)
-
-    DF = Input.pd.DataFrame.from_dict(Data)
     if export == True:
         try:
             if name == "": name = str('%.0e'%len(Input.model_point_table.index)).replace("+","")
@@ -61,6 +59,14 @@ def RESULTS(export: bool = False, name: str = "results", file_type: str = ".csv"
                 DF.to_csv(path); del(DF)
             elif file_type == ".xlsx":
                 DF.to_excel(path); del(DF)
+            elif file_type in (".parquet", ".feather"):
+                ## long format: one row per (cell, t)
+                DF = DF.rename_axis("t").melt(ignore_index = False, var_name = "cell", value_name = "value").reset_index()
+                DF = DF[["cell", "t", "value"]].astype({"value": float})
+                if file_type == ".parquet":
+                    DF.to_parquet(path, index = False); del(DF)
+                else:
+                    DF.to_feather(path); del(DF)
             else:
                 raise TypeError("invalid file type passed")
             return f"{Input.inspect.stack()[0][3]} exported successfully!"
@@ -70,67 +76,122 @@ def RESULTS(export: bool = False, name: str = "results", file_type: str = ".csv"
         return DF
 
 
-def COHORT(name: str = "cohorts", file_type: str = ".xlsx"):
+def RESULT_PLAN():
 
-    """Cohort Results
-        name (str)(optional): name to the file being exported
-        file_type (str)(optional): set to '.xlsx' by default. Other option is '.csv'
+    """Column plan for RESULTS
+
+    A list of (column, cell, args) built once per model, holding direct
+    references to the cells whose first parameter is ``t``. Cells with further
+    parameters are expanded over the arguments listed in their doc.
     """
 
-    from datetime import datetime
-    print(f"{Input.inspect.stack()[0][3]}({name}{file_type}) called at: {datetime.now().strftime('%H:%M:%S')}")
+    DataColumns = []; ExtendedFx = []; ForbiddenCells = []
+    elements = {"Input": Input,
+                "Reserves": Reserves,
+                "Projection": Projection}
 
-    t_len = range(Projection.PROJ_LEN().max())
-    DataColumns = []; ExtendedFx = []; ForbiddenCells = ["Unit_Fund.AVG_2Y","Reserve_UF.AVG_2Y"]
-    COHORT = Input.COHORT(); CohortSet = list(set(COHORT)); CohortSet.sort()
+    for userspace in elements:
+        for cell in elements[userspace].cells.values():
+            if cell.parameters == ('t',):
+                DataColumns.append((f"{userspace}.{cell.name}", cell, ()))
+            elif cell.parameters == ():
+                pass
+            elif f"{userspace}.{cell.name}" not in ForbiddenCells:
+                for arg in cell.doc.replace(" ", "").split(","):
+                    ExtendedFx.append((f"{userspace}.{cell.name}({arg})", cell, (arg,)))
 
-    def CohortSum(x: Input.pd.Series):
-        var = x.copy()
-        var.index = COHORT
-        return var.groupby(var.index).sum()
+    return DataColumns + ExtendedFx
 
-    for i in CohortSet:
-        exec(f"Data_{i} = dict()")
 
-    elements = {
-                "Reserves": list(Reserves.cells),
-                "Projection": list(Projection.cells),
-                }
+def SERIATIM(cells: tuple = (), start: int = 0, stop: int = None):
 
-    for userspace in elements:
-        for cell in elements[userspace]:
-            if eval(f"{userspace}.{cell}.parameters == ('t',)"):
-                DataColumns.append(f"{userspace}.{cell}")
-            elif eval(f"{userspace}.{cell}.parameters == ()"):
-                pass
-            elif f"{userspace}.{cell}" not in ForbiddenCells:
-                ExtendedFx.append(f"{userspace}.{cell}")
+    """Per-policy results of the selected model points
+        cells (tuple)(optional): columns of RESULT_PLAN() to include, e.g. ("Projection.NET_CF",);
+            all columns by default
+        start, stop (int)(optional): the block of months to include, as in range(...)[start:stop]; all months by default
 
-    for DataColumn in tqdm(DataColumns+ExtendedFx):
-        if DataColumn not in ExtendedFx:
-            Multi_Str = "".join([f"Data_{i}['{DataColumn}']," for i in CohortSet])
-            try:
-                temp = Input.np.array(Input.pd.Series([eval(f"{DataColumn}({t})") for t in t_len], index = t_len).apply(CohortSum)).transpose()
-                exec(f"{Multi_Str} = temp"); del(temp)
-            except (TypeError, AttributeError):
-                for i in CohortSet:
-                    temp = Input.pd.Series([eval(f"{DataColumn}({t})") for t in t_len], index = t_len)
-                    exec(f"Data_{i}['{DataColumn}'] = temp"); del(temp)
-        else:
-            args = eval(f'{DataColumn}.doc.replace(" ", "").split(",")')
-            for arg in args:
-                Multi_Str = "".join([f"Data_{i}['{DataColumn}({arg})']," for i in CohortSet])
-                try:
-                    temp = Input.np.array(Input.pd.Series([eval(f"{DataColumn}({t}, '{arg}')") for t in t_len], index = t_len).apply(CohortSum)).transpose()
-                    exec(f"{Multi_Str} = temp"); del(temp)
-                except (TypeError, AttributeError):
-                    for i in CohortSet:
-                        temp = Input.pd.Series([eval(f"{DataColumn}({t}, '{arg}')") for t in t_len], index = t_len)
-                        exec(f"Data_{i}['{DataColumn}({arg})'] = temp"); del(temp)
+        One row per model point and month, one column per cell.
+        run_methods.seriatim_model streams it to disk batch by batch, a block of months at a time.
+    """
+
+    t_len = range(Projection.PROJ_LEN().max())[start:stop]
+    Columns = {DataColumn: (DataColumn, Cell, Args) for DataColumn, Cell, Args in RESULT_PLAN()}
+    try:
+        Plan = [Columns[DataColumn] for DataColumn in cells] if cells else list(Columns.values())
+    except KeyError as e:
+        raise ValueError(f"{e} is not a column of RESULT_PLAN()")
+
+    Index = Projection.MP().index
+    Values = Input.np.empty((len(Index), len(t_len), len(Plan)))
+    for j, (DataColumn, Cell, Args) in enumerate(Plan):
+        for k, t in enumerate(t_len):
+            Values[:, k, j] = Input.np.asarray(Cell(t, *Args), dtype = float)
+
+    Index = Input.pd.MultiIndex.from_product([Index, t_len], names = [Index.name or "point_id", "t"])
+    return Input.pd.DataFrame(Values.reshape(-1, len(Plan)), index = Index,
+                              columns = [DataColumn for DataColumn, Cell, Args in Plan])
+
+
+def COHORT(name: str = "cohorts", file_type: str = ".xlsx", export: bool = True, months: int = None):
+
+    """Cohort Results
+        name (str)(optional): name to the file being exported
+        file_type (str)(optional): set to '.xlsx' by default. Other options are '.csv', '.parquet' and '.feather'
+        export (bool)(optional): whether to export the results; if False, returns them as two pd.Dataframes with
+            one column per month, so that the results of batches can be combined: the per-cohort sums, one row per
+            (cohort, cell), left empty for the cells whose values are not per model point; and the values of those
+            cells, the same for every cohort and every batch, one row per cell
+        months (int)(optional): number of months projected; defaults to the longest projection of the selected
+            model points. run_methods.cohort_model passes the months of the whole model point table to every batch
+    """
+
+    from datetime import datetime
+    print(f"{Input.inspect.stack()[0][3]}({name}{file_type}) called at: {datetime.now().strftime('%H:%M:%S')}")
+
+    t_len = range(Projection.PROJ_LEN().max() if months is None else months)
+    ForbiddenCells = [] ## User can add cells to leave out of the cohort results, e.g. "Projection.NET_CF"
+    COHORT = Input.COHORT(); CohortCodes, CohortSet = Input.pd.factorize(COHORT, sort = True); CohortSet = CohortSet.tolist()
+    ## segment of each (model point, month): cohort code x months + month
+    Segments = (CohortCodes[:, None] * len(t_len) + Input.np.arange(len(t_len))).ravel(); Size = len(CohortSet) * len(t_len)
+
+    def CohortSum(x: list):
+        ## sums a cell's (model point x month) block over the cohorts in one pass: (cohort x month)
+        if Input.np.ndim(x[0]) != 1 or len(x[0]) != len(CohortCodes):
+            raise TypeError("not a value per model point")
+        try:
+            Block = Input.np.stack([Input.np.asarray(v, dtype = float) for v in x], axis = 1)
+        except ValueError:
+            raise TypeError("not a numeric value")
+        Block[Input.np.isnan(Block)] = 0
+        return Input.np.bincount(Segments, weights = Block.ravel(), minlength = Size).reshape(len(CohortSet), -1)
+
+    ## (column, cell, args): the columns of RESULT_PLAN() in Reserves and Projection
+    Plan = [(Column, Cell, Args) for Column, Cell, Args in RESULT_PLAN()
+            if Cell.parent.name in ("Reserves", "Projection") and f"{Cell.parent.name}.{Cell.name}" not in ForbiddenCells]
+    Columns = [Column for Column, Cell, Args in Plan]
+
+    ## (cohort x column x month); values that are not per model point are the same for every cohort
+    Data = Input.np.zeros((len(CohortSet), len(Plan), len(t_len))); Common = []
+    for j, (Column, Cell, Args) in enumerate(tqdm(Plan)):
+        Values = [Cell(t, *Args) for t in t_len]
+        try:
+            Data[:, j, :] = CohortSum(Values)
+        except (TypeError, AttributeError):
+            Data[:, j, :] = Input.np.asarray(Values, dtype = float); Common.append(j)
+        del(Values)
+
+    if not export:
+        ## the values common to all cohorts are taken once, not added up over the batches
+        CommonDF = Input.pd.DataFrame(Data[0, Common, :], columns = t_len,
+                                      index = Input.pd.Index([Columns[j] for j in Common], name = "cell"))
+        Data[:, Common, :] = Input.np.nan
+        return (Input.pd.DataFrame(Data.reshape(-1, len(t_len)), columns = t_len,
+                                   index = Input.pd.MultiIndex.from_product([CohortSet, Columns], names = [COHORT.name, "cell"])),
+                CommonDF)
 
     if file_type == ".csv":
-        for i in CohortSet:
-            DF = eval(f"Input.pd.DataFrame.from_dict(Data_{i})"); exec(f"del(Data_{i})")
+        for k, i in enumerate(CohortSet):
+            DF = Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns)
             filename = f"{name}_{i}" + file_type
             path = Input.model_path["Path"] + "\\" + filename
             try:
@@ -139,13 +200,33 @@ def COHORT(name: str = "cohorts", file_type: str = ".xlsx"):
                 raise PermissionError(f"The file '{filename}' is being used by another process")
             del(DF, path, filename)
         return f"{Input.inspect.stack()[0][3]} exported successfully!"
+    elif file_type in (".parquet", ".feather"):
+        ## long format: one row per (cohort, cell, t), written cohort by cohort
+        import pyarrow as pa, pyarrow.parquet as pq
+        filename = f"{name}" + file_type
+        path = Input.model_path["Path"] + "\\" + filename
+        Writer = None
+        try:
+            for k, i in enumerate(CohortSet):
+                DF = Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns)
+                DF = DF.rename_axis("t").melt(ignore_index = False, var_name = "cell", value_name = "value").reset_index()
+                DF.insert(0, "cohort", i)
+                Table = pa.Table.from_pandas(DF[["cohort", "cell", "t", "value"]].astype({"value": float}), preserve_index = False)
+                if Writer is None:
+                    Writer = pq.ParquetWriter(path, Table.schema) if file_type == ".parquet" else pa.ipc.new_file(path, Table.schema)
+                Writer.write_table(Table); del(DF, Table)
+            return f"{Input.inspect.stack()[0][3]} exported successfully!"
+        except PermissionError:
+            raise PermissionError(f"The file '{filename}' is being used by another process")
+        finally:
+            if Writer is not None: Writer.close()
     elif file_type == ".xlsx":
         filename = f"{name}" + file_type
         path = Input.model_path["Path"] + "\\" + filename
         with Input.pd.ExcelWriter(path) as w:
             try:
-                for i in CohortSet:
-                    DF = eval(f"Input.pd.DataFrame.from_dict(Data_{i})"); exec(f"del(Data_{i})")
+                for k, i in enumerate(CohortSet):
+                    DF = Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns)
                     DF.to_excel(w, sheet_name = f"{COHORT.name}_{i}")
                 return f"{Input.inspect.stack()[0][3]} exported successfully!"
             except PermissionError:
@@ -161,4 +242,8 @@ Input = ("Interface", ("..", "Input"), "auto")
 
 Projection = ("Interface", ("..", "Projection"), "auto")
 
-Reserves = ("Interface", ("..", "Reserves"), "auto")
\ No newline at end of file
+Reserves = ("Interface", ("..", "Reserves"), "auto")
+
+Projection_Vec = ("Interface", ("..", "Projection_Vec"), "auto")
+
+Reserves_Vec = ("Interface", ("..", "Reserves_Vec"), "auto")
\ No newline at end of file
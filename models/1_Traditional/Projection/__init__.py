@@ -206,7 +206,7 @@ def AGE(t):
 def AGE_AT_ENTRY():
     """The age at entry of the selected model point"""
 
-    return MP()["age_at_entry"]
+    return POLICY_BLOCK()["age_at_entry"]
 
 
 def DTH_BEN(t):
@@ -222,10 +222,10 @@ def COMM(t):
         return Input.pd.Series(0, index = MP().index)
     else:
         n = Input.comm_rates.index.max()
-        dur_m = list(Input.np.minimum(Input.np.ceil(DUR_M(t)/12), n))
-        comm_rates = Input.comm_rates["Projection"][dur_m]
+        dur_y = Input.np.minimum(Input.np.ceil(DUR_M(t)/12), n).to_numpy(dtype = int)
+        comm_rates = Input.COMM_LOOKUP()["Projection"][dur_y]
 
-        return (DUR_M(t) < POL_TERM_M()) * PREM_PAYBL_M(t) * list(comm_rates)
+        return (DUR_M(t) < POL_TERM_M()) * PREM_PAYBL_M(t) * comm_rates
 
 
 def DUR_Y(t):
@@ -299,10 +299,10 @@ def LAPSE_RATE(t):
     """Lapse rate"""
 
     n = Input.lapse_table.index.max()
-    dur_m = list(Input.np.minimum((DUR_M(t)/12).apply(Input.math.ceil), n))
-    lapse_rates = Input.lapse_table["Projection"][dur_m]
+    dur_y = Input.np.minimum(Input.np.ceil(DUR_M(t)/12), n).to_numpy(dtype = int)
+    lapse_rates = Input.LAPSE_LOOKUP()["Projection"][dur_y]
 
-    return Input.pd.Series(list(lapse_rates), index = MP().index)
+    return Input.pd.Series(lapse_rates, index = MP().index)
 
 
 def MP():
@@ -320,6 +320,17 @@ def MP():
         raise ValueError
 
 
+def POLICY_BLOCK():
+    """The columns of the selected model point(s) as contiguous NumPy arrays
+
+    Evaluated once per selection of :func:`MP`. The static per-policy cells
+    read their columns from it, so that they enter the projection as arrays
+    and not as Series to be aligned on every operation."""
+
+    Table = MP()
+    return {col: Input.np.ascontiguousarray(Table[col].to_numpy()) for col in Table.columns}
+
+
 def MORT_RATE_ANN(t):
     """Mortality rate to be applied at time t"""
 
@@ -355,7 +366,7 @@ def POL_TERM_Y():
     The element labeled ``policy_term`` of the Series returned by
     :func:`model_point`."""
 
-    return MP()["policy_term"]
+    return POLICY_BLOCK()["policy_term"]
 
 
 def POLS_DTH(t):
@@ -388,7 +399,7 @@ def INIT_POLS_IF():
     Number of in-force policies at time 0 referenced from :func:`pols_if`.
     Defaults to 1."""
 
-    return MP()["policy_count"]
+    return POLICY_BLOCK()["policy_count"]
 
 
 def POLS_LAPSE(t):
@@ -416,7 +427,7 @@ def POLS_MAT(t):
 def PREM_PP():
     """Annual premium per policy"""
 
-    return MP()["ann_prem"]
+    return POLICY_BLOCK()["ann_prem"]
 
 
 def PREM_PAYBL_M(t):
@@ -466,20 +477,26 @@ def RESULT_CF():
 def SEX(): 
     """The sex of the selected model point(s)"""
 
-    return MP()["sex"]
+    return POLICY_BLOCK()["sex"]
+
+
+def SEX_CODE():
+    """Column of the sex of the selected model point(s) in
+    :func:`Input.MORT_LOOKUP`, -1 if not in the mortality table"""
+
+    return Input.pd.Index(Input.mort_table.columns).get_indexer(SEX())
 
 
 def SUM_ASSURED():
     """The sum assured of the selected model point(s)"""
 
-    return MP()["sum_assured"]
+    return POLICY_BLOCK()["sum_assured"]
 
 
 def TERMINAL_BEN():
     """Terminal benefit"""
 
-    prem = PREM_PP()
-    mat_fac = Input.pd.Series([Input.mat_fac[POL_TERM_Y()[i]] for i in MP().index], index = MP().index)
+    mat_fac = Input.np.array([Input.mat_fac[term] for term in POL_TERM_Y()], dtype = float)
     return mat_fac * PREM_PP()
 
 
@@ -501,8 +518,7 @@ def INT_NET_CF(t):
     if t <= 0:
         return Input.pd.Series(0, index = MP().index)
     else:
-        y = Input.math.ceil(t/12)
-        i = (1 + Input.yield_curve["Interest Rates"][y]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Interest Rates"][t]
 
         return ( i * (PREM_PAYBL_M(t)
                       - EXPS_ACQ(t)
@@ -519,19 +535,38 @@ def EXPS_CLAIM(t):
 
 def PV_DB(t):
     """Present value of death benefit
-    for the calculation of surrender value"""
+    for the calculation of surrender value
+
+    Read from the backward sweep in :func:`PV_DB_SWEEP`"""
 
     if t <= 0 or t > PROJ_LEN().max():
         return Input.pd.Series(0, index = MP().index)
 
     else:
+        return Input.pd.Series(PV_DB_SWEEP()[:, t], index = MP().index)
+
+
+def PV_DB_SWEEP():
+    """Present value of death benefit at all t
+
+    Evaluated by backward induction in a single reverse sweep
+    (in steps of 12 months) over a preallocated array::
+
+        db * mort1 / disc_fac ** 0.5 + PV_DB(t+12) * (1 - mort1)/disc_fac"""
+
+    T = PROJ_LEN().max()
+    db = SUM_ASSURED()/PREM_PP()
+    pv = Input.np.zeros((len(MP().index), T + 13))
+
+    for t in range(T, 0, -1):
         disc_fac = 1 + Input.yield_curve["Interest Rates"][Input.np.ceil(t/12)]
-        mort1 = MORT_RATE_ANN(t-1)
-        db = SUM_ASSURED()/PREM_PP()
+        mort1 = MORT_RATE_ANN(t-1).to_numpy()
 
-        val = db * mort1 / (disc_fac ** 0.5) + PV_DB(t+12) * (1 - mort1)/disc_fac
+        val = db * mort1 / (disc_fac ** 0.5) + pv[:, t+12] * (1 - mort1)/disc_fac
 
-        return (DUR_M(t) <= POL_TERM_M()) * val
+        pv[:, t] = (DUR_M(t) <= POL_TERM_M()).to_numpy() * val
+
+    return pv
 
 
 def SSV(t):
@@ -546,13 +581,10 @@ def SSV(t):
 def BASE_MORT_RATE(t):
     """Base mortality rates at time t"""
 
-    ages = list(AGE(t)); sex = list(Input.mort_table.columns)
-    mort_rates = 0
-
-    for i in sex:
-        mort_rates += (SEX() == i) * list(Input.mort_table[i][ages])
+    ages = AGE(t).to_numpy(dtype = int)
+    mort_rates = Input.MORT_LOOKUP()[ages, SEX_CODE()]
 
-    return Input.pd.Series(mort_rates, name = Input.inspect.stack()[0][3])
+    return Input.pd.Series(mort_rates, index = MP().index, name = "BASE_MORT_RATE")
 
 
 def POL_TERM_M():
@@ -601,7 +633,7 @@ def INT_RESERVES(t):
         return Input.pd.Series(0, index = MP().index)
 
     else:
-        i = (1 + Input.yield_curve["Interest Rates"][Input.math.ceil(t/12)]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Interest Rates"][t]
 
         return (DUR_M(t) <= POL_TERM_M()) * RESERVE_IF(t-1) * i
 
@@ -661,7 +693,7 @@ def INT_SOLVM(t):
     if t <= 0:
         return Input.pd.Series(0, index = MP().index)
     else:
-        i = (1 + Input.yield_curve["Interest Rates"][Input.math.ceil(t/12)]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Interest Rates"][t]
 
         return (DUR_M(t) <= POL_TERM_M()) * SOLVM_IF(t-1) * i
 
@@ -670,7 +702,7 @@ def DISC_RATE_M(t):
     """Monthly discount rate:
         best estimate basis"""
 
-    return (1 + Input.yield_curve["Discount Rates"][Input.math.ceil((t+1)/12)])**(1/12) - 1
+    return Input.RATE_CURVE()["Discount Rates"][t+1]
 
 
 def INV_EXP_SOLVM(t):
@@ -679,8 +711,8 @@ def INV_EXP_SOLVM(t):
     if t <= 0:
         return Input.pd.Series(0, index = MP().index)
     else:
-        y = Input.math.ceil(t/12)        
-        fac = (1 + Input.yield_curve["Interest Rates"][y] - Input.exp_maint["% of Reserve"]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Interest Rates"][t]
+        fac = ((1 + i) ** 12 - Input.exp_maint["% of Reserve"]) ** (1/12) - 1
         return (DUR_M(t) <= POL_TERM_M()) * (INT_SOLVM(t) - SOLVM_IF(t-1) * fac)
 
 
@@ -705,23 +737,60 @@ def PROFIT_AFT_TAX_SOLVM(t):
 
 
 def PV_FP(t):
-    """Present value of future profits"""
+    """Present value of future profits
+
+    Read from the backward sweep in :func:`PV_FP_SWEEP`"""
 
     if t < 0 or t > PROJ_LEN().max():
         return Input.pd.Series(0, index = MP().index)
     else:
+        return Input.pd.Series(PV_FP_SWEEP()[:, t], index = MP().index)
+
+
+def PV_FP_SWEEP():
+    """Present value of future profits at all t
+
+    Evaluated by backward induction in a single reverse sweep::
+
+        (profit_aft_tax(t+1) + pv_fp(t+1)) / (1 + disc_rate_m(t))"""
+
+    T = PROJ_LEN().max()
+    pv = Input.np.zeros((len(MP().index), T + 2))
+
+    for t in range(T, -1, -1):
         disc_fac = 1 + DISC_RATE_M(t)
-        return (DUR_M(t) < POL_TERM_M()) * (PROFIT_AFT_TAX(t+1) + PV_FP(t+1))/disc_fac
+        pv[:, t] = (DUR_M(t) < POL_TERM_M()).to_numpy() * (PROFIT_AFT_TAX(t+1).to_numpy() + pv[:, t+1])/disc_fac
+
+    return pv
 
 
 def VIF(t):
-    """Value in force"""
+    """Value in force
+
+    Read from the backward sweep in :func:`VIF_SWEEP`"""
 
     if t < 0 or t > PROJ_LEN().max():
         return Input.pd.Series(0, index = MP().index)
     else:
+        return Input.pd.Series(VIF_SWEEP()[:, t], index = MP().index)
+
+
+def VIF_SWEEP():
+    """Value in force at all t
+
+    Evaluated by backward induction in a single reverse sweep::
+
+        (solvm_if(t+1) + profit_aft_tax_solvm(t+1) + vif(t+1)) / (1 + disc_rate_m(t)) - solvm_if(t)"""
+
+    T = PROJ_LEN().max()
+    vif = Input.np.zeros((len(MP().index), T + 2))
+
+    for t in range(T, -1, -1):
         disc_fac = 1 + DISC_RATE_M(t)
-        return (SOLVM_IF(t+1) + PROFIT_AFT_TAX_SOLVM(t+1) + VIF(t+1))/disc_fac - SOLVM_IF(t)
+        vif[:, t] = ((SOLVM_IF(t+1).to_numpy() + PROFIT_AFT_TAX_SOLVM(t+1).to_numpy() + vif[:, t+1])/disc_fac
+                     - SOLVM_IF(t).to_numpy())
+
+    return vif
 
 
 def PREM_TERM_M():
@@ -738,9 +807,9 @@ def GSV(t):
 
     else:
         n = Input.GSV_Factor.index.max()
-        y = Input.np.minimum((DUR_M(t)/12).apply(Input.math.ceil), n)
-        GSVFac = ((PREM_TERM_Y() == 6) * list(Input.GSV_Factor["6-PPT"][y])
-              + (PREM_TERM_Y() == 12) * list(Input.GSV_Factor["12-PPT"][y]))
+        y = Input.np.minimum(Input.np.ceil(DUR_M(t)/12), n)
+        ppt = Input.np.minimum(PREM_TERM_Y(), len(Input.GSV_LOOKUP()) - 1)
+        GSVFac = Input.GSV_LOOKUP()[ppt.astype(int), y.to_numpy(dtype = int)]
 
     return y * GSVFac * PREM_PP()
 
@@ -760,17 +829,12 @@ def INCM_FAC(t):
     if t > PROJ_LEN().max() or t <= 0:
         return Input.pd.Series(0, index = MP().index)
     else:
-        ppt= list(Input.model_point_table.prem_paying_term.unique())
-        First5Years = 0; Last5Years = 0
-
-        ages = list(AGE_AT_ENTRY())
+        ppt = Input.np.minimum(PREM_TERM_Y(), len(Input.INCM_FAC_LOOKUP()) - 1)
+        rates = Input.INCM_FAC_LOOKUP()[ppt.astype(int), AGE_AT_ENTRY().astype(int)]
+        First5Years = rates[:, 0]; Last5Years = rates[:, 1]
 
         flag = (DUR_M(t) > PREM_TERM_M()) * (DUR_M(t) <= POL_TERM_M())
 
-        for i in ppt:
-            First5Years += (PREM_TERM_Y() == i) * list(Input.IncomeBenefit[i]["First 5 years"][ages])
-            Last5Years += (PREM_TERM_Y() == i) * list(Input.IncomeBenefit[i]["Last 5 years"][ages])
-
         rates = ((DUR_M(t) <= POL_TERM_M() - 12 * 5) * First5Years
                  + (DUR_M(t) > POL_TERM_M() - 12 * 5) * Last5Years)
 
@@ -780,23 +844,42 @@ def INCM_FAC(t):
 def PREM_TERM_Y():
     """Premium paying term in years"""
 
-    return MP()["prem_paying_term"]
+    return POLICY_BLOCK()["prem_paying_term"]
 
 
 def PV_INCM_BEN(t):
     """Present Value of Income Benefit
-    for the calculation of surrender value"""
+    for the calculation of surrender value
+
+    Read from the backward sweep in :func:`PV_INCM_BEN_SWEEP`"""
 
     if t <= 0 or t > PROJ_LEN().max():
         return Input.pd.Series(0, index = MP().index)
 
     else:
+        return Input.pd.Series(PV_INCM_BEN_SWEEP()[:, t], index = MP().index)
+
+
+def PV_INCM_BEN_SWEEP():
+    """Present Value of Income Benefit at all t
+
+    Evaluated by backward induction in a single reverse sweep
+    (in steps of 12 months) over a preallocated array::
+
+        (PV_INCM_BEN(t+12)/disc_fac + INCM_FAC(t)/disc_fac ** 0.5) * (1 - mort1)"""
+
+    T = PROJ_LEN().max()
+    pv = Input.np.zeros((len(MP().index), T + 13))
+
+    for t in range(T, 0, -1):
         disc_fac = 1 + Input.yield_curve["Interest Rates"][Input.np.ceil(t/12)]
-        mort1 = MORT_RATE_ANN(t-1)
+        mort1 = MORT_RATE_ANN(t-1).to_numpy()
+
+        pv_ib = pv[:, t+12]/disc_fac + INCM_FAC(t).to_numpy()/(disc_fac ** 0.5)
 
-        pv_ib = PV_INCM_BEN(t+12)/disc_fac + INCM_FAC(t)/(disc_fac ** 0.5)
+        pv[:, t] = (DUR_M(t) <= POL_TERM_M()).to_numpy() * pv_ib * (1 - mort1)
 
-    return (DUR_M(t) <= POL_TERM_M()) * pv_ib * (1 - mort1)
+    return pv
 
 
 def INCM_BEN(t):
@@ -854,7 +937,7 @@ def COHORT():
 
     """The cohort of the model points"""
 
-    return MP()["policy_term"]
+    return POLICY_BLOCK()["policy_term"]
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,540 @@
+"""Vectorised counterpart of the :mod:`Projection` Space.
+
+Every Cells in this Space carries the name of a Cells in
+:mod:`Projection` but takes no parameter and returns the whole
+(policy x month) grid as a NumPy array in one call::
+
+    >>> Projection_Vec.POLS_IF()[:, t]   # same values as Projection.POLS_IF(t)
+
+Columns run over ``t = 0, 1, ..., PROJ_LEN().max() + 1`` (see :func:`TIME`).
+Quantities that do not vary by policy (:func:`INFL_FAC`, :func:`DISC_RATE_M`)
+are returned as 1-D arrays over the same time axis.
+
+Recursive quantities are evaluated by explicit loops over the time axis
+(forward for the decrements, backward for the present values) so that
+no Python recursion is involved.
+"""
+
+from modelx.serialize.jsonvalues import *
+
+_formula = None
+
+_bases = []
+
+_allow_none = None
+
+_spaces = []
+
+# ---------------------------------------------------------------------------
+# Cells
+
+def TIME():
+    """Time axis of the grids: 0 to PROJ_LEN().max() + 1"""
+
+    return Input.np.arange(Proj.PROJ_LEN().max() + 2)
+
+
+def MP_ARR(col):
+    """Model point column as a NumPy array"""
+
+    return Proj.POLICY_BLOCK()[col]
+
+
+def ACTIVE():
+    """In-force flag: DUR_M(t) <= POL_TERM_M()"""
+
+    return DUR_M() <= (12 * MP_ARR("policy_term"))[:, None]
+
+
+def DUR_M():
+    """Duration in force in months"""
+
+    return MP_ARR("dur_elapsed")[:, None] + TIME()[None, :]
+
+
+def DUR_Y():
+    """Duration in force in years"""
+
+    return DUR_M()//12
+
+
+def AGE():
+    """The attained age"""
+
+    n = Input.mort_table.index.max()
+    return Input.np.minimum(MP_ARR("age_at_entry")[:, None] + DUR_Y(), n)
+
+
+def BASE_MORT_RATE():
+    """Base mortality rates"""
+
+    ages = AGE().astype(int)
+    return Input.MORT_LOOKUP()[ages, Proj.SEX_CODE()[:, None]]
+
+
+def MORT_RATE_ANN():
+    """Mortality rate"""
+
+    return Input.mort_scale["Rate"] * BASE_MORT_RATE()
+
+
+def MORT_RATE_MLY():
+    """Monthly mortality rate"""
+
+    return 1 - (1 - MORT_RATE_ANN())**(1/12)
+
+
+def LAPSE_RATE():
+    """Lapse rate"""
+
+    n = Input.lapse_table.index.max()
+    dur_y = Input.np.minimum(Input.np.ceil(DUR_M()/12), n).astype(int)
+
+    return Input.LAPSE_LOOKUP()["Projection"][dur_y]
+
+
+def INFL_FAC():
+    """The inflation factor"""
+
+    return (1 + Proj.INFL_RATE())**(TIME()/12)
+
+
+def INT_RATE_Y():
+    """Annual interest rate applicable at t (0 at t = 0)"""
+
+    t = TIME()[1:]
+    rates = Input.yield_curve["Interest Rates"].loc[Input.np.ceil(t/12).astype(int)].to_numpy()
+
+    return Input.np.concatenate([[0.0], rates])
+
+
+def INT_RATE_M():
+    """Monthly interest rate applicable at t (0 at t = 0)"""
+
+    i = Input.RATE_CURVE()["Interest Rates"][TIME()]
+    i[0] = 0
+    return i
+
+
+def DISC_RATE_M():
+    """Monthly discount rate:
+        best estimate basis
+
+    Defined up to t = PROJ_LEN().max(); the last column is NaN."""
+
+    t = TIME()[:-1]
+    return Input.np.concatenate([Input.RATE_CURVE()["Discount Rates"][t+1], [Input.np.nan]])
+
+
+def PREM_PAYBL_M():
+    """Monthly premium income"""
+
+    flag = DUR_M() <= (12 * MP_ARR("prem_paying_term"))[:, None]
+    prem = Input.np.zeros(flag.shape)
+    prem[:, 1:] = flag[:, 1:] * (MP_ARR("ann_prem")/12)[:, None] * POLS_IF()[:, :-1]
+
+    return prem
+
+
+def POLS_IF():
+    """Number of policies in-force
+
+    Rolled forward month by month from INIT_POLS_IF()."""
+
+    act = ACTIVE(); q = MORT_RATE_MLY(); w = 1 - (1 - LAPSE_RATE())**(1/12)
+    pols = Input.np.zeros(act.shape)
+    pols[:, 0] = MP_ARR("policy_count")
+
+    for t in range(1, act.shape[1]):
+        dth = act[:, t] * pols[:, t-1] * q[:, t]
+        lapse = act[:, t] * (pols[:, t-1] - dth) * w[:, t]
+        pols[:, t] = act[:, t] * (pols[:, t-1] - dth - lapse)
+
+    return pols
+
+
+def POLS_DTH():
+    """Number of deaths"""
+
+    dth = Input.np.zeros(DUR_M().shape)
+    dth[:, 1:] = ACTIVE()[:, 1:] * POLS_IF()[:, :-1] * MORT_RATE_MLY()[:, 1:]
+
+    return dth
+
+
+def POLS_LAPSE():
+    """Number of lapses"""
+
+    w = 1 - (1 - LAPSE_RATE())**(1/12)
+    lapse = Input.np.zeros(DUR_M().shape)
+    lapse[:, 1:] = ACTIVE()[:, 1:] * (POLS_IF()[:, :-1] - POLS_DTH()[:, 1:]) * w[:, 1:]
+
+    return lapse
+
+
+def POLS_MAT():
+    """Number of maturing policies"""
+
+    return (DUR_M() == (12 * MP_ARR("policy_term"))[:, None]) * POLS_IF()
+
+
+def DTH_BEN():
+    """Death claims"""
+
+    return ACTIVE() * MP_ARR("sum_assured")[:, None] * POLS_DTH()
+
+
+def COMM():
+    """Commissions"""
+
+    n = Input.comm_rates.index.max()
+    dur_y = Input.np.minimum(Input.np.ceil(DUR_M()[:, 1:]/12), n).astype(int)
+    rates = Input.COMM_LOOKUP()["Projection"][dur_y]
+
+    comm = Input.np.zeros(DUR_M().shape)
+    comm[:, 1:] = (DUR_M()[:, 1:] < (12 * MP_ARR("policy_term"))[:, None]) * PREM_PAYBL_M()[:, 1:] * rates
+
+    return comm
+
+
+def EXPS_ACQ():
+    """Acquisition expense per policy"""
+
+    i        = Input.exp_acq["Fixed"]
+    per_prem = Input.exp_acq["% of Premium"]
+    per_sa   = Input.exp_acq["% of SA"]
+
+    exp_acq = i + per_prem * MP_ARR("ann_prem") + per_sa * MP_ARR("sum_assured")
+
+    acq = Input.np.zeros(DUR_M().shape)
+    acq[:, 1:] = exp_acq[:, None] * (DUR_M()[:, :-1] == 0)
+
+    return acq
+
+
+def EXPS_MAINT():
+    """Maintenance expense"""
+
+    e           = Input.exp_maint["Fixed"]/12 * INFL_FAC()[:-1]
+    per_prem    = Input.exp_maint["% of Premium"]
+    per_res     = 1 - (1 - Input.exp_maint["% of Reserve"]) ** (1/12)
+    flag        = (DUR_M()[:, :-1] > 0) * ACTIVE()[:, 1:]
+
+    maint = Input.np.zeros(DUR_M().shape)
+    maint[:, 1:] = flag * (e[None, :]
+                           + (per_prem * MP_ARR("ann_prem")/12)[:, None]
+                           + per_res * RESERVE_PP()[:, 1:]) * POLS_IF()[:, :-1]
+
+    return maint
+
+
+def EXPS_CLAIM():
+    """Expenses incured at death/surrender/maturity"""
+
+    return ACTIVE() * Input.exp_claim["Claims"] * INFL_FAC()[None, :] * (POLS_DTH() + POLS_LAPSE() * (SURR_BEN() > 0) + POLS_MAT())
+
+
+def EXPS():
+    """Total expenses"""
+
+    exps = ACTIVE() * (EXPS_ACQ() + EXPS_MAINT() + EXPS_CLAIM())
+    exps[:, 0] = 0
+
+    return exps
+
+
+def INCM_FAC():
+    """Income factor: as a percentage of premium"""
+
+    dur_m = DUR_M(); pol_term_m = (12 * MP_ARR("policy_term"))[:, None]
+    prem_term = MP_ARR("prem_paying_term"); ages = MP_ARR("age_at_entry").astype(int)
+    ppt = Input.np.minimum(prem_term, len(Input.INCM_FAC_LOOKUP()) - 1).astype(int)
+    rates = Input.INCM_FAC_LOOKUP()[ppt, ages]
+    First5Years = rates[:, 0]; Last5Years = rates[:, 1]
+
+    flag = (dur_m > 12 * prem_term[:, None]) * (dur_m <= pol_term_m)
+    rates = ((dur_m <= pol_term_m - 12 * 5) * First5Years[:, None]
+             + (dur_m > pol_term_m - 12 * 5) * Last5Years[:, None])
+
+    fac = flag * rates
+    fac[:, 0] = 0; fac[:, -1] = 0
+
+    return fac
+
+
+def INCM_BEN():
+    """Expected income benefit"""
+
+    incm = Input.np.zeros(DUR_M().shape)
+    incm[:, 1:] = INCM_FAC()[:, 1:] * (MP_ARR("ann_prem")/12)[:, None] * POLS_IF()[:, :-1]
+
+    return incm
+
+
+def PV_DB():
+    """Present value of death benefit
+    for the calculation of surrender value
+
+    Evaluated backwards in steps of 12 months."""
+
+    act = ACTIVE(); mort = MORT_RATE_ANN(); i_y = INT_RATE_Y()
+    db = MP_ARR("sum_assured")/MP_ARR("ann_prem")
+    T = act.shape[1] - 2
+
+    pv = Input.np.zeros(act.shape)
+    for t in range(T, 0, -1):
+        disc_fac = 1 + i_y[t]
+        mort1 = mort[:, t-1]
+        nxt = pv[:, t+12] if t + 12 <= T else 0
+
+        pv[:, t] = act[:, t] * (db * mort1 / (disc_fac ** 0.5) + nxt * (1 - mort1)/disc_fac)
+
+    return pv
+
+
+def PV_INCM_BEN():
+    """Present Value of Income Benefit
+    for the calculation of surrender value
+
+    Evaluated backwards in steps of 12 months."""
+
+    act = ACTIVE(); mort = MORT_RATE_ANN(); i_y = INT_RATE_Y(); fac = INCM_FAC()
+    T = act.shape[1] - 2
+
+    pv = Input.np.zeros(act.shape)
+    for t in range(T, 0, -1):
+        disc_fac = 1 + i_y[t]
+        mort1 = mort[:, t-1]
+        nxt = pv[:, t+12] if t + 12 <= T else 0
+
+        pv[:, t] = act[:, t] * (nxt/disc_fac + fac[:, t]/(disc_fac ** 0.5)) * (1 - mort1)
+
+    return pv
+
+
+def SSV():
+    """Special surrender values"""
+
+    y = Input.np.ceil(DUR_M()/12)
+    ratio = Input.np.minimum(1, y/MP_ARR("prem_paying_term")[:, None])
+
+    return (PV_DB() + PV_INCM_BEN()) * ratio * MP_ARR("ann_prem")[:, None]
+
+
+def GSV():
+    "Guaranteed Surrender Value"
+
+    n = Input.GSV_Factor.index.max()
+    y = Input.np.minimum(Input.np.ceil(DUR_M()[:, 1:]/12), n).astype(int)
+    ppt = Input.np.minimum(MP_ARR("prem_paying_term"), len(Input.GSV_LOOKUP()) - 1).astype(int)
+    GSVFac = Input.GSV_LOOKUP()[ppt[:, None], y]
+
+    gsv = Input.np.zeros(DUR_M().shape)
+    gsv[:, 1:] = y * GSVFac * MP_ARR("ann_prem")[:, None]
+
+    return gsv
+
+
+def SURR_VAL():
+    """Surrender value
+        defined as: Max(SSV, GSV)"""
+
+    surr_term = MP_ARR("prem_paying_term")/6 * 12
+    return Input.np.maximum(SSV(), GSV()) * (DUR_M() >= surr_term[:, None])
+
+
+def SURR_BEN():
+    """Surrender benefit"""
+
+    return SURR_VAL() * POLS_LAPSE()
+
+
+def MAT_BEN():
+    """Maturity benefit"""
+
+    return Proj.TERMINAL_BEN()[:, None] * POLS_MAT()
+
+
+def INT_NET_CF():
+    """Interest earned on net cashflows"""
+
+    return ( INT_RATE_M()[None, :] * (PREM_PAYBL_M()
+                                      - EXPS_ACQ()
+                                      - EXPS_MAINT()
+                                      - COMM()
+                                      - INCM_BEN()) ) * ACTIVE()
+
+
+def NET_CF():
+    """Net cashflow"""
+
+    net_cf = (PREM_PAYBL_M()
+              + INT_NET_CF()
+              - DTH_BEN()
+              - EXPS()
+              - COMM()
+              - SURR_BEN()
+              - MAT_BEN()
+              - INCM_BEN())
+    net_cf[:, 0] = 0
+
+    return net_cf
+
+
+def RESERVE_PP():
+    """Reserve per policy:
+        max(Reserves_Vec.RESERVE_PP(), 0)"""
+
+    return (ResV.RESERVE_PP() > 0) * ResV.RESERVE_PP()
+
+
+def RESERVE_IF():
+    """Reserve in-force:
+        Max(reserve_pp(t), surr_val(t+1)) * pols_if(t)"""
+
+    surr_val = Input.np.zeros(DUR_M().shape)
+    surr_val[:, :-1] = SURR_VAL()[:, 1:]
+
+    return POLS_IF() * Input.np.maximum(RESERVE_PP(), surr_val)
+
+
+def INCR_RESERVE():
+    """Increase in reserves"""
+
+    incr = Input.np.zeros(DUR_M().shape)
+    incr[:, 1:] = Input.np.diff(RESERVE_IF(), axis = 1)
+
+    return incr
+
+
+def INT_RESERVES():
+    """Interest earned on reserves"""
+
+    interest = Input.np.zeros(DUR_M().shape)
+    interest[:, 1:] = ACTIVE()[:, 1:] * RESERVE_IF()[:, :-1] * INT_RATE_M()[None, 1:]
+
+    return interest
+
+
+def PROFIT_BEF_TAX():
+    """Profit before tax"""
+
+    flag = DUR_M() <= (12 * MP_ARR("policy_term") + 1)[:, None]
+    pbt = flag * (NET_CF() - INCR_RESERVE() + INT_RESERVES())
+    pbt[:, 0] = 0
+
+    return pbt
+
+
+def TAX_PROFIT():
+    """Tax payable on the profit"""
+
+    return Input.np.maximum(PROFIT_BEF_TAX(), 0) * Input.Tax_Rates["Shareholder"]
+
+
+def PROFIT_AFT_TAX():
+    """Profit after tax"""
+
+    return PROFIT_BEF_TAX() - TAX_PROFIT()
+
+
+def SOLVM_IF():
+    """Solvency margin in-force"""
+
+    dur_m = DUR_M(); res_pp = ResV.RESERVE_PP()
+
+    ResPP = res_pp * Input.SM_Rates["% of Reserves"]
+    SAR = (dur_m <= (12 * MP_ARR("prem_paying_term"))[:, None]) * (MP_ARR("sum_assured")[:, None] - res_pp) * Input.SM_Rates["% of SAR"]
+    SM = (ResPP + SAR) * Input.SM_Rates["Minimum Solvency Ratio"]
+
+    solvm = (dur_m > 0) * ACTIVE() * SM * POLS_IF()
+    solvm[:, -1] = 0
+
+    return solvm
+
+
+def INCR_SOLVM():
+    """Increase in solvency margin"""
+
+    incr = Input.np.zeros(DUR_M().shape)
+    incr[:, 1:] = ACTIVE()[:, 1:] * Input.np.diff(SOLVM_IF(), axis = 1)
+
+    return incr
+
+
+def INT_SOLVM():
+    """Interest earned on solvency margin"""
+
+    interest = Input.np.zeros(DUR_M().shape)
+    interest[:, 1:] = ACTIVE()[:, 1:] * SOLVM_IF()[:, :-1] * INT_RATE_M()[None, 1:]
+
+    return interest
+
+
+def INV_EXP_SOLVM():
+    """Investment expense on solvency margin"""
+
+    fac = (1 + INT_RATE_Y() - Input.exp_maint["% of Reserve"]) ** (1/12) - 1
+
+    inv_exp = Input.np.zeros(DUR_M().shape)
+    inv_exp[:, 1:] = ACTIVE()[:, 1:] * (INT_SOLVM()[:, 1:] - SOLVM_IF()[:, :-1] * fac[None, 1:])
+
+    return inv_exp
+
+
+def TAX_INT_SOLVM():
+    """Tax payable on interest earned on
+    solvency margin"""
+
+    return ACTIVE() * Input.np.maximum(INT_SOLVM() - INV_EXP_SOLVM(), 0) * Input.Tax_Rates["Shareholder"]
+
+
+def PROFIT_AFT_TAX_SOLVM():
+    """Profit after tax AND solvency margin"""
+
+    return ACTIVE() * (PROFIT_AFT_TAX()
+                       - INCR_SOLVM()
+                       + INT_SOLVM()
+                       - INV_EXP_SOLVM()
+                       - TAX_INT_SOLVM())
+
+
+def PV_FP():
+    """Present value of future profits
+
+    Evaluated backwards from PROJ_LEN().max()."""
+
+    flag = DUR_M() < (12 * MP_ARR("policy_term"))[:, None]
+    pat = PROFIT_AFT_TAX(); disc = DISC_RATE_M()
+    T = flag.shape[1] - 2
+
+    pv = Input.np.zeros(flag.shape)
+    for t in range(T, -1, -1):
+        pv[:, t] = flag[:, t] * (pat[:, t+1] + pv[:, t+1])/(1 + disc[t])
+
+    return pv
+
+
+def VIF():
+    """Value in force
+
+    Evaluated backwards from PROJ_LEN().max()."""
+
+    solvm = SOLVM_IF(); pats = PROFIT_AFT_TAX_SOLVM(); disc = DISC_RATE_M()
+    T = solvm.shape[1] - 2
+
+    vif = Input.np.zeros(solvm.shape)
+    for t in range(T, -1, -1):
+        vif[:, t] = (solvm[:, t+1] + pats[:, t+1] + vif[:, t+1])/(1 + disc[t]) - solvm[:, t]
+
+    return vif
+
+
+# ---------------------------------------------------------------------------
+# References
+
+Input = ("Interface", ("..", "Input"), "auto")
+
+Proj = ("Interface", ("..", "Projection"), "auto")
+
+ResV = ("Interface", ("..", "Reserves_Vec"), "auto")
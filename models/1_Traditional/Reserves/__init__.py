@@ -26,10 +26,10 @@ def COMM(t):
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
         n = Input.comm_rates.index.max()
-        dur_m = list(Input.np.minimum(Input.np.ceil(Proj.DUR_M(t)/12), n))
-        comm_rates = Input.comm_rates["Reserves"][dur_m]
+        dur_y = Input.np.minimum(Input.np.ceil(Proj.DUR_M(t)/12), n).to_numpy(dtype = int)
+        comm_rates = Input.COMM_LOOKUP()["Reserves"][dur_y]
 
-        return (Proj.DUR_M(t) < Proj.POL_TERM_M()) * PREM_PAYBL_M(t) * list(comm_rates)
+        return (Proj.DUR_M(t) < Proj.POL_TERM_M()) * PREM_PAYBL_M(t) * comm_rates
 
 
 def EXPS_ACQ(t):
@@ -0,0 +1,276 @@
+"""Vectorised counterpart of the :mod:`Reserves` Space.
+
+Cells mirror those in :mod:`Reserves` (valuation basis) and return whole
+(policy x month) grids over the time axis of :func:`Projection_Vec.TIME`.
+"""
+
+from modelx.serialize.jsonvalues import *
+
+_formula = None
+
+_bases = []
+
+_allow_none = None
+
+_spaces = []
+
+# ---------------------------------------------------------------------------
+# Cells
+
+def INFL_FAC():
+    """The inflation factor:
+        valuation basis"""
+
+    return (1 + Input.res_infl_rate["Inflation"])**(ProjV.TIME()/12)
+
+
+def DISC_RATE_M():
+    """Monthly discount rate:
+        valuation basis"""
+
+    rate = (1 + Input.res_IR["Reserve IR"])**(1/12) - 1
+    return Input.np.full(ProjV.TIME().shape, rate)
+
+
+def MORT_RATE_ANN():
+    """Mortality rate:
+        valuation basis"""
+
+    return Input.res_mort_scale["Rate"] * ProjV.BASE_MORT_RATE()
+
+
+def MORT_RATE_MLY():
+    """Monthly mortality rate:
+        valuation basis"""
+
+    return 1 - (1 - MORT_RATE_ANN())**(1/12)
+
+
+def LAPSE_RATE():
+    """Lapse rate:
+        valuation basis"""
+
+    return ProjV.LAPSE_RATE()*(1 + Input.mad["Lapse"])
+
+
+def POLS_IF():
+    """Number of policies in-force:
+        valuation basis
+
+    Rolled forward month by month from Projection.INIT_POLS_IF()."""
+
+    act = ProjV.ACTIVE(); q = MORT_RATE_MLY(); w = 1 - (1 - LAPSE_RATE())**(1/12)
+    pols = Input.np.zeros(act.shape)
+    pols[:, 0] = ProjV.MP_ARR("policy_count")
+
+    for t in range(1, act.shape[1]):
+        dth = act[:, t] * pols[:, t-1] * q[:, t]
+        lapse = act[:, t] * (pols[:, t-1] - dth) * w[:, t]
+        pols[:, t] = act[:, t] * (pols[:, t-1] - dth - lapse)
+
+    return pols
+
+
+def POLS_DTH():
+    """Number of deaths:
+        valuation basis"""
+
+    dth = Input.np.zeros(ProjV.DUR_M().shape)
+    dth[:, 1:] = ProjV.ACTIVE()[:, 1:] * POLS_IF()[:, :-1] * MORT_RATE_MLY()[:, 1:]
+
+    return dth
+
+
+def POLS_LAPSE():
+    """Number of lapses:
+        valuation basis"""
+
+    w = 1 - (1 - LAPSE_RATE())**(1/12)
+    lapse = Input.np.zeros(ProjV.DUR_M().shape)
+    lapse[:, 1:] = ProjV.ACTIVE()[:, 1:] * (POLS_IF()[:, :-1] - POLS_DTH()[:, 1:]) * w[:, 1:]
+
+    return lapse
+
+
+def POLS_MAT():
+    """Number of maturing policies:
+        valuation basis"""
+
+    return (ProjV.DUR_M() == (12 * ProjV.MP_ARR("policy_term"))[:, None]) * POLS_IF()
+
+
+def PREM_PAYBL_M():
+    """Premium income:
+        valuation basis"""
+
+    flag = ProjV.DUR_M() <= (12 * ProjV.MP_ARR("prem_paying_term"))[:, None]
+    prem = Input.np.zeros(flag.shape)
+    prem[:, 1:] = flag[:, 1:] * (ProjV.MP_ARR("ann_prem")/12)[:, None] * POLS_IF()[:, :-1]
+
+    return prem
+
+
+def DTH_BEN():
+    """Death claims:
+        valuation basis"""
+
+    return ProjV.ACTIVE() * ProjV.MP_ARR("sum_assured")[:, None] * POLS_DTH()
+
+
+def COMM():
+    """Commissions:
+        valuation basis"""
+
+    dur_m = ProjV.DUR_M()[:, 1:]
+    n = Input.comm_rates.index.max()
+    dur_y = Input.np.minimum(Input.np.ceil(dur_m/12), n).astype(int)
+    rates = Input.COMM_LOOKUP()["Reserves"][dur_y]
+
+    comm = Input.np.zeros(ProjV.DUR_M().shape)
+    comm[:, 1:] = (dur_m < (12 * ProjV.MP_ARR("policy_term"))[:, None]) * PREM_PAYBL_M()[:, 1:] * rates
+
+    return comm
+
+
+def EXPS_ACQ():
+    """Acquisition expense per policy:
+        valuation basis"""
+
+    i        = Input.exp_acq["Fixed"]
+    per_prem = Input.exp_acq["% of Premium"]
+    per_sa   = Input.exp_acq["% of SA"]
+
+    exp_acq = i + per_prem * ProjV.MP_ARR("ann_prem") + per_sa * ProjV.MP_ARR("sum_assured")
+
+    acq = Input.np.zeros(ProjV.DUR_M().shape)
+    acq[:, 1:] = (exp_acq * (1 + Input.mad["Expense"]))[:, None] * (ProjV.DUR_M()[:, :-1] == 0)
+
+    return acq
+
+
+def EXPS_MAINT():
+    """Maintenance expense:
+        valuation basis"""
+
+    e           = Input.exp_maint["Fixed"]/12 * INFL_FAC()[:-1]
+    per_prem    = Input.exp_maint["% of Premium"]
+    flag        = (ProjV.DUR_M()[:, :-1] > 0) * ProjV.ACTIVE()[:, 1:]
+
+    maint = Input.np.zeros(ProjV.DUR_M().shape)
+    maint[:, 1:] = (flag * (e[None, :] + (per_prem * ProjV.MP_ARR("ann_prem")/12)[:, None])
+                    * (1 + Input.mad["Expense"]) * POLS_IF()[:, :-1])
+
+    return maint
+
+
+def EXPS_CLAIM():
+    """Expenses incured at death/surrender/maturity:
+        valuation basis"""
+
+    return ( ProjV.ACTIVE() * Input.exp_claim["Claims"] * INFL_FAC()[None, :] * (1 + Input.mad["Expense"])
+            * (POLS_DTH() + POLS_LAPSE() * (SURR_BEN() > 0) + POLS_MAT()) )
+
+
+def EXPS():
+    """Total expenses:
+        valuation basis"""
+
+    acq = Input.np.zeros(ProjV.DUR_M().shape)
+    acq[:, 1:] = EXPS_ACQ()[:, 1:] * (ProjV.DUR_M()[:, :-1] == 0)
+
+    exps = ProjV.ACTIVE() * (acq + EXPS_MAINT() + EXPS_CLAIM())
+    exps[:, 0] = 0
+
+    return exps
+
+
+def SURR_BEN():
+    """Surrender benefit:
+        valuation basis"""
+
+    return ProjV.SURR_VAL() * POLS_LAPSE()
+
+
+def MAT_BEN():
+    """Maturity benefit:
+        valuation basis"""
+
+    return Proj.TERMINAL_BEN()[:, None] * POLS_MAT()
+
+
+def INCM_BEN():
+    """Expected income benefit:
+        valuation basis"""
+
+    incm = Input.np.zeros(ProjV.DUR_M().shape)
+    incm[:, 1:] = ProjV.INCM_FAC()[:, 1:] * (ProjV.MP_ARR("ann_prem")/12)[:, None] * POLS_IF()[:, :-1]
+
+    return incm
+
+
+def INT_NET_CF():
+    """Interest earned on net cashflows:
+        valuation basis"""
+
+    i = ((1 + Input.res_IR["Reserve IR"]) ** (1/12) - 1)
+    interest = ProjV.ACTIVE() * i * (PREM_PAYBL_M()
+                                     - EXPS_ACQ()
+                                     - EXPS_MAINT()
+                                     - COMM()
+                                     - INCM_BEN())
+    interest[:, 0] = 0
+
+    return interest
+
+
+def NET_CF():
+    """Net cashflow:
+        valuation basis"""
+
+    net_cf = (PREM_PAYBL_M()
+              + INT_NET_CF()
+              - DTH_BEN()
+              - EXPS()
+              - COMM()
+              - SURR_BEN()
+              - MAT_BEN()
+              - INCM_BEN()) * ProjV.ACTIVE()
+    net_cf[:, 0] = 0
+
+    return net_cf
+
+
+def RESERVE():
+    """Reserve calculation
+
+    Evaluated backwards from PROJ_LEN().max() as::
+
+        (reserve(t+1) - net_cf(t+1)) / (1 + disc_rate_mth())"""
+
+    flag = ProjV.DUR_M() < (12 * ProjV.MP_ARR("policy_term"))[:, None]
+    net_cf = NET_CF(); disc = DISC_RATE_M()
+    T = flag.shape[1] - 2
+
+    res = Input.np.zeros(flag.shape)
+    for t in range(T - 1, -1, -1):
+        res[:, t] = flag[:, t] * (res[:, t+1] - net_cf[:, t+1]) / (1 + disc[t])
+
+    return res
+
+
+def RESERVE_PP():
+    """Reserve value per policy:
+        reserve / pols_if"""
+
+    res = RESERVE(); pols = POLS_IF()
+    return Input.np.divide(res, pols, out = Input.np.zeros_like(res), where = pols != 0)
+
+
+# ---------------------------------------------------------------------------
+# References
+
+Input = ("Interface", ("..", "Input"), "auto")
+
+Proj = ("Interface", ("..", "Projection"), "auto")
+
+ProjV = ("Interface", ("..", "Projection_Vec"), "auto")
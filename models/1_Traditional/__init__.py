@@ -8,6 +8,8 @@ _spaces = [
     "Projection",
     "Input",
     "Output",
-    "Reserves"
+    "Reserves",
+    "Projection_Vec",
+    "Reserves_Vec"
 ]
 
@@ -219,8 +219,7 @@ def INT_AST_SHARE(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        y = Input.math.ceil(t/12)
-        i = (1 + Input.yield_curve["Interest Rates"][y]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Interest Rates"][t]
         return (AST_SHARE_START(t)
                 + PREM_PAYBL_M(t)
                 - MAT_BEN(t-1)
@@ -14,7 +14,7 @@ _spaces = []
 def DECLRD_BONUS():
     """Declared Reversionary Bonus as on the valuation date"""
 
-    return Proj.MP()["declrd_bonus"]
+    return Proj.POLICY_BLOCK()["declrd_bonus"]
 
 
 def BASE_MORT_RATE(t):
@@ -29,7 +29,7 @@ def BASE_MORT_RATE(t):
 
         for i in list(mort_table.columns):
             mort_rates += (Proj.SEX() == i) * list(mort_table[i][ages])
-        return pd.Series(mort_rates, name = inspect.stack()[0][3])
+        return pd.Series(mort_rates, index = Proj.MP().index, name = "BASE_MORT_RATE")
 
 
 def GSV_FAC(t):
@@ -69,6 +69,20 @@ def COHORT():
     return Proj.MP()["pcode"]
 
 
+def RATE_CURVE():
+
+    """Yield curve by projection month, one array of monthly rates per
+    column of ``yield_curve`` (Interest Rates, Discount Rates)
+
+    Entry ``t`` holds (1 + rate) ** (1/12) - 1 for the rate of year ceil(t/12)."""
+
+    months = np.arange(12 * yield_curve.index.max() + 1)
+    rates = yield_curve.reindex(np.ceil(months/12))
+
+    return {curve: (1 + rates[curve].to_numpy(dtype = float))**(1/12) - 1
+            for curve in yield_curve.columns}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -211,7 +211,7 @@ def AGE_AT_ENTRY():
 
     """The age at entry of the selected model point"""
 
-    return MP()["age_at_entry"]
+    return POLICY_BLOCK()["age_at_entry"]
 
 
 def COB_PH(t):
@@ -246,7 +246,7 @@ def DISC_RATE_M(t):
     """Monthly discount rate:
         Best Estimate basis"""
 
-    return (1 + Input.yield_curve["Discount Rates"][Input.math.ceil((t+1)/12)])**(1/12) - 1
+    return Input.RATE_CURVE()["Discount Rates"][t+1]
 
 
 def DTH_BEN(t):
@@ -441,8 +441,7 @@ def INT_NET_CF(t):
     if t <= 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index = MP().index)
     else:
-        y = Input.math.ceil(t/12)
-        i = (1 + Input.yield_curve["Interest Rates"][y]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Interest Rates"][t]
 
         return (PREM_PAYBL_M(t)
                 - EXPS_ACQ(t)
@@ -457,7 +456,7 @@ def INT_RESERVES(t):
     if t <= 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index = MP().index)
     else:
-        i = (1 + Input.yield_curve["Interest Rates"][Input.math.ceil(t/12)]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Interest Rates"][t]
 
         return IND_ACTIVE(t) * RESERVE_IF(t-1) * i
 
@@ -472,7 +471,7 @@ def INT_SOLVM(t):
     if t <= 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index = MP().index)
     else:
-        i = (1 + Input.yield_curve["Interest Rates"][Input.math.ceil(t/12)]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Interest Rates"][t]
 
         return (DUR_M(t) <= POL_TERM_M() + 1) * SOLV_MARG_SH_FUNDED(t-1) * i
 
@@ -484,8 +483,8 @@ def INV_EXP_SOLVM(t):
     if t <= 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index = MP().index)
     else:
-        y = Input.math.ceil(t/12)        
-        fac = (1 + Input.yield_curve["Interest Rates"][y] - Input.inv_exp_pc["Investment Expenses %"]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Interest Rates"][t]
+        fac = ((1 + i) ** 12 - Input.inv_exp_pc["Investment Expenses %"]) ** (1/12) - 1
         return (DUR_M(t) <= POL_TERM_M() + 1) * (INT_SOLVM(t) - SOLV_MARG_SH_FUNDED(t-1) * fac)
 
 
@@ -554,6 +553,18 @@ def MP():
         raise ValueError
 
 
+def POLICY_BLOCK():
+
+    """The columns of the selected model point(s) as contiguous NumPy arrays
+
+    Evaluated once per selection of :func:`MP`. The static per-policy cells
+    read their columns from it, so that they enter the projection as arrays
+    and not as Series to be aligned on every operation."""
+
+    Table = MP()
+    return {col: Input.np.ascontiguousarray(Table[col].to_numpy()) for col in Table.columns}
+
+
 def NET_CF(t):
 
     """Net cashflow"""
@@ -643,7 +654,7 @@ def POL_TERM_Y():
     The element labeled ``policy_term`` of the Series returned by
     :func:`model_point`."""
 
-    return MP()["policy_term"]
+    return POLICY_BLOCK()["policy_term"]
 
 
 def PREM_PAYBL_M(t):
@@ -665,7 +676,7 @@ def PREM_PP():
 
     """Annual premium per policy"""
 
-    return MP()["ann_prem"]
+    return POLICY_BLOCK()["ann_prem"]
 
 
 def PREM_TERM_M():
@@ -679,7 +690,7 @@ def PREM_TERM_Y():
 
     """Premium paying term in years"""
 
-    return MP()["prem_paying_term"]
+    return POLICY_BLOCK()["prem_paying_term"]
 
 
 def PROFIT_AFT_TAX(t):
@@ -748,42 +759,99 @@ def PROJ_LEN():
 def PV_DB(t):
 
     """Present value of death benefit
-    for the calculation of surrender value"""
+    for the calculation of surrender value
+
+    Read from the backward sweep in :func:`PV_DB_SWEEP`"""
 
     if t <= 0 or t > PROJ_LEN().max():
         return Input.pd.Series(0, index = MP().index)
     else:
-        disc_fac = (1 + Input.yield_curve["Interest Rates"][Input.np.ceil(t/12)]) ** (1/12)
-        mort1 = MORT_RATE_MLY(t)
-        val = mort1 / disc_fac + PV_DB(t+1) * (1 - mort1)/disc_fac
+        return Input.pd.Series(PV_DB_SWEEP()[:, t], index = MP().index)
+
+
+def PV_DB_SWEEP():
+
+    """Present value of death benefit at all t
+
+    Evaluated by backward induction in a single reverse sweep::
+
+        mort1 / disc_fac + PV_DB(t+1) * (1 - mort1)/disc_fac"""
 
-        return IND_ACTIVE(t) * val
+    T = PROJ_LEN().max()
+    pv = Input.np.zeros((len(MP().index), T + 2))
+
+    for t in range(T, 0, -1):
+        disc_fac = 1 + Input.RATE_CURVE()["Interest Rates"][t]
+        mort1 = MORT_RATE_MLY(t).to_numpy()
+        val = mort1 / disc_fac + pv[:, t+1] * (1 - mort1)/disc_fac
+
+        pv[:, t] = IND_ACTIVE(t).to_numpy() * val
+
+    return pv
 
 
 def PV_FP(t):
 
-    """Present value of future profits"""
+    """Present value of future profits
+
+    Read from the backward sweep in :func:`PV_FP_SWEEP`"""
 
     if t < 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index = MP().index)
     else:
+        return Input.pd.Series(PV_FP_SWEEP()[:, t], index = MP().index)
+
+
+def PV_FP_SWEEP():
+
+    """Present value of future profits at all t
+
+    Evaluated by backward induction in a single reverse sweep::
+
+        (sh_trns_aft_tax(t+1) + pv_fp(t+1)) / (1 + disc_rate_m(t))"""
+
+    T = MAX_PROJ_LEN()
+    pv = Input.np.zeros((len(MP().index), T + 2))
+
+    for t in range(T, -1, -1):
         disc_fac = 1 + DISC_RATE_M(t)
-        return IND_ACTIVE(t) * (SH_TRNS_AFT_TAX(t+1) + PV_FP(t+1))/disc_fac
+        pv[:, t] = IND_ACTIVE(t).to_numpy() * (SH_TRNS_AFT_TAX(t+1).to_numpy() + pv[:, t+1])/disc_fac
+
+    return pv
 
 
 def PV_MAT_BEN(t):
 
     """Present Value of Maturity Benefit
-    for the calculation of surrender value"""
+    for the calculation of surrender value
+
+    Read from the backward sweep in :func:`PV_MAT_BEN_SWEEP`"""
 
     if t <= 0 or t > PROJ_LEN().max():
         return Input.pd.Series(0, index = MP().index)
     else:
-        disc_fac = (1 + Input.yield_curve["Interest Rates"][Input.np.ceil(t/12)]) ** (1/12)
-        mort1 = MORT_RATE_MLY(t)
-        pv_mb = PV_MAT_BEN(t+1)/disc_fac
+        return Input.pd.Series(PV_MAT_BEN_SWEEP()[:, t], index = MP().index)
+
+
+def PV_MAT_BEN_SWEEP():
+
+    """Present Value of Maturity Benefit at all t
+
+    Evaluated by backward induction in a single reverse sweep::
+
+        PV_MAT_BEN(t+1)/disc_fac * (1 - mort1) + (DUR_M(t) == POL_TERM_M() + 1)"""
+
+    T = PROJ_LEN().max()
+    pv = Input.np.zeros((len(MP().index), T + 2))
+
+    for t in range(T, 0, -1):
+        disc_fac = 1 + Input.RATE_CURVE()["Interest Rates"][t]
+        mort1 = MORT_RATE_MLY(t).to_numpy()
+        pv_mb = pv[:, t+1]/disc_fac
 
-        return IND_ACTIVE(t) * pv_mb * (1 - mort1)  + (DUR_M(t) == POL_TERM_M() + 1)
+        pv[:, t] = IND_ACTIVE(t).to_numpy() * pv_mb * (1 - mort1)  + (DUR_M(t) == POL_TERM_M() + 1).to_numpy()
+
+    return pv
 
 
 def RESERVE_IF(t):
@@ -820,7 +888,7 @@ def SEX():
 
     """The sex of the selected model point(s)"""
 
-    return MP()["sex"]
+    return POLICY_BLOCK()["sex"]
 
 
 def SH_TAX_ON_PROFIT(t):
@@ -886,7 +954,7 @@ def SUM_ASSURED():
 
     """The sum assured of the selected model point(s)"""
 
-    return MP()["sum_assured"]
+    return POLICY_BLOCK()["sum_assured"]
 
 
 def SURR_BEN(t):
@@ -933,13 +1001,34 @@ def TRNS_SH(t):
 
 def VIF(t):
 
-    """Value in force"""
+    """Value in force
+
+    Read from the backward sweep in :func:`VIF_SWEEP`"""
 
     if t < 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index = MP().index)
     else:
+        return Input.pd.Series(VIF_SWEEP()[:, t], index = MP().index)
+
+
+def VIF_SWEEP():
+
+    """Value in force at all t
+
+    Evaluated by backward induction in a single reverse sweep::
+
+        (solv_marg_sh_funded(t+1) + profit_aft_tax_solvm(t+1) + vif(t+1)) / (1 + disc_rate_m(t))
+            - solv_marg_sh_funded(t)"""
+
+    T = MAX_PROJ_LEN()
+    vif = Input.np.zeros((len(MP().index), T + 2))
+
+    for t in range(T, -1, -1):
         disc_fac = 1 + DISC_RATE_M(t)
-        return (SOLV_MARG_SH_FUNDED(t+1) + PROFIT_AFT_TAX_SOLVM(t+1) + VIF(t+1))/disc_fac - SOLV_MARG_SH_FUNDED(t)
+        vif[:, t] = ((SOLV_MARG_SH_FUNDED(t+1).to_numpy() + PROFIT_AFT_TAX_SOLVM(t+1).to_numpy() + vif[:, t+1])/disc_fac
+                     - SOLV_MARG_SH_FUNDED(t).to_numpy())
+
+    return vif
 
 
 # ---------------------------------------------------------------------------
@@ -32,7 +32,7 @@ def BASE_MORT_RATE(t):
     for i in sex:
         mort_rates += (Proj.SEX() == i) * list(Mortality[i][ages])
 
-    return pd.Series(mort_rates, name = inspect.stack()[0][3])
+    return pd.Series(mort_rates, index = Proj.MP().index, name = "BASE_MORT_RATE")
 
 
 def CHG_MORT_RATE(t):
@@ -45,7 +45,7 @@ def CHG_MORT_RATE(t):
     for i in sex:
         chg_mort += (Proj.SEX() == i) * list(ChargeMort[i][ages])
 
-    return pd.Series(chg_mort, name = inspect.stack()[0][3])
+    return pd.Series(chg_mort, index = Proj.MP().index, name = "CHG_MORT_RATE")
 
 
 def SURR_CHG_RATE(t):
@@ -56,8 +56,8 @@ def SURR_CHG_RATE(t):
     else:
         n = SurrCharge.index.max()
         dur = list(np.minimum(Proj.DUR_Y(t), n))
-        surr_charge = ( np.array(SurrCharge["Premium<=25000"][dur])*(Proj.MP()["ann_prem"]<=25000) + 
-                    np.array(SurrCharge["Premium>25000"][dur])*(Proj.MP()["ann_prem"]>25000) )
+        surr_charge = ( np.array(SurrCharge["Premium<=25000"][dur])*(Proj.POLICY_BLOCK()["ann_prem"]<=25000) + 
+                    np.array(SurrCharge["Premium>25000"][dur])*(Proj.POLICY_BLOCK()["ann_prem"]>25000) )
         return pd.Series(surr_charge, index = Proj.MP().index, name = "0")
 
 
@@ -69,10 +69,9 @@ def SURR_CHG_CAP(t):
     else:
         n = SurrChargeCap.index.max()
         dur = list(np.minimum(Proj.DUR_Y(t), n))
-        surr_cap = ( np.array(SurrChargeCap["Premium<=25000"][dur]) * (Proj.MP()["ann_prem"]<=25000)+  
-                 np.array(SurrChargeCap["Premium>25000"][dur]) * (Proj.MP()["ann_prem"]>25000) )
-        surr_cap.name = "0"
-        return surr_cap
+        surr_cap = ( np.array(SurrChargeCap["Premium<=25000"][dur]) * (Proj.POLICY_BLOCK()["ann_prem"]<=25000)+  
+                 np.array(SurrChargeCap["Premium>25000"][dur]) * (Proj.POLICY_BLOCK()["ann_prem"]>25000) )
+        return pd.Series(surr_cap, index = Proj.MP().index, name = "0")
 
 
 def LOYALTY_RATE(t):
@@ -102,6 +101,19 @@ def COHORT():
     return Proj.MP()["PCODE"]
 
 
+def RATE_CURVE():
+    """Yield curve by projection month, one array of monthly rates per
+    column of ``YieldCurve`` (Unit, Non-Unit Interest Rates, Discount Rates)
+
+    Entry ``t`` holds (1 + rate) ** (1/12) - 1 for the rate of year ceil(t/12)."""
+
+    months = np.arange(12 * YieldCurve.index.max() + 1)
+    rates = YieldCurve.reindex(np.ceil(months/12))
+
+    return {curve: (1 + rates[curve].to_numpy(dtype = float))**(1/12) - 1
+            for curve in YieldCurve.columns}
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -239,7 +239,7 @@ def AGE_AT_ENTRY():
     :func:`model_point`.
     """
 
-    return MP()["age_at_entry"]
+    return POLICY_BLOCK()["age_at_entry"]
 
 
 def COMM(t):
@@ -473,7 +473,7 @@ def IND_DB():
         1: Sum (Sum Assured, Unit Fund)
     """
 
-    return MP()["death_benefit_option"]
+    return POLICY_BLOCK()["death_benefit_option"]
 
 
 def INFL_FAC(t):
@@ -519,8 +519,7 @@ def INT_NET_CF(t):
     if t <= 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index = MP().index)
     else:
-        y = Input.np.ceil(t/12)
-        i = (1 + Input.YieldCurve["Non-Unit Interest Rates"][y]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Non-Unit Interest Rates"][t]
         return i * (PREM_PAYBL_M(t)
                     - UF.PREM_TO_AV_PP(t) * POLS_IF(t-1)
                     - EXP_INIT(t)
@@ -537,9 +536,8 @@ def INT_RES(t):
     if t <= 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index = MP().index)
     else:
-        y = Input.np.ceil(t/12)
-        i_unit = (1 + Input.YieldCurve["Unit Interest Rates"][y]) ** (1/12) - 1
-        i_n_unit = (1 + Input.YieldCurve["Non-Unit Interest Rates"][y]) ** (1/12) - 1
+        i_unit = Input.RATE_CURVE()["Unit Interest Rates"][t]
+        i_n_unit = Input.RATE_CURVE()["Non-Unit Interest Rates"][t]
 
         u_int =  i_unit * (UF.AV_PP_AT(t, "BEF_INV") * POLS_IF(t-1)
                            + UF_DPF.AV_PP_AT(t,"BEF_INV") * Proj_DPF.POLS_IF(t-1))
@@ -554,8 +552,7 @@ def INT_SOLVM(t):
     if t <= 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index = MP().index)
     else:
-        y = Input.np.ceil(t/12)
-        i = (1 + Input.YieldCurve["Non-Unit Interest Rates"][y]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Non-Unit Interest Rates"][t]
         return SOLVM_IF(t-1) * i
 
 
@@ -566,9 +563,8 @@ def INV_EXP_SOLVM(t):
     if t <= 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index = MP().index)
     else:
-        y = Input.np.ceil((t)/12)
-        i = (1 + Input.YieldCurve["Non-Unit Interest Rates"][y]) ** (1/12) - 1
-        i_exp = (1 + Input.YieldCurve["Non-Unit Interest Rates"][y] - Input.exp_maint["% of Reserve"]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Non-Unit Interest Rates"][t]
+        i_exp = ((1 + i) ** 12 - Input.exp_maint["% of Reserve"]) ** (1/12) - 1
         return SOLVM_IF(t-1) * (i - i_exp)
 
 
@@ -611,7 +607,7 @@ def MORT_RATE_ANN(t):
     """Mortality rate to be applied at time t"""
 
     fac = Input.mort_scale["Male"] * (SEX() == 'M') + Input.mort_scale["Female"] * (SEX() == 'F')
-    return fac * Input.BASE_MORT_RATE(t) * MP()["mort_loading"]
+    return fac * Input.BASE_MORT_RATE(t) * POLICY_BLOCK()["mort_loading"]
 
 
 def MORT_RATE_MTH(t):
@@ -636,6 +632,18 @@ def MP():
         raise ValueError(f"Incompatible data type for Input.point_id: {type(Input.point_id)}")
 
 
+def POLICY_BLOCK():
+
+    """The columns of the selected model point(s) as contiguous NumPy arrays
+
+    Evaluated once per selection of :func:`MP`. The static per-policy cells
+    read their columns from it, so that they enter the projection as arrays
+    and not as Series to be aligned on every operation."""
+
+    Table = MP()
+    return {col: Input.np.ascontiguousarray(Table[col].to_numpy()) for col in Table.columns}
+
+
 def NLR_IF(t):
 
     """Non linked reserve per policy"""
@@ -733,7 +741,7 @@ def POL_TERM_Y():
     :func:`model_point`.
     """
 
-    return MP()["policy_term"]
+    return POLICY_BLOCK()["policy_term"]
 
 
 def PREM_HOL_RATE(t):
@@ -769,14 +777,14 @@ def PREM_PP():
     Annual level premium if :func:`PREM_TYPE` is `LEVEL` 
     """
 
-    return MP()["ann_prem"]
+    return POLICY_BLOCK()["ann_prem"]
 
 
 def PREM_TERM_M():
 
     """Premium Paying Term"""
 
-    return MP()["prem_paying_term"] * 12
+    return POLICY_BLOCK()["prem_paying_term"] * 12
 
 
 def PREM_TYPE():
@@ -786,7 +794,7 @@ def PREM_TYPE():
     Returns a string indicating the payment type, which is either
     ``"LEVEL"`` if level payment, or ``"SINGLE"`` if single payment."""
 
-    return MP()['premium_type']
+    return POLICY_BLOCK()["premium_type"]
 
 
 def PROJ_LEN():
@@ -860,9 +868,9 @@ def PVFP(t):
     if t < 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index= MP().index)
     else:
-        n = Input.YieldCurve.index.max()
-        y = Input.np.minimum(Input.np.ceil((t+1)/12), n)
-        i = (1 + Input.YieldCurve["Discount Rates"][y]) ** (1/12)
+        ## the rate of the last year of the curve beyond its end
+        Curve = Input.RATE_CURVE()["Discount Rates"]
+        i = 1 + Curve[min(t + 1, len(Curve) - 1)]
         return (PVFP(t+1) + PRO_AFT_TAX(t+1))/i * (DUR_M(t) <= POL_TERM_M())
 
 
@@ -907,7 +915,7 @@ def SEX():
 
     """The sex of the model points"""
 
-    return MP()["sex"]
+    return POLICY_BLOCK()["sex"]
 
 
 def SOLVM_IF(t):
@@ -930,7 +938,7 @@ def SUM_ASSURED(t):
         max(Sum_assured, MinDBFactor * TotalPremiumsPaid)
     """
 
-    return Input.np.maximum(MP()['sum_assured'], Input.min_DB["Min DB"] * (Input.np.minimum(DUR_Y(t), PREM_TERM_M()/12) * PREM_PP())) * (DUR_M(t) <= POL_TERM_M())
+    return Input.np.maximum(POLICY_BLOCK()["sum_assured"], Input.min_DB["Min DB"] * (Input.np.minimum(DUR_Y(t), PREM_TERM_M()/12) * PREM_PP())) * (DUR_M(t) <= POL_TERM_M())
 
 
 def SURR_BEN(t):
@@ -977,9 +985,9 @@ def VIF(t):
     if t < 0 or t > MAX_PROJ_LEN():
         return Input.pd.Series(0, index= MP().index)
     else:
-        n = Input.YieldCurve.index.max()
-        y = Input.np.minimum(Input.np.ceil((t+1)/12), n)
-        disc_fac = (1 + Input.YieldCurve["Discount Rates"][y]) ** (1/12)
+        ## the rate of the last year of the curve beyond its end
+        Curve = Input.RATE_CURVE()["Discount Rates"]
+        disc_fac = 1 + Curve[min(t + 1, len(Curve) - 1)]
         return (VIF(t+1) + PRO_AFT_SM(t+1) + SOLVM_IF(t+1)) / disc_fac * (DUR_M(t) <= POL_TERM_M()) - SOLVM_IF(t)
 
 
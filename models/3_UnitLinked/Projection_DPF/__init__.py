@@ -367,8 +367,7 @@ def INT_NET_CF(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
        return Input.pd.Series(0, index = Proj.MP().index)
     else:
-       y = Input.np.ceil(t/12)
-       i = (1 + Input.YieldCurve["Non-Unit Interest Rates"][y]) ** (1/12) - 1
+       i = Input.RATE_CURVE()["Non-Unit Interest Rates"][t]
        fmc = 1 - (1 - Input.UF_FMC["Disct Fund FMC"]) ** (1/12)
 
        cf =  (PREM_PAYBL_M(t)
@@ -394,9 +393,8 @@ def INT_RES(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        y = Input.np.ceil(t/12)
-        i_unit = (1 + Input.YieldCurve["Unit Interest Rates"][y]) ** (1/12) - 1
-        i_n_unit = (1 + Input.YieldCurve["Non-Unit Interest Rates"][y]) ** (1/12) - 1
+        i_unit = Input.RATE_CURVE()["Unit Interest Rates"][t]
+        i_n_unit = Input.RATE_CURVE()["Non-Unit Interest Rates"][t]
 
         u_int = (UF.AV_PP_AT(t, "BEF_INV") * ((1 - Input.UF_FMC["FMC"]) ** (1/12))
                  - UF.ST_FMC(t)) * POLS_IF(t-1) * i_unit
@@ -411,8 +409,7 @@ def INT_SOLVM(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        y = Input.np.ceil(t/12)
-        i = (1 + Input.YieldCurve["Non-Unit Interest Rates"][y]) ** (1/12) - 1
+        i = Input.RATE_CURVE()["Non-Unit Interest Rates"][t]
         return SOLVM_IF(t-1)* i
 
 
@@ -449,7 +446,7 @@ def MORT_RATE_ANN(t):
         return Input.pd.Series(0, index = Proj.MP().index)   
     else:
         fac = Input.mort_scale["Male"] * (Proj.SEX() == 'M') + Input.mort_scale["Female"] * (Proj.SEX() == 'F')
-        return fac * Input.BASE_MORT_RATE(t) * Proj.MP()["mort_loading"]
+        return fac * Input.BASE_MORT_RATE(t) * Proj.POLICY_BLOCK()["mort_loading"]
 
 
 def MORT_RATE_MTH(t):
@@ -676,7 +673,7 @@ def UNEARNED_COI(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index= Proj.MP().index)
     else:
-        mort= Input.CHG_MORT_RATE(t) * Proj.MP()["mort_loading"]
+        mort= Input.CHG_MORT_RATE(t) * Proj.POLICY_BLOCK()["mort_loading"]
         scale = Input.res_mort_chg_pc["Male"] * (Proj.SEX() == "M") + Input.res_mort_chg_pc["Female"] * (Proj.SEX() == "F")
         return (Proj.SUM_ASSURED(t)* mort * scale)/24 * POLS_IF(t) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
 
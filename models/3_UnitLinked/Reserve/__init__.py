@@ -438,7 +438,7 @@ def MORT_RATE_ANN(t):
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
         fac = Input.res_mort_scale["Male"] * (Proj.SEX() == 'M') + Input.res_mort_scale["Female"] * (Proj.SEX() == 'F')
-        return fac * Input.BASE_MORT_RATE(t) * Proj.MP()["mort_loading"]
+        return fac * Input.BASE_MORT_RATE(t) * Proj.POLICY_BLOCK()["mort_loading"]
 
 
 def MORT_RATE_MTH(t):
@@ -564,7 +564,7 @@ def SURR_BEN(t):
         return Input.pd.Series( 0 , index = Proj.MP().index)
     else:
         n = Input.SurrCharge.index.max()
-        surr_charge = Input.SURR_CHG_RATE(t) * Input.np.minimum(Proj.MP()["ann_prem"], Res_UF.AV_PP_AT(t, "BEF_PW_LB"))        
+        surr_charge = Input.SURR_CHG_RATE(t) * Input.np.minimum(Proj.POLICY_BLOCK()["ann_prem"], Res_UF.AV_PP_AT(t, "BEF_PW_LB"))        
         return ((Res_UF.AV_PP_AT(t,"BEF_PW_LB") - Input.np.minimum(Input.SURR_CHG_CAP(t), surr_charge)) * POLS_LAPSE(t)) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
 
 
@@ -670,7 +670,7 @@ def UPR(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        mort= Input.CHG_MORT_RATE(t-1) * Proj.MP()["mort_loading"]
+        mort= Input.CHG_MORT_RATE(t-1) * Proj.POLICY_BLOCK()["mort_loading"]
         scale = Input.res_mort_chg_pc["Male"] * (Proj.SEX() == "M") + Input.res_mort_chg_pc["Female"] * (Proj.SEX() == "F")
         return ((UF.SAR(t)* mort * scale) / 12) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
 
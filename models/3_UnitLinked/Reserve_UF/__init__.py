@@ -37,14 +37,28 @@ def ALLOC_CHARGE_RATE(t):
 
 def AVG_2Y(t, var: str):
 
-    """Returns the 2-year average of the variable passed"""    
+    """ACCM_FV
+
+    Returns the 2-year average of the variable passed
+
+    ``var`` must be the name of a cell of this space holding a running sum
+    over ``t``, such as :func:`ACCM_FV`. The average over the 24 months
+    to ``t`` is the difference of two of its values, so each call reads
+    two cached values whatever the window; a cell of monthly values is
+    not averaged by this.
+
+    NOTE: for functions such as this, the first line of
+    documentation should be the arguments to this function
+    for Output.RESULTS function to run properly"""
 
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
+
+    RunningSum = _space.cells[var]
     if t <= 24:
-        return eval(f"{var}({t})") / t
+        return RunningSum(t) / t
     else:
-        return (eval(f"{var}({t})")-eval(f"{var}({t-24})")) / 24
+        return (RunningSum(t) - RunningSum(t-24)) / 24
 
 
 def AV_PP_AT(t, timing):
@@ -105,7 +119,7 @@ def AV_PP_AT(t, timing):
         return AV_PP_AT(t, "BEF_FEE") - CHG_ADMIN(t) - CHG_MORT(t)
 
     elif timing == "BEF_PW_LB":
-        return AV_PP_AT(t, "BEF_INV")  + INV_INC_PP(t) - CHG_FMC(t)
+        return Input.pd.Series(FUND_STEP(t)["BEF_PW_LB"], index = Proj.MP().index)
 
     elif timing == "END":
         return AV_PP_AT(t, "BEF_PW_LB")  - PW(t) + LOYALTY(t)
@@ -123,7 +137,7 @@ def AV_PP_INIT():
     the ``av_pp_init`` column in :func:`model_point`.
     For new business, 0 should be entered in the column."""
 
-    return Proj.MP()["FV_start"]
+    return Proj.POLICY_BLOCK()["FV_start"]
 
 
 def CHG_ADMIN(t):
@@ -136,10 +150,7 @@ def CHG_ADMIN(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        Charge = Input.ADMIN_CHARGE_RATE(t) * Proj.MP()["ann_prem"] * (1 + Input.ST_rate["Allocation/Admin Charge"])
-        Cap = Input.admin_chg_cap["Cap"] * (1+Input.ST_rate["Allocation/Admin Charge"])
-
-        return Input.np.minimum(AV_PP_AT(t, "BEF_FEE"), Input.np.minimum(Cap, Charge)) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
+        return Input.pd.Series(FUND_STEP(t)["CHG_ADMIN"], index = Proj.MP().index)
 
 
 def CHG_ALLOC(t):
@@ -160,7 +171,7 @@ def CHG_FMC(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        return (AV_PP_AT(t, "BEF_INV") + INV_INC_PP(t)) * Input.res_UF_FMC["FMC"]/12 * (1 + Input.ST_rate["FMC"]) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
+        return Input.pd.Series(FUND_STEP(t)["CHG_FMC"], index = Proj.MP().index)
 
 
 def CHG_MORT(t):
@@ -170,10 +181,48 @@ def CHG_MORT(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        mort= Input.CHG_MORT_RATE(t-1) * Proj.MP()["mort_loading"]
-        scale = Input.mort_chg_scale["Male"] * (Proj.SEX() == "M") + Input.mort_chg_scale["Female"] * (Proj.SEX() == "F")
-        return (SAR(t) * mort * scale)/12 * (1+Input.ST_rate["Mortality Charge"]) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
+        return Input.pd.Series(FUND_STEP(t)["CHG_MORT"], index = Proj.MP().index)
+
+
+def FUND_STEP(t):
+
+    """Account value roll-forward within the month ``t``
+
+    Takes the account value of all model points from after the premium
+    (``AV_PP_AT(t, "BEF_FEE")``) through the charges and the investment
+    return of the month in one step on arrays. Returns a dict of the arrays
+    of the sum at risk, the charges, the investment income and the account
+    value before partial withdrawal and loyalty bonus; the cells of these
+    only read them from here. The other timings of :func:`AV_PP_AT` are
+    left to its own cells, so they are only built when requested.
+    At ``t=0`` only the sum at risk on the initial account value is set."""
+
+    flag = (Proj.DUR_M(t) <= Proj.POL_TERM_M()).to_numpy()
+    if t == 0:
+        bef_fee = Input.np.asarray(AV_PP_INIT(), dtype = float)
+    else:
+        bef_fee = AV_PP_AT(t, "BEF_FEE").to_numpy()
+
+    db = Input.np.maximum(Proj.SUM_ASSURED(t) - Proj.DTH_BEN_RED(t), Proj.DTH_BEN_MIN(t)).to_numpy()
+    sar = Input.np.maximum(0, db - bef_fee * (1 - Proj.IND_DB())) * flag
+    if t == 0:
+        return {"SAR": sar}
 
+    Charge = (Input.ADMIN_CHARGE_RATE(t) * Proj.POLICY_BLOCK()["ann_prem"] * (1 + Input.ST_rate["Allocation/Admin Charge"])).to_numpy()
+    Cap = Input.admin_chg_cap["Cap"] * (1+Input.ST_rate["Allocation/Admin Charge"])
+    chg_admin = Input.np.minimum(bef_fee, Input.np.minimum(Cap, Charge)) * flag
+
+    mort = (Input.CHG_MORT_RATE(t-1) * Proj.POLICY_BLOCK()["mort_loading"]).to_numpy()
+    scale = Input.mort_chg_scale["Male"] * (Proj.SEX() == "M") + Input.mort_chg_scale["Female"] * (Proj.SEX() == "F")
+    chg_mort = (sar * mort * scale)/12 * (1+Input.ST_rate["Mortality Charge"]) * flag
+
+    bef_inv = bef_fee - chg_admin - chg_mort
+    inv_rate_mth = (1 + Input.res_UF_FMC["Unit Growth"]) ** (1/12) - 1
+    inv_inc = (inv_rate_mth * bef_inv) * flag
+    chg_fmc = (bef_inv + inv_inc) * Input.res_UF_FMC["FMC"]/12 * (1 + Input.ST_rate["FMC"]) * flag
+
+    return {"SAR": sar, "CHG_ADMIN": chg_admin, "CHG_MORT": chg_mort,
+            "INV_INC_PP": inv_inc, "CHG_FMC": chg_fmc, "BEF_PW_LB": bef_inv + inv_inc - chg_fmc}
 
 def INV_INC_PP(t):
 
@@ -186,9 +235,7 @@ def INV_INC_PP(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        dur = Input.np.ceil(t/12)
-        inv_rate_mth = (1 + Input.res_UF_FMC["Unit Growth"]) ** (1/12) - 1
-        return (inv_rate_mth * AV_PP_AT(t, "BEF_INV")) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
+        return Input.pd.Series(FUND_STEP(t)["INV_INC_PP"], index = Proj.MP().index)
 
 
 def LOYALTY(t):
@@ -222,7 +269,7 @@ def PW(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        return (Proj.MP()['ann_prem'] * Input.np.minimum( Proj.DUR_Y(t), Proj.MP()["prem_paying_term"]) * PW_RATE(t)/12) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
+        return (Proj.POLICY_BLOCK()["ann_prem"] * Input.np.minimum( Proj.DUR_Y(t), Proj.POLICY_BLOCK()["prem_paying_term"]) * PW_RATE(t)/12) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
 
 
 def PW_RATE(t):
@@ -244,11 +291,7 @@ def SAR(t):
     if t < 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        if t == 0:
-            av = AV_PP_INIT()
-        else:
-            av = AV_PP_AT(t, "BEF_FEE")
-        return Input.np.maximum(0, Input.np.maximum(Proj.SUM_ASSURED(t) - Proj.DTH_BEN_RED(t), Proj.DTH_BEN_MIN(t)) - av * (1 - Proj.IND_DB())) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
+        return Input.pd.Series(FUND_STEP(t)["SAR"], index = Proj.MP().index)
 
 
 def ST_ADMIN(t):
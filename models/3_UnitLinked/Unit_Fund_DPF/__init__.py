@@ -64,32 +64,13 @@ def AV_PP_AT(t, timing):
         return AV_PP_AT(t-1, "END") * (Proj.DUR_M(t)<= Input.surr_mth["Surrender Month"])
 
     elif timing == "BEF_FEE":
-        return AV_PP_AT(t, "START") 
+        return AV_PP_AT(t, "START")
 
     elif timing == "BEF_INV":
-        return AV_PP_AT(t, "BEF_FEE") 
+        return AV_PP_AT(t, "BEF_FEE")
 
-    elif timing == "BEF_PW_LB":
-        return AV_PP_AT(t, "BEF_INV") + INV_INC_PP(t) - CHG_FMC(t)
-
-    elif timing == "END":
-        if t > Input.surr_mth["Surrender Month"]:
-            return Input.pd.Series(0, index = Proj.MP().index)
-
-        elif t == Input.surr_mth["Surrender Month"]:
-            return AV_PP_AT(t, "BEF_PW_LB")
-
-        else:
-            surr_charge = Input.np.minimum(Input.SURR_CHG_RATE(t) * Input.np.minimum(Proj.PREM_PP(), UF.AV_PP_AT(t, "END")), Input.SURR_CHG_CAP(t))
-
-            value = Input.np.array(AV_PP_AT(t, "BEF_PW_LB") * (Proj_DPF.POLS_IF(t) - Proj.POLS_LAPSE(t))
-                                   + Proj.POLS_LAPSE(t) * (UF.AV_PP_AT(t, "END") - surr_charge))
-
-            pols = Input.np.array(Proj_DPF.POLS_IF(t))
-
-            end_val = Input.np.divide(value, pols, out = Input.np.zeros_like(value), where = pols!= 0)
-            val = Input.pd.Series(list(end_val), index = Proj.MP().index)
-            return val * (Proj_DPF.POLS_IF(t)>0)
+    elif timing in ("BEF_PW_LB", "END"):
+        return Input.pd.Series(FUND_STEP(t)[timing], index = Proj.MP().index)
 
     else:
         raise ValueError("invalid timing")
@@ -104,7 +85,7 @@ def AV_PP_INIT():
     the ``av_pp_init`` column in :func:`model_point`.
     For new business, 0 should be entered in the column."""
 
-    return Proj.MP()["FV_start"]
+    return Proj.POLICY_BLOCK()["FV_start"]
 
 
 def CHG_ADMIN(t):
@@ -132,7 +113,7 @@ def CHG_FMC(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        return (AV_PP_AT(t, "BEF_INV") + INV_INC_PP(t)) * Input.UF_FMC["Disct Fund FMC"]/12 * (1 + Input.ST_rate["FMC"]) * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
+        return Input.pd.Series(FUND_STEP(t)["CHG_FMC"], index = Proj.MP().index)
 
 
 def CHG_MORT(t):
@@ -142,6 +123,41 @@ def CHG_MORT(t):
     return Input.pd.Series(0, index = Proj.MP().index)
 
 
+def FUND_STEP(t):
+
+    """Account value roll-forward within the month ``t``
+
+    Takes the account value of all model points from before the investment
+    return (``AV_PP_AT(t, "BEF_INV")``) to the end of the month in one step
+    on arrays. Returns a dict of the arrays of the investment income, the
+    fund management charge and the account value before partial withdrawal
+    and at the end of the month; the cells of these only read them from
+    here. The other timings of :func:`AV_PP_AT` are left to its own cells,
+    so they are only built when requested."""
+
+    surr_mth = Input.surr_mth["Surrender Month"]
+    flag = (Proj.DUR_M(t) <= Proj.POL_TERM_M()).to_numpy()
+
+    bef_inv = AV_PP_AT(t, "BEF_INV").to_numpy()
+    inv_rate_mth = Input.RATE_CURVE()["Discount Rates"][t]
+    inv_inc = inv_rate_mth * bef_inv * flag
+    chg_fmc = (bef_inv + inv_inc) * Input.UF_FMC["Disct Fund FMC"]/12 * (1 + Input.ST_rate["FMC"]) * flag
+    bef_pw_lb = bef_inv + inv_inc - chg_fmc
+
+    if t > surr_mth:
+        end = Input.np.zeros(len(bef_pw_lb))
+    elif t == surr_mth:
+        end = bef_pw_lb
+    else:
+        surr_charge = Input.np.minimum(Input.SURR_CHG_RATE(t) * Input.np.minimum(Proj.PREM_PP(), UF.AV_PP_AT(t, "END")), Input.SURR_CHG_CAP(t))
+        pols, lapse = Proj_DPF.POLS_IF(t).to_numpy(), Proj.POLS_LAPSE(t).to_numpy()
+
+        value = bef_pw_lb * (pols - lapse) + lapse * Input.np.asarray(UF.AV_PP_AT(t, "END") - surr_charge)
+        end = Input.np.divide(value, pols, out = Input.np.zeros_like(value), where = pols != 0) * (pols > 0)
+
+    return {"INV_INC_PP": inv_inc, "CHG_FMC": chg_fmc, "BEF_PW_LB": bef_pw_lb, "END": end}
+
+
 def INV_INC_PP(t):
 
     """Investment income on account value per policy
@@ -153,9 +169,7 @@ def INV_INC_PP(t):
     if t <= 0 or t > Proj.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Proj.MP().index)
     else:
-        dur = Input.np.ceil(t/12)
-        inv_rate_mth = (1 + Input.YieldCurve["Discount Rates"][dur]) ** (1/12) - 1
-        return inv_rate_mth * AV_PP_AT(t, "BEF_INV") * (Proj.DUR_M(t) <= Proj.POL_TERM_M())
+        return Input.pd.Series(FUND_STEP(t)["INV_INC_PP"], index = Proj.MP().index)
 
 
 def PREM_TO_AV_PP(t):
@@ -25,15 +25,12 @@ def COHORT():
 def COHORT_VAR(cell: str, *args):
     """Returns aggregated variables - cohortwise"""
 
-    COHORT = Input.MP()["PCODE"]
-    cellStr = "PolProj.Actuals."+cell
+    ## segment-sum over the cohorts, coded once per model point table
+    CohortCodes, CohortSet = Input.COHORT_CODES()
+    Values = Input.np.array(PolProj.Actuals.cells[cell](*args[0]), dtype = float)
+    Values[Input.np.isnan(Values)] = 0
 
-    def CohortSum(x: Input.pd.Series):
-        var = x.copy()
-        var.index = COHORT
-        return var.groupby(var.index).sum()
-
-    temp = CohortSum(Input.pd.Series(eval(f"{cellStr}{args[0]}")))
+    temp = Input.pd.Series(Input.np.bincount(CohortCodes, weights = Values, minlength = len(CohortSet)), index = CohortSet)
     return temp
 
 # =============================================================================
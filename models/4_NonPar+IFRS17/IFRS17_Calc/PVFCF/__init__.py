@@ -17,7 +17,7 @@ def PV_PREM(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = CF.COHORT().index)
     else:
-        return CF.PREM_PAYBL_M(t) + PV_PREM(t+1)/(1 + disc_rate(t, basis))
+        return Input.pd.Series(PV_VEC(("PREM_PAYBL_M",), ())[:, t], index = CF.COHORT().index)
 
 
 def PV_DTH_BEN(t):
@@ -26,7 +26,7 @@ def PV_DTH_BEN(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = CF.COHORT().index)
     else:
-        return (CF.DTH_BEN(t) + PV_DTH_BEN(t+1)) / (1 + disc_rate(t, basis))
+        return Input.pd.Series(PV_VEC((), ("DTH_BEN",))[:, t], index = CF.COHORT().index)
 
 
 def PV_OTH_BEN(t):
@@ -36,7 +36,7 @@ def PV_OTH_BEN(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = CF.COHORT().index)
     else:
-        return CF.INCM_BEN(t) + CF.MAT_BEN(t) + (CF.SURR_BEN(t) + PV_OTH_BEN(t+1))/(1 + disc_rate(t, basis))
+        return Input.pd.Series(PV_VEC(("INCM_BEN", "MAT_BEN"), ("SURR_BEN",))[:, t], index = CF.COHORT().index)
 
 
 def PV_COMM(t):
@@ -45,7 +45,7 @@ def PV_COMM(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = CF.COHORT().index)
     else:
-        return CF.COMM_INIT(t) + CF.COMM_REN(t) + PV_COMM(t+1)/(1 + disc_rate(t, basis))
+        return Input.pd.Series(PV_VEC(("COMM_INIT", "COMM_REN"), ())[:, t], index = CF.COHORT().index)
 
 
 def PV_EXPS(t):
@@ -54,9 +54,8 @@ def PV_EXPS(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = CF.COHORT().index)
     else:
-        disc_fac = 1 + disc_rate(t, basis)
-        return (CF.EXPS_MAINT(t) + CF.EXPS_CLAIM_MAT(t)
-                + (CF.EXPS_CLAIM_DTH(t) + CF.EXPS_CLAIM_SURR(t) + PV_EXPS(t+1))/disc_fac)
+        return Input.pd.Series(PV_VEC(("EXPS_MAINT", "EXPS_CLAIM_MAT"), ("EXPS_CLAIM_DTH", "EXPS_CLAIM_SURR"))[:, t],
+                               index = CF.COHORT().index)
 
 
 def PV_EXPS_ACQ(t):
@@ -65,7 +64,7 @@ def PV_EXPS_ACQ(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = CF.COHORT().index)
     else:
-        return CF.EXPS_ACQ(t) + PV_EXPS_ACQ(t+1)/(1 + disc_rate(t, basis))
+        return Input.pd.Series(PV_VEC(("EXPS_ACQ",), ())[:, t], index = CF.COHORT().index)
 
 
 def PV_RA_CF(t):
@@ -74,32 +73,87 @@ def PV_RA_CF(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = CF.COHORT().index)
     else:
-        return (CF.RA_MORT(t) + PV_RA_CF(t+1)) / (1 + disc_rate(t, basis))
+        return Input.pd.Series(PV_VEC((), ("RA_MORT",))[:, t], index = CF.COHORT().index)
+
+
+def DISC_FAC():
+    """Discount factors to time 0 by month
+
+    Entry ``t`` is the product of 1/(1 + disc_rate(s, basis)) for s = 1 .. t,
+    built once per basis from the monthly rates of ``disc_rate``"""
+
+    T = Input.MAX_PROJ_LEN()
+    rates = Input.np.array([disc_rate(t, basis) for t in range(1, T + 1)], dtype = float)
+
+    return Input.np.concatenate([[1], Input.np.cumprod(1/(1 + rates))])
+
+
+def PV_VEC(start, end):
+    """Present values at all t of the cashflows of ``CF`` named in ``start``
+    (paid at the start of month t) and in ``end`` (paid at the end of month t)
+
+    The recursion::
+
+        PV(t) = start(t) + (end(t) + PV(t+1)) / (1 + disc_rate(t, basis))
+
+    is evaluated as the reversed cumulative sum of the cashflows weighted
+    by :func:`DISC_FAC`, rebased to each t."""
+
+    T = Input.MAX_PROJ_LEN(); v = DISC_FAC()
+    pv = Input.np.zeros((len(CF.COHORT().index), T + 2))
+
+    for t in range(1, T + 1):
+        for name in start:
+            pv[:, t] += v[t-1] * CF.cells[name](t).to_numpy()
+        for name in end:
+            pv[:, t] += v[t] * CF.cells[name](t).to_numpy()
+
+    pv = Input.np.cumsum(pv[:, ::-1], axis = 1)[:, ::-1]
+    pv[:, 1:T+1] /= v[:-1]
+
+    return pv
+
+
+def VALUES():
+    """BEL, RA, CSM and LIAB at valuation at all t
+
+    A dict of (cohort x t) DataFrames for t = 0 .. MAX_PROJ_LEN, taken
+    as whole arrays from :func:`PV_VEC`"""
+
+    Output.COHORT_CF()
+    T = Input.MAX_PROJ_LEN(); index = CF.COHORT().index
+
+    bel = -(PV_VEC(("PREM_PAYBL_M",), ())
+            - PV_VEC((), ("DTH_BEN",))
+            - PV_VEC(("INCM_BEN", "MAT_BEN"), ("SURR_BEN",))
+            - PV_VEC(("EXPS_ACQ",), ())
+            - PV_VEC(("EXPS_MAINT", "EXPS_CLAIM_MAT"), ("EXPS_CLAIM_DTH", "EXPS_CLAIM_SURR"))
+            - PV_VEC(("COMM_INIT", "COMM_REN"), ()))[:, 1:T+2]
+    ra = PV_VEC((), ("RA_MORT",))[:, 1:T+2]
+    csm = Input.np.maximum(0, - bel - ra)
+
+    return {"BEL": Input.pd.DataFrame(bel, index = index),
+            "RA": Input.pd.DataFrame(ra, index = index),
+            "CSM": Input.pd.DataFrame(csm, index = index),
+            "LIAB": Input.pd.DataFrame(bel + ra + csm, index = index)}
 
 
 def BEL(t):
     """Best estimated liabilities at valuation"""
 
-    if t < 0:
+    if t < 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = CF.COHORT().index)
     else:
-        Output.COHORT_CF()
-        return -(PV_PREM(t+1)
-                 - PV_DTH_BEN(t+1)
-                 - PV_OTH_BEN(t+1)
-                 - PV_EXPS_ACQ(t+1)
-                 - PV_EXPS(t+1)
-                 - PV_COMM(t+1))
+        return VALUES()["BEL"][t]
 
 
 def RA(t):
     """Risk adjustment at valuation"""
 
-    if t < 0:
+    if t < 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = CF.COHORT().index)
     else:
-        Output.COHORT_CF()
-        return PV_RA_CF(t+1)
+        return VALUES()["RA"][t]
 
 
 def CSM(t):
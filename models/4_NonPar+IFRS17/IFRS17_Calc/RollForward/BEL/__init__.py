@@ -27,7 +27,7 @@ def PVFCF(t):
     if t != 1:
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        return PV(BE, Input.DISC_RATE_M, "Locked").BEL(t-1)
+        return RFW.PV_STORE(BE, "Locked")["BEL"][t-1]
 
 
 def EXPCT_IN(t):
@@ -121,8 +121,8 @@ def XP_VAR_LR(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        return Rebased.IND_FCF_CHG(t) * (PV(Act, Input.DISC_RATE_M, "Locked").BEL(t)
-                                        - PV(BE, Input.DISC_RATE_M, "Locked").BEL(t))
+        return Rebased.IND_FCF_CHG(t) * (RFW.PV_STORE(Act, "Locked")["BEL"][t]
+                                        - RFW.PV_STORE(BE, "Locked")["BEL"][t])
 
 
 def XP_VAR_CR(t):
@@ -139,8 +139,8 @@ def XP_VAR_CR(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        return Rebased.IND_FCF_CHG(t) * (PV(Act, Input.DISC_RATE_M, "Previous").BEL(t)
-                                        - PV(Act, Input.DISC_RATE_M, "Locked").BEL(t))
+        return Rebased.IND_FCF_CHG(t) * (RFW.PV_STORE(Act, "Previous")["BEL"][t]
+                                        - RFW.PV_STORE(Act, "Locked")["BEL"][t])
 
 
 def ASSM_CHG_DISC(t):
@@ -159,8 +159,8 @@ def ASSM_CHG_DISC(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        return Rebased.IND_FCF_CHG(t) * (PV(Act, Input.DISC_RATE_M, "Current").BEL(t)
-                                        - PV(Act, Input.DISC_RATE_M, "Previous").BEL(t))
+        return Rebased.IND_FCF_CHG(t) * (RFW.PV_STORE(Act, "Current")["BEL"][t]
+                                        - RFW.PV_STORE(Act, "Previous")["BEL"][t])
 
 
 def ASSM_CHG_LR(t, assm):
@@ -182,8 +182,8 @@ def ASSM_CHG_LR(t, assm):
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
         n = Input.ASSM_CHG_RUN(assm)
-        return Rebased.IND_FCF_CHG(t) * (PV(Rebased(n), Input.DISC_RATE_M, "Locked").BEL(t)
-                                        - PV(Rebased(n-1), Input.DISC_RATE_M, "Locked").BEL(t))
+        return Rebased.IND_FCF_CHG(t) * (RFW.PV_STORE(Rebased(n), "Locked")["BEL"][t]
+                                        - RFW.PV_STORE(Rebased(n-1), "Locked")["BEL"][t])
 
 
 def ASSM_CHG_CR(t, assm):
@@ -205,11 +205,11 @@ def ASSM_CHG_CR(t, assm):
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
         n = Input.ASSM_CHG_RUN(assm)
-        return ((PV(Rebased(n), Input.DISC_RATE_M, "Current").BEL(t)
-                 - PV(Rebased(n-1), Input.DISC_RATE_M, "Current").BEL(t))
+        return ((RFW.PV_STORE(Rebased(n), "Current")["BEL"][t]
+                 - RFW.PV_STORE(Rebased(n-1), "Current")["BEL"][t])
 
-               -(PV(Rebased(n), Input.DISC_RATE_M, "Locked").BEL(t)
-                 - PV(Rebased(n-1), Input.DISC_RATE_M, "Locked").BEL(t))) * Rebased.IND_FCF_CHG(t)
+               -(RFW.PV_STORE(Rebased(n), "Locked")["BEL"][t]
+                 - RFW.PV_STORE(Rebased(n-1), "Locked")["BEL"][t])) * Rebased.IND_FCF_CHG(t)
 
 
 def CLOSING(t):
@@ -242,4 +242,4 @@ Act = ("Interface", ("...", "Actuals"), "auto")
 
 Rebased = ("Interface", ("...", "BestEstimateRebased"), "auto")
 
-PV = ("Interface", ("...", "PVFCF"), "auto")
\ No newline at end of file
+RFW = ("Interface", ("..",), "auto")
\ No newline at end of file
@@ -26,8 +26,8 @@ def PVFCF(t):
     if t != 1:
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        ind = (PV(BE, Input.DISC_RATE_M, "Locked").CSM(0) > 0)
-        return ind * PV(BE, Input.DISC_RATE_M, "Locked").CSM(t-1)
+        ind = RFW.IND_NON_ONEROUS()
+        return ind * RFW.PV_STORE(BE, "Locked")["CSM"][t-1]
 
 
 def RELEASE_PREM(t):
@@ -44,7 +44,7 @@ def RELEASE_PREM(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        ind = (PV(BE, Input.DISC_RATE_M, "Locked").CSM(0) > 0)
+        ind = RFW.IND_NON_ONEROUS()
         n, flag = Input.MAX_SCEN(), (t <= Rebased.VAL_M())
 
         return ind * flag * (Act.PREM_PAYBL_M(t) - BE.PREM_PAYBL_M(t))
@@ -62,7 +62,7 @@ def RELEASE_INV(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        ind = (PV(BE, Input.DISC_RATE_M, "Locked").CSM(0) > 0)
+        ind = RFW.IND_NON_ONEROUS()
         n, flag = Input.MAX_SCEN(), (t <= Rebased.VAL_M())
 
         return ind * flag * (BE.INV_AFT_PROB(t)
@@ -98,9 +98,9 @@ def XP_VAR_LR(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        ind = Rebased.IND_FCF_CHG(t) * (PV(BE, Input.DISC_RATE_M, "Locked").CSM(0) > 0)
-        return ind * (PV(Act, Input.DISC_RATE_M, "Locked").CSM(t)
-                      - PV(BE, Input.DISC_RATE_M, "Locked").CSM(t))
+        ind = Rebased.IND_FCF_CHG(t) * RFW.IND_NON_ONEROUS()
+        return ind * (RFW.PV_STORE(Act, "Locked")["CSM"][t]
+                      - RFW.PV_STORE(BE, "Locked")["CSM"][t])
 
 
 def ASSM_CHG_LR(t, assm):
@@ -122,9 +122,9 @@ def ASSM_CHG_LR(t, assm):
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
         n = Input.ASSM_CHG_RUN(assm)
-        ind = Rebased.IND_FCF_CHG(t) * (PV(BE, Input.DISC_RATE_M, "Locked").CSM(0) > 0)
-        return ind * (PV(Rebased(n), Input.DISC_RATE_M, "Locked").CSM(t)
-                      - PV(Rebased(n-1), Input.DISC_RATE_M, "Locked").CSM(t))
+        ind = Rebased.IND_FCF_CHG(t) * RFW.IND_NON_ONEROUS()
+        return ind * (RFW.PV_STORE(Rebased(n), "Locked")["CSM"][t]
+                      - RFW.PV_STORE(Rebased(n-1), "Locked")["CSM"][t])
 
 
 def RELEASE(t):
@@ -133,8 +133,7 @@ def RELEASE(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        ind = (PV(BE, Input.DISC_RATE_M, "Locked").CSM(0) > 0)
-        RFW = RELEASE.parent.parent
+        ind = RFW.IND_NON_ONEROUS()
         total = Input.pd.Series(0, index = BE.COHORT().index)
         Vars = list(CLOSING.parent.cells)
         Vars.remove("RELEASE"); Vars.remove("CLOSING")
@@ -156,7 +155,7 @@ def CLOSING(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        ind = (PV(BE, Input.DISC_RATE_M, "Locked").CSM(0) > 0)
+        ind = RFW.IND_NON_ONEROUS()
         total = Input.pd.Series(0, index = BE.COHORT().index)
         Vars = list(CLOSING.parent.cells); Vars.remove("CLOSING")
 
@@ -182,4 +181,4 @@ Act = ("Interface", ("...", "Actuals"), "auto")
 
 Rebased = ("Interface", ("...", "BestEstimateRebased"), "auto")
 
-PV = ("Interface", ("...", "PVFCF"), "auto")
\ No newline at end of file
+RFW = ("Interface", ("..",), "auto")
\ No newline at end of file
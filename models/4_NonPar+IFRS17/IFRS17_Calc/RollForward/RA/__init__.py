@@ -27,7 +27,7 @@ def PVFCF(t):
     if t != 1:
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        return PV(BE, Input.DISC_RATE_M, "Locked").RA(t-1)
+        return RFW.PV_STORE(BE, "Locked")["RA"][t-1]
 
 
 def FIN_EFFECT(t):
@@ -53,8 +53,8 @@ def XP_VAR_LR(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        return Rebased.IND_FCF_CHG(t) * (PV(Act, Input.DISC_RATE_M, "Locked").RA(t)
-                                        - PV(BE, Input.DISC_RATE_M, "Locked").RA(t))
+        return Rebased.IND_FCF_CHG(t) * (RFW.PV_STORE(Act, "Locked")["RA"][t]
+                                        - RFW.PV_STORE(BE, "Locked")["RA"][t])
 
 
 def XP_VAR_CR(t):
@@ -71,8 +71,8 @@ def XP_VAR_CR(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        return Rebased.IND_FCF_CHG(t) * (PV(Act, Input.DISC_RATE_M, "Previous").RA(t)
-                                        - PV(Act, Input.DISC_RATE_M, "Locked").RA(t))
+        return Rebased.IND_FCF_CHG(t) * (RFW.PV_STORE(Act, "Previous")["RA"][t]
+                                        - RFW.PV_STORE(Act, "Locked")["RA"][t])
 
 
 def ASSM_CHG_DISC(t):
@@ -91,8 +91,8 @@ def ASSM_CHG_DISC(t):
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        return Rebased.IND_FCF_CHG(t) * (PV(Act, Input.DISC_RATE_M, "Current").RA(t)
-                                        - PV(Act, Input.DISC_RATE_M, "Previous").RA(t))
+        return Rebased.IND_FCF_CHG(t) * (RFW.PV_STORE(Act, "Current")["RA"][t]
+                                        - RFW.PV_STORE(Act, "Previous")["RA"][t])
 
 
 def ASSM_CHG_LR(t, assm):
@@ -114,8 +114,8 @@ def ASSM_CHG_LR(t, assm):
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
         n = Input.ASSM_CHG_RUN(assm)
-        return Rebased.IND_FCF_CHG(t) * (PV(Rebased(n), Input.DISC_RATE_M, "Locked").RA(t)
-                                        - PV(Rebased(n-1), Input.DISC_RATE_M, "Locked").RA(t))
+        return Rebased.IND_FCF_CHG(t) * (RFW.PV_STORE(Rebased(n), "Locked")["RA"][t]
+                                        - RFW.PV_STORE(Rebased(n-1), "Locked")["RA"][t])
 
 
 def ASSM_CHG_CR(t, assm):
@@ -137,11 +137,11 @@ def ASSM_CHG_CR(t, assm):
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
         n = Input.ASSM_CHG_RUN(assm)
-        return ((PV(Rebased(n), Input.DISC_RATE_M, "Current").RA(t)
-                 - PV(Rebased(n-1), Input.DISC_RATE_M, "Current").RA(t))
+        return ((RFW.PV_STORE(Rebased(n), "Current")["RA"][t]
+                 - RFW.PV_STORE(Rebased(n-1), "Current")["RA"][t])
 
-               -(PV(Rebased(n), Input.DISC_RATE_M, "Locked").RA(t)
-                 - PV(Rebased(n-1), Input.DISC_RATE_M, "Locked").RA(t))) * Rebased.IND_FCF_CHG(t)
+               -(RFW.PV_STORE(Rebased(n), "Locked")["RA"][t]
+                 - RFW.PV_STORE(Rebased(n-1), "Locked")["RA"][t])) * Rebased.IND_FCF_CHG(t)
 
 
 def RELEASE(t):
@@ -187,4 +187,4 @@ Act = ("Interface", ("...", "Actuals"), "auto")
 
 Rebased = ("Interface", ("...", "BestEstimateRebased"), "auto")
 
-PV = ("Interface", ("...", "PVFCF"), "auto")
\ No newline at end of file
+RFW = ("Interface", ("..",), "auto")
\ No newline at end of file
@@ -21,19 +21,88 @@ _spaces = [
 
 def COV_UNIT(t):
 
-    """Coverage units for CSM and Acquisition ammortization"""
+    """Coverage units for CSM and Acquisition ammortization
+
+    The quantity of benefits provided at ``t`` over the quantity still to
+    be provided from ``t`` onwards, read from :func:`COV_UNIT_REMAINING`"""
 
     if t < 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = BE.COHORT().index)
     else:
-        t_len = range(t, Input.MAX_PROJ_LEN())
-        pols = BE.POLS_IF(t)
-        sum_pols = sum([BE.POLS_IF(i) for i in t_len])
-        cov = Input.np.divide(pols, sum_pols, out = Input.np.zeros_like(sum_pols), where = sum_pols!= 0)
+        qty = COV_UNIT_QTY(t)
+        remaining = COV_UNIT_REMAINING()[t]
+        cov = Input.np.divide(qty, remaining, out = Input.np.zeros_like(remaining), where = remaining!= 0)
 
         return cov
 
 
+def COV_UNIT_QTY(t):
+
+    """Quantity of benefits provided at ``t`` - cohortwise
+
+    Measured as set in ``CovUnitBasis``:
+        POLS_IF: number of policies in-force
+        SUM_ASSURED: sum assured in-force
+        BENEFITS: expected death, income, maturity and surrender benefits"""
+
+    if t < 0 or t > Input.MAX_PROJ_LEN():
+        return Input.pd.Series(0, index = BE.COHORT().index)
+    elif CovUnitBasis == "POLS_IF":
+        return BE.POLS_IF(t)
+    elif CovUnitBasis == "SUM_ASSURED":
+        ## segment-sum over the cohorts, coded once per model point table
+        CohortCodes, CohortSet = Input.COHORT_CODES()
+        x = Input.np.array(Proj.BestEstimate.POLS_IF(t) * Input.SUM_ASSURED(), dtype = float)
+        x[Input.np.isnan(x)] = 0
+        return Input.pd.Series(Input.np.bincount(CohortCodes, weights = x, minlength = len(CohortSet)), index = CohortSet)
+    elif CovUnitBasis == "BENEFITS":
+        return BE.DTH_BEN(t) + BE.INCM_BEN(t) + BE.MAT_BEN(t) + BE.SURR_BEN(t)
+    else:
+        raise ValueError(f"invalid coverage unit basis: {CovUnitBasis}")
+
+
+def COV_UNIT_REMAINING():
+
+    """Quantity of benefits still to be provided from each ``t`` - cohortwise
+
+    A (cohort x t) DataFrame taken once by a reverse cumulative sum of
+    :func:`COV_UNIT_QTY` over the projection, and shared by every ``t``"""
+
+    T = Input.MAX_PROJ_LEN()
+    Qty = Input.pd.concat([COV_UNIT_QTY(t) for t in range(T)], axis = 1).to_numpy(dtype = float)
+
+    remaining = Input.np.zeros((len(Qty), T + 1))
+    remaining[:, :T] = Input.np.cumsum(Qty[:, ::-1], axis = 1)[:, ::-1]
+
+    return Input.pd.DataFrame(remaining, index = BE.COHORT().index)
+
+
+def IND_NON_ONEROUS():
+
+    """Non-onerous cohorts: CSM at initial recognition is positive"""
+
+    return PV_STORE(BE, "Locked")["CSM"][0] > 0
+
+
+def IND_ONEROUS():
+
+    """Onerous cohorts: CSM at initial recognition is nil"""
+
+    return PV_STORE(BE, "Locked")["CSM"][0] == 0
+
+
+def PV_STORE(cf, basis):
+
+    """Present values of the cashflows of ``cf`` on the ``basis`` at all t
+
+    The dict of (cohort x t) DataFrames of BEL, RA, CSM and LIAB of
+    PVFCF(cf, Input.DISC_RATE_M, basis), looked up once per (cf, basis),
+    so that the roll-forward cells read columns instead of re-entering
+    the parameterized space at every t"""
+
+    return PV(cf, Input.DISC_RATE_M, basis).VALUES()
+
+
 # ---------------------------------------------------------------------------
 # References
 
@@ -41,4 +110,8 @@ Proj = ("Interface", ("...", "PolicyProjection"), "auto")
 
 Input = ("Interface", ("...", "Input"), "auto")
 
-BE = ("Interface", ("..", "BestEstimate"), "auto")
\ No newline at end of file
+BE = ("Interface", ("..", "BestEstimate"), "auto")
+
+PV = ("Interface", ("..", "PVFCF"), "auto")
+
+CovUnitBasis = "POLS_IF"
\ No newline at end of file
@@ -20,7 +20,7 @@ def LOAD_TABLES(*tables):
 
     returns 0
     """
-    Path, os, openpyxl, pd = Input.Path, Input.os, Input.openpyxl, Input.pd
+    Path, os = Input.Path, Input.os
 
     for table in tables[0]:
         if not os.path.isabs(Path[table]):
@@ -28,13 +28,10 @@ def LOAD_TABLES(*tables):
         else:
             raise ValueError("relative path required for tables/excel range files")
 
-        table_workbook = openpyxl.load_workbook(filename = table_path)
-        for sheet in table_workbook.sheetnames:
+        for sheet, df in Input.READ_TABLES(table_path).items():
             if sheet not in dir(LOAD_TABLES.parent):
-                df = pd.read_excel(table_path, sheet_name = sheet, index_col = 0, header = 0)
-
                 LOAD_TABLES.parent.new_pandas(data = df, file_type = "excel", name = sheet, path = Path[table], sheet = sheet)
-                if eval(f"{sheet}.isnull().values.any()"):
+                if df.isnull().values.any():
                     status = "Wrn"
                 else:
                     status = "OK"
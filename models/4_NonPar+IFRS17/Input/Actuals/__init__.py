@@ -22,7 +22,7 @@ def LOAD_TABLES(*tables):
 
     returns 0
     """
-    Path, os, openpyxl, pd = Input.Path, Input.os, Input.openpyxl, Input.pd
+    Path, os, pd = Input.Path, Input.os, Input.pd
 
     for table in tables[0]:
         if not os.path.isabs(Path[table]):
@@ -37,20 +37,17 @@ def LOAD_TABLES(*tables):
             if sheet not in dir(LOAD_TABLES.parent):
                 df = pd.read_csv(table_path, index_col = 0, header = 0)
                 LOAD_TABLES.parent.new_pandas(data = df, file_type = "csv", name = sheet, path = Path[table])
-                if eval(f"{sheet}.isnull().values.any()"):
+                if df.isnull().values.any():
                     status = "Wrn"
                 else:
                     status = "OK"
                 print(f"Loaded {sheet}... {status}")
 
         elif fileExtn == ".xlsx":
-            table_workbook = openpyxl.load_workbook(filename = table_path)
-            for sheet in table_workbook.sheetnames:
+            for sheet, df in Input.READ_TABLES(table_path).items():
                 if sheet not in dir(LOAD_TABLES.parent):
-                    df = pd.read_excel(table_path, sheet_name = sheet, index_col = 0, header = 0)
-
                     LOAD_TABLES.parent.new_pandas(data = df, file_type = "excel", name = sheet, path = Path[table], sheet = sheet)
-                    if eval(f"{sheet}.isnull().values.any()"):
+                    if df.isnull().values.any():
                         status = "Wrn"
                     else:
                         status = "OK"
@@ -64,7 +61,11 @@ def IND_BEN(benefit):
     benefit: DTH_MONTH, SURR_MONTH
     """
 
-    return BenefitsIndicator[benefit][Input.MP().index]
+    ## the model points of a synthetic portfolio (tools_1.benchmark) take the actuals
+    ## of the model point they were drawn from, kept in their 'SourceID' column
+    MP = Input.MP()
+    IDs = MP["SourceID"] if "SourceID" in MP.columns else MP.index
+    return Input.pd.Series(BenefitsIndicator[benefit][IDs].to_numpy(), index = MP.index, name = benefit)
 
 
 # ---------------------------------------------------------------------------
@@ -25,7 +25,7 @@ def AGE(t):
 def AGE_AT_ENTRY():
     """The age at entry of the selected model point"""
 
-    return MP()["IssueAge"]
+    return POLICY_BLOCK()["IssueAge"]
 
 
 def ASSM_CHG_RUN(assm):
@@ -49,7 +49,7 @@ def AST_EARN_RATE_M(t, basis):
 
     basis: Locked, Previous, Current"""
 
-    return (1 + AssetEarnedRate[basis][math.ceil(t/12)])**(1/12) - 1
+    return RATE_CURVE(basis)["AssetEarnedRate"][t]
 
 
 def BASE_MORT_RATE(t, basis):
@@ -63,7 +63,7 @@ def BASE_MORT_RATE(t, basis):
     for i in sex:
         mort_rates += (SEX() == i) * list(eval(f"Mortality.{basis}[i][ages]"))
 
-    return pd.Series(mort_rates, name = inspect.stack()[0][3])
+    return pd.Series(mort_rates, index = MP().index, name = "BASE_MORT_RATE")
 
 
 def COHORT():
@@ -72,6 +72,13 @@ def COHORT():
     return MP()["PCODE"]
 
 
+def COHORT_CODES():
+    """The cohort of the model points as integer codes, and the sorted cohorts they refer to"""
+
+    CohortCodes, CohortSet = pd.factorize(MP()["PCODE"], sort = True)
+    return CohortCodes, CohortSet.rename("PCODE")
+
+
 def COMM_RATE(t):
     """Lapse rate"""
 
@@ -87,7 +94,7 @@ def DISC_RATE_M(t, basis):
 
    basis: Locked, Previous, Current"""
 
-    return (1 + DiscountRate[basis][math.ceil(t/12)])**(1/12) - 1
+    return RATE_CURVE(basis)["DiscountRate"][t]
 
 
 def DUR_M(t):
@@ -154,7 +161,7 @@ def INIT_POLS_IF():
     Number of in-force policies at time 0 referenced from :func:`pols_if`.
     Defaults to 1."""
 
-    return MP()["PolicyCount"]
+    return POLICY_BLOCK()["PolicyCount"]
 
 
 def LAPSE_RATE_ANN(t):
@@ -191,12 +198,10 @@ def LOAD_TABLES(*tables):
         else:
             raise ValueError("relative path required for tables/excel range files")
 
-        table_workbook = openpyxl.load_workbook(filename = table_path)
-        for sheet in table_workbook.sheetnames:
+        for sheet, df in READ_TABLES(table_path).items():
             if sheet not in dir(LOAD_TABLES.parent):
-                df = pd.read_excel(table_path, sheet_name = sheet, index_col = 0, header = 0)
                 LOAD_TABLES.parent.new_pandas(data = df, file_type = "excel", name = sheet, path = Path[table], sheet = sheet)
-                if eval(f"{sheet}.isnull().values.any()"):
+                if df.isnull().values.any():
                     status = "Wrn"
                 else:
                     status = "OK"
@@ -291,6 +296,17 @@ def MP():
         raise ValueError(f"Incompatible data type for Input.point_id: {type(point_id)}")
 
 
+def POLICY_BLOCK():
+    """The columns of the selected model point(s) as contiguous NumPy arrays
+
+    Evaluated once per selection of :func:`MP`. The static per-policy cells
+    read their columns from it, so that they enter the projection as arrays
+    and not as Series to be aligned on every operation."""
+
+    Table = MP()
+    return {col: np.ascontiguousarray(Table[col].to_numpy()) for col in Table.columns}
+
+
 def POL_TERM_M():
     """The policy term of the selected model point."""
 
@@ -303,13 +319,13 @@ def POL_TERM_Y():
     The element labeled ``policy_term`` of the Series returned by
     :func:`model_point`."""
 
-    return MP()["PolicyTerm"]
+    return POLICY_BLOCK()["PolicyTerm"]
 
 
 def PREM_PP():
     """Annual premium per policy"""
 
-    return MP()["AnnPrem"]
+    return POLICY_BLOCK()["AnnPrem"]
 
 
 def PREM_TERM_M():
@@ -321,7 +337,7 @@ def PREM_TERM_M():
 def PREM_TERM_Y():
     """Premium paying term in years"""
 
-    return MP()["PremPayingTerm"]
+    return POLICY_BLOCK()["PremPayingTerm"]
 
 
 def PREP_INPUTS():
@@ -330,7 +346,7 @@ def PREP_INPUTS():
     In "ForbiddenCells", the user can add cells
     they wish to not include in results"""
 
-    ForbiddenCells = ["LOAD_TABLES", "PREP_INPUTS", "LOAD_XLRANGES"]
+    ForbiddenCells = ["LOAD_TABLES", "PREP_INPUTS", "LOAD_XLRANGES", "READ_TABLES"]
 
     t_len = range(1, MAX_PROJ_LEN() + 1)
     elements = {"Input": list(PREP_INPUTS.parent.cells),}
@@ -377,16 +393,74 @@ def PROJ_LEN():
     return POL_TERM_M() - DUR_M(0) + 2
 
 
+def RATE_CURVE(basis):
+    """Monthly discount and asset earned rates by projection month
+
+    Entry ``t`` holds (1 + rate) ** (1/12) - 1 for the rate of year ceil(t/12).
+    Compiled once per basis and read by :func:`DISC_RATE_M` and :func:`AST_EARN_RATE_M`.
+
+    basis: Locked, Previous, Current"""
+
+    curve = {}
+    for name, table in [("DiscountRate", DiscountRate), ("AssetEarnedRate", AssetEarnedRate)]:
+        months = np.arange(12 * table.index.max() + 1)
+        rates = table[basis].reindex(np.ceil(months/12)).to_numpy(dtype = float)
+        curve[name] = (1 + rates)**(1/12) - 1
+
+    return curve
+
+
+def READ_TABLES(table_path):
+    """All sheets of a table workbook, parsed in one pass: {sheet: pd.DataFrame}
+
+    The tables are cached in a sidecar file next to the workbook ('.<workbook>.tables.pickle'),
+    valid while the modified time of the workbook is unchanged or, if it was touched, while its
+    content hash is; unchanged workbooks are then read from the sidecar without parsing.
+    """
+
+    sidecar = os.path.join(os.path.dirname(table_path), f".{os.path.basename(table_path)}.tables.pickle")
+    mtime = os.stat(table_path).st_mtime_ns
+
+    cache = None
+    if os.path.exists(sidecar):
+        try:
+            with open(sidecar, "rb") as f:
+                cache = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            cache = None
+    if cache is not None and cache["mtime"] == mtime:
+        return cache["tables"]
+
+    with open(table_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    if cache is None or cache["hash"] != digest:
+        ## a single pass over the workbook: every sheet from one parse
+        cache = {"hash": digest, "tables": pd.read_excel(table_path, sheet_name = None, index_col = 0, header = 0)}
+    cache["mtime"] = mtime
+    ## written to a temporary file first, so that a concurrent reader never sees a partial sidecar;
+    ## the sidecar is only a cache, so a folder it cannot be written to is not an error
+    temp = None
+    try:
+        handle, temp = tempfile.mkstemp(dir = os.path.dirname(sidecar), prefix = os.path.basename(sidecar), suffix = ".tmp")
+        with os.fdopen(handle, "wb") as f:
+            pickle.dump(cache, f, protocol = pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, sidecar)
+    except OSError:
+        if temp is not None and os.path.exists(temp):
+            os.remove(temp)
+    return cache["tables"]
+
+
 def SEX(): 
     """The sex of the selected model point(s)"""
 
-    return MP()["Sex"]
+    return POLICY_BLOCK()["Sex"]
 
 
 def SUM_ASSURED():
     """The sum assured of the selected model point(s)"""
 
-    return MP()["SumAssured"]
+    return POLICY_BLOCK()["SumAssured"]
 
 
 def SURR_TERM():
@@ -398,7 +472,7 @@ def SURR_TERM():
 def TERMINAL_BEN():
     """Terminal benefit"""
 
-    mat_fac = pd.Series([Maturity_Factor[POL_TERM_Y()[i]] for i in MP().index], index = MP().index)
+    mat_fac = np.array([Maturity_Factor[term] for term in POL_TERM_Y()], dtype = float)
     #return SUM_ASSURED() * (mat_fac/10)
     return SUM_ASSURED() * (1 + mat_fac/10)
 
@@ -428,6 +502,12 @@ os = ("Module", "os")
 
 openpyxl = ("Module", "openpyxl")
 
+pickle = ("Module", "pickle")
+
+hashlib = ("Module", "hashlib")
+
+tempfile = ("Module", "tempfile")
+
 ModelPointsFile = ("IOSpec", 2763548782016, 2763548780816)
 
 Mort_Scale = ("IOSpec", 2763548779712, 2763548779712)
@@ -16,10 +16,9 @@ def AGGREGATE_CF(export = None, name: str = "aggregate", file_type: str = ".csv"
     """Aggregate results
         export (bool)(optional): whether to export the results (setting this to False returns the pd.Dataframe)
         name (str)(optional): name to the file being exported
-        file_type (str)(optional): set to '.csv' by default. Other option is '.xlsx'
+        file_type (str)(optional): set to '.csv' by default. Other options are '.xlsx', '.parquet' and '.feather'
 
-        In "ForbiddenCells" and "ForbiddenSpaces", the user can add cells and spaces
-        they wish to not include in results
+        The columns are taken from RESULT_PLAN()
     """
 
     from datetime import datetime
@@ -27,61 +26,22 @@ def AGGREGATE_CF(export = None, name: str = "aggregate", file_type: str = ".csv"
 
     print(f"{Input.inspect.stack()[0][3]}({export}, {name}) called at: {datetime.now().strftime('%H:%M:%S')}")
 
-    """ Variables Declaration """
-    ForbiddenCells, ForbiddenSpaces = [], [] ## User can modify as required -- see documentation
-
     t_len = range(Input.MAX_PROJ_LEN())
-    scenarios = list(Input.AssumptionsMatrix.index) ## PolicyProjection.BestEstimateRebased
-
-    ## DO NOT MODIFY ##
-    Data, DataColumns, elements, ExtendedFx, spaces = dict(), list(), dict(), list(), list()
-
-    """ Functions Declaration """
-    def GiveSpaces(x, y):
-        s = eval(f"list({x}.spaces)")
-        if len(list(s)) > 0:
-            for i in s:
-                y.append(f"{x}.{i}")
-                GiveSpaces(f"{x}.{i}", y)
-    GiveSpaces("PolicyProjection", spaces)
-
-    for i in ForbiddenSpaces:
-        if i in spaces:
-            spaces.remove(i)
-
-    for space in spaces:
-        if eval(f"{space}.parameters") == ():
-            elements[space] = list(eval(f"{space}.cells"))
-        else:
-            for scen in scenarios: ## for multiple runs during Rebasing
-                elements[f"{space}({scen})"] = list(eval(f"{space}({scen}).cells"))
-
-    for userspace in elements:
-        for cell in elements[userspace]:
-            if eval(f"{userspace}.{cell}.parameters == ('t',)"):
-                DataColumns.append(f"{userspace}.{cell}")
-            elif eval(f"{userspace}.{cell}.parameters == ()"):
-                pass
-            elif f"{userspace}.{cell}" not in ForbiddenCells:
-                ExtendedFx.append(f"{userspace}.{cell}")
+    Plan = RESULT_PLAN(); Objects = dict()
+    Values = Input.np.empty((len(t_len), len(Plan)))
 
     #### main loop starts here ####
 
-    for DataColumn in tqdm(DataColumns+ExtendedFx):
-        if DataColumn not in ExtendedFx:
-            try:
-                Data[DataColumn] = Input.pd.Series([eval(f"sum({DataColumn}({t}))") for t in t_len], index = t_len)
-            except TypeError as e:
-                Data[DataColumn] = Input.pd.Series([eval(f"{DataColumn}({t})") for t in t_len], index = t_len)
-        else:
-            args = eval(f'{DataColumn}.doc.replace(" ", "").split(",")') ## to be updated - refer PREP_INPUTS()
-            for arg in args:
-                try:
-                    Data[f"{DataColumn}({arg})"] = Input.pd.Series([eval(f"sum({DataColumn}({t}, '{arg}'))") for t in t_len], index = t_len)
-                except TypeError as e:
-                    Data[f"{DataColumn}({arg})"] = Input.pd.Series([eval(f"{DataColumn}({t}, '{arg}')") for t in t_len], index = t_len)
+    for j, (DataColumn, Cell, Args) in enumerate(tqdm(Plan)):
+        try:
+            Values[:, j] = [Input.np.asarray(Cell(t, *Args)).sum() for t in t_len]
+        except (TypeError, ValueError):
+            Objects[DataColumn] = Input.pd.Series([Cell(t, *Args) for t in t_len], index = t_len, dtype = object)
 
-    DF = Input.pd.DataFrame.from_dict(Data)
+    DF = Input.pd.DataFrame(Values, index = t_len, columns = [DataColumn for DataColumn, Cell, Args in Plan])
+    for DataColumn in Objects:
+        DF[DataColumn] = Objects[DataColumn]
+    del(Values, Objects)
 
     #### export methods ####
 
@@ -94,6 +54,14 @@ def AGGREGATE_CF(export = None, name: str = "aggregate", file_type: str = ".csv"
                 DF.to_csv(path); del(DF)
             elif file_type == ".xlsx":
                 DF.to_excel(path); del(DF)
+            elif file_type in (".parquet", ".feather"):
+                ## long format: one row per (cell, t)
+                DF = DF.rename_axis("t").melt(ignore_index = False, var_name = "cell", value_name = "value").reset_index()
+                DF = DF[["cell", "t", "value"]].astype({"value": float})
+                if file_type == ".parquet":
+                    DF.to_parquet(path, index = False); del(DF)
+                else:
+                    DF.to_feather(path); del(DF)
             else:
                 raise TypeError("invalid file type passed")
             return f"{Input.inspect.stack()[0][3]} exported successfully!"
@@ -105,6 +73,98 @@ def AGGREGATE_CF(export = None, name: str = "aggregate", file_type: str = ".csv"
         return 0
 
 
+def RESULT_PLAN(root: str = "PolicyProjection"):
+
+    """Column plan for AGGREGATE_CF and IFRS_RESULTS
+        root (str)(optional): the space the plan covers: "PolicyProjection" (AGGREGATE_CF, COHORT_CF, SERIATIM),
+            the default, or "IFRS17_Calc" (IFRS_RESULTS)
+
+        A list of (column, cell, args) built once per root, holding direct
+        references to the cells in the root whose first parameter is ``t``.
+        Cells with further parameters are expanded over the arguments listed in their doc
+        after the name of the parameter, e.g. "assm: Inflation, Mortality".
+
+        In "ForbiddenCells" and "ForbiddenSpaces", the user can add cells and spaces
+        they wish to not include in results
+    """
+
+    """ Variables Declaration """
+    ForbiddenCells, ForbiddenSpaces = [], [] ## User can modify as required -- see documentation
+
+    scenarios = list(Input.AssumptionsMatrix.index) ## PolicyProjection.BestEstimateRebased, IFRS17_Calc.BestEstimateRebased
+    if root == "PolicyProjection":
+        ForbiddenCells += [f"PolicyProjection.BestEstimateRebased({scen}).{cell}" for scen in scenarios for cell in ("BASIS", "CHANGED")]
+    elif root == "IFRS17_Calc":
+        ForbiddenCells += ["IFRS17_Calc.BestEstimate.COHORT_VAR", "IFRS17_Calc.Actuals.COHORT_VAR", "IFRS17_Calc.RollForward.PV_STORE"]
+        ForbiddenCells += [f"IFRS17_Calc.BestEstimateRebased({scen}).COHORT_VAR" for scen in scenarios]
+        ForbiddenSpaces += ["IFRS17_Calc.PVFCF"]
+    else:
+        raise ValueError(f"invalid root passed: {root}")
+
+    ## DO NOT MODIFY ##
+    DataColumns, elements, ExtendedFx, spaces = list(), dict(), list(), dict()
+
+    """ Functions Declaration """
+    def GiveSpaces(x, space, y):
+        for i in space.spaces.values():
+            y[f"{x}.{i.name}"] = i
+            GiveSpaces(f"{x}.{i.name}", i, y)
+    GiveSpaces(root, {"PolicyProjection": PolicyProjection, "IFRS17_Calc": IFRS17_Calc}[root], spaces)
+
+    for name, space in spaces.items():
+        if name in ForbiddenSpaces:
+            pass
+        elif space.parameters in [(), None]:
+            elements[name] = space
+        else:
+            for scen in scenarios: ## for multiple runs during Rebasing
+                elements[f"{name}({scen})"] = space(scen)
+
+    for userspace in elements:
+        for cell in elements[userspace].cells.values():
+            if cell.parameters == ('t',):
+                DataColumns.append((f"{userspace}.{cell.name}", cell, ()))
+            elif cell.parameters == ():
+                pass
+            elif f"{userspace}.{cell.name}" not in ForbiddenCells:
+                for param in cell.parameters[1:]: ## to be updated - refer PREP_INPUTS()
+                    for arg in cell.doc[cell.doc.find(param)+len(param)+1:].replace(" ", "").split(","):
+                        ExtendedFx.append((f"{userspace}.{cell.name}({arg})", cell, (arg,)))
+
+    return DataColumns + ExtendedFx
+
+
+def SERIATIM(cells: tuple = (), start: int = 0, stop: int = None):
+
+    """Per-policy results of the selected model points
+        cells (tuple)(optional): columns of RESULT_PLAN() to include, e.g. ("PolicyProjection.BestEstimate.NET_CF",);
+            all columns by default
+        start, stop (int)(optional): the block of months to include, as in range(...)[start:stop]; all months by default
+
+        One row per model point and month, one column per cell.
+        run_methods.seriatim_model streams it to disk batch by batch, a block of months at a time.
+    """
+
+    Input.PREP_INPUTS()
+
+    t_len = range(Input.MAX_PROJ_LEN())[start:stop]
+    Columns = {DataColumn: (DataColumn, Cell, Args) for DataColumn, Cell, Args in RESULT_PLAN()}
+    try:
+        Plan = [Columns[DataColumn] for DataColumn in cells] if cells else list(Columns.values())
+    except KeyError as e:
+        raise ValueError(f"{e} is not a column of RESULT_PLAN()")
+
+    Index = Input.MP().index
+    Values = Input.np.empty((len(Index), len(t_len), len(Plan)))
+    for j, (DataColumn, Cell, Args) in enumerate(Plan):
+        for k, t in enumerate(t_len):
+            Values[:, k, j] = Input.np.asarray(Cell(t, *Args), dtype = float)
+
+    Index = Input.pd.MultiIndex.from_product([Index, t_len], names = [Index.name or "point_id", "t"])
+    return Input.pd.DataFrame(Values.reshape(-1, len(Plan)), index = Index,
+                              columns = [DataColumn for DataColumn, Cell, Args in Plan])
+
+
 def SET_COHORT():
 
     """Ensures that policies are cohorted properly
@@ -132,7 +192,7 @@ def COHORT_CF(export = None, name: str = "cohorts", file_type: str = ".xlsx"):
     """Cohort Results
         export (bool)(optional): whether to export the results or not
         name (str)(optional): name to the file being exported
-        file_type (str)(optional): set to '.xlsx' by default. Other option is '.csv'
+        file_type (str)(optional): set to '.xlsx' by default. Other options are '.csv', '.parquet' and '.feather'
 
         In "ForbiddenCells" and "ForbiddenSpaces", the user can add cells and spaces
         they wish to not include in results
@@ -150,86 +210,56 @@ def COHORT_CF(export = None, name: str = "cohorts", file_type: str = ".xlsx"):
     ForbiddenCells, ForbiddenSpaces = [], [] ## User can modify as required -- see documentation
 
     t_len = range(Input.MAX_PROJ_LEN())
-    scenarios = list(Input.AssumptionsMatrix.index) ## PolicyProjection.BestEstimateRebased
 
     ## DO NOT MODIFY
-    Data, DataColumns, elements, ExtendedFx, spaces = dict(), list(), dict(), list(), list()
-    COHORT = Input.MP()["PCODE"]; CohortSet = list(set(COHORT)); CohortSet.sort()
+    CohortCodes, CohortSet = Input.COHORT_CODES(); CohortSet = CohortSet.tolist()
+    ## segment of each (model point, month): cohort code x months + month
+    Segments = (CohortCodes[:, None] * len(t_len) + Input.np.arange(len(t_len))).ravel(); Size = len(CohortSet) * len(t_len)
 
     """ Functions Declaration """
-    def CohortSum(x: Input.pd.Series):
-        var = x.copy()
-        var.index = COHORT
-        return var.groupby(var.index).sum()
-
-    def GiveSpaces(x, y):
-        s = eval(f"list({x}.spaces)")
-        if len(list(s)) > 0:
-            for i in s:
-                y.append(f"{x}.{i}")
-                GiveSpaces(f"{x}.{i}", y)
-    GiveSpaces("PolicyProjection", spaces)
-
-    for i in ForbiddenSpaces:
-        if i in spaces:
-            spaces.remove(i)
-
-    for space in spaces:
-        if eval(f"{space}.parameters") == ():
-            elements[space] = list(eval(f"{space}.cells"))
-        else:
-            for scen in scenarios: ## for multiple runs during Rebasing
-                elements[f"{space}({scen})"] = list(eval(f"{space}({scen}).cells"))
-
-    for i in CohortSet:
-        exec(f"Data_{i} = dict()")
+    def CohortSum(x: list):
+        ## sums a cell's (model point x month) block over the cohorts in one pass: (cohort x month)
+        if Input.np.ndim(x[0]) != 1 or len(x[0]) != len(CohortCodes):
+            raise TypeError("not a value per model point")
+        try:
+            Block = Input.np.stack([Input.np.asarray(v, dtype = float) for v in x], axis = 1)
+        except ValueError:
+            raise TypeError("not a numeric value")
+        Block[Input.np.isnan(Block)] = 0
+        return Input.np.bincount(Segments, weights = Block.ravel(), minlength = Size).reshape(len(CohortSet), -1)
 
-    for userspace in elements:
-        for cell in elements[userspace]:
-            if eval(f"{userspace}.{cell}.parameters == ('t',)"):
-                DataColumns.append(f"{userspace}.{cell}")
-            elif eval(f"{userspace}.{cell}.parameters == ()"):
-                pass
-            elif f"{userspace}.{cell}" not in ForbiddenCells:
-                ExtendedFx.append(f"{userspace}.{cell}")
+    def CellName(Column: str, Args: tuple):
+        ## the column without the arguments of its cell, e.g. "PolicyProjection.BestEstimateRebased(1).BASIS"
+        return Column[:Column.rfind("(")] if Args else Column
 
     #### main loop starts here ####
 
-    for DataColumn in tqdm(DataColumns+ExtendedFx):
-        if DataColumn not in ExtendedFx:
-            Multi_Str = "".join([f"Data_{i}['{DataColumn}']," for i in CohortSet])
-            try:
-                temp = Input.np.array(Input.pd.Series([eval(f"{DataColumn}({t})") for t in t_len], index = t_len).apply(CohortSum)).transpose()
-                exec(f"{Multi_Str} = temp"); del(temp)
-            except (TypeError, AttributeError):
-                for i in CohortSet:
-                    temp = Input.pd.Series([eval(f"{DataColumn}({t})") for t in t_len], index = t_len)
-                    exec(f"Data_{i}['{DataColumn}'] = temp"); del(temp)
-        else:
-            args = eval(f'{DataColumn}.doc.replace(" ", "").split(",")')
-            for arg in args:
-                Multi_Str = "".join([f"Data_{i}['{DataColumn}({arg})']," for i in CohortSet])
-                try:
-                    temp = Input.np.array(Input.pd.Series([eval(f"{DataColumn}({t}, '{arg}')") for t in t_len], index = t_len).apply(CohortSum)).transpose()
-                    exec(f"{Multi_Str} = temp"); del(temp)
-                except (TypeError, AttributeError):
-                    for i in CohortSet:
-                        temp = Input.pd.Series([eval(f"{DataColumn}({t}, '{arg}')") for t in t_len], index = t_len)
-                        exec(f"Data_{i}['{DataColumn}({arg})'] = temp"); del(temp)
+    ## (column, cell, args): the columns of RESULT_PLAN(), less the forbidden cells and spaces
+    Plan = [(Column, Cell, Args) for Column, Cell, Args in RESULT_PLAN()
+            if CellName(Column, Args) not in ForbiddenCells
+            and CellName(Column, Args).rsplit(".", 1)[0].split("(")[0] not in ForbiddenSpaces]
+    Columns = [Column for Column, Cell, Args in Plan]
+
+    ## (cohort x column x month); values that are not per model point are the same for every cohort
+    Data = Input.np.zeros((len(CohortSet), len(Plan), len(t_len)))
+    for j, (Column, Cell, Args) in enumerate(tqdm(Plan)):
+        Values = [Cell(t, *Args) for t in t_len]
+        try:
+            Data[:, j, :] = CohortSum(Values)
+        except (TypeError, AttributeError):
+            Data[:, j, :] = Input.np.asarray(Values, dtype = float)
+        del(Values)
 
     #### export methods ####
 
     if export == False:
-        DF_Dict = dict()
-        for i in CohortSet:
-            DF = eval(f"Input.pd.DataFrame.from_dict(Data_{i})"); exec(f"del(Data_{i})")
-            DF_Dict[i] = DF; del(DF)
-        return DF_Dict
+        ## per-cohort views of the (cohort x column x month) array
+        return {i: Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns) for k, i in enumerate(CohortSet)}
 
     elif export == True:
         if file_type == ".csv":
-            for i in CohortSet:
-                DF = eval(f"Input.pd.DataFrame.from_dict(Data_{i})"); exec(f"del(Data_{i})")
+            for k, i in enumerate(CohortSet):
+                DF = Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns)
                 filename = f"{i}" + file_type
                 path = Input.os.path.join(Input.Path["Results"], filename)
                 try:
@@ -238,13 +268,33 @@ def COHORT_CF(export = None, name: str = "cohorts", file_type: str = ".xlsx"):
                     raise PermissionError(f"The file '{filename}' is being used by another process")
                 del(DF, path, filename)
             return f"{Input.inspect.stack()[0][3]} exported successfully!"
+        elif file_type in (".parquet", ".feather"):
+            ## long format: one row per (cohort, cell, t), written cohort by cohort
+            import pyarrow as pa, pyarrow.parquet as pq
+            filename = f"{name}" + file_type
+            path = Input.os.path.join(Input.Path["Results"], filename)
+            Writer = None
+            try:
+                for k, i in enumerate(CohortSet):
+                    DF = Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns)
+                    DF = DF.rename_axis("t").melt(ignore_index = False, var_name = "cell", value_name = "value").reset_index()
+                    DF.insert(0, "cohort", i)
+                    Table = pa.Table.from_pandas(DF[["cohort", "cell", "t", "value"]].astype({"value": float}), preserve_index = False)
+                    if Writer is None:
+                        Writer = pq.ParquetWriter(path, Table.schema) if file_type == ".parquet" else pa.ipc.new_file(path, Table.schema)
+                    Writer.write_table(Table); del(DF, Table)
+                return f"{Input.inspect.stack()[0][3]} exported to '{filename}' successfully!"
+            except PermissionError:
+                raise PermissionError(f"The file '{filename}' is being used by another process")
+            finally:
+                if Writer is not None: Writer.close()
         elif file_type == ".xlsx":
             filename = f"{name}" + file_type
             path = Input.os.path.join(Input.Path["Results"], filename)
             with Input.pd.ExcelWriter(path) as w:
                 try:
-                    for i in CohortSet:
-                        DF = eval(f"Input.pd.DataFrame.from_dict(Data_{i})"); exec(f"del(Data_{i})")
+                    for k, i in enumerate(CohortSet):
+                        DF = Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns)
                         DF.to_excel(w, sheet_name = f"{i}")
                     return f"{Input.inspect.stack()[0][3]} exported successfully!"
                 except PermissionError:
@@ -258,7 +308,7 @@ def IFRS_RESULTS(export = None, name: str = "ifrs_results", file_type: str = ".x
     """IFRS'17 Calculation results
         export (bool): whether to export results
         name (str)(optional): name to the file being exported
-        file_type (str)(optional): set to '.xlsx' by default. Other option is '.csv'
+        file_type (str)(optional): set to '.xlsx' by default. Other options are '.csv', '.parquet' and '.feather'
 
         In "ForbiddenCells" and "ForbiddenSpaces", the user can add cells and spaces
         they wish to not include in results
@@ -270,102 +320,59 @@ def IFRS_RESULTS(export = None, name: str = "ifrs_results", file_type: str = ".x
     print(f"{Input.inspect.stack()[0][3]}({name}{file_type}) called at: {datetime.now().strftime('%H:%M:%S')}")
 
     """ Variables Declaration """
-    ForbiddenCells = ["IFRS17_Calc.BestEstimate.COHORT_VAR", "IFRS17_Calc.Actuals.COHORT_VAR"] ## + IFRS17_Calc.BestEstimateRebased[scen].COHORT_VAR
-    ForbiddenSpaces = ["IFRS17_Calc.PVFCF"]
+    ForbiddenCells, ForbiddenSpaces = [], [] ## User can modify as required -- see documentation
 
     t_len = range(Input.MAX_PROJ_LEN())
-    COHORT = IFRS17_Calc.BestEstimate.COHORT().index; CohortSet = list(set(COHORT)); CohortSet.sort()
-    scenarios = list(Input.AssumptionsMatrix.index) ## PolicyProjection.BestEstimateRebased
 
-    ForbiddenCells += [f"IFRS17_Calc.BestEstimateRebased({scen}).COHORT_VAR" for scen in scenarios]
-
-    ## DO NOT MODIFY ##
-    DataColumns, elements, ExtendedFx, spaces = list(), dict(), list(), list()
+    ## DO NOT MODIFY
+    COHORT = IFRS17_Calc.BestEstimate.COHORT().index; CohortCodes, CohortSet = Input.pd.factorize(COHORT, sort = True); CohortSet = CohortSet.tolist()
+    ## segment of each (cohort, month): cohort code x months + month
+    Segments = (CohortCodes[:, None] * len(t_len) + Input.np.arange(len(t_len))).ravel(); Size = len(CohortSet) * len(t_len)
 
     """ Functions Declaration """
-    def CohortSum(x: Input.pd.Series):
-        var = x.copy()
-        var.index = COHORT
-        return var.groupby(var.index).sum()
-
-    def GiveSpaces(x, y):
-        s = eval(f"list({x}.spaces)")
-        if len(list(s)) > 0:
-            for i in s:
-                y.append(f"{x}.{i}")
-                GiveSpaces(f"{x}.{i}", y)
-    GiveSpaces("IFRS17_Calc", spaces)
-
-    for i in ForbiddenSpaces:
-        if i in spaces:
-            spaces.remove(i)
-
-    for i in CohortSet:
-        exec(f"Data_{i} = dict()")
-
-    for space in spaces:
-        if eval(f"{space}.parameters") == () or eval(f"{space}.parameters") == None:
-            elements[space] = list(eval(f"{space}.cells"))
-        else:
-            for scen in scenarios: ## for multiple runs during Rebasing
-                elements[f"{space}({scen})"] = list(eval(f"{space}({scen}).cells"))
+    def CohortSum(x: list):
+        ## sums a cell's (model point x month) block over the cohorts in one pass: (cohort x month)
+        if Input.np.ndim(x[0]) != 1 or len(x[0]) != len(CohortCodes):
+            raise TypeError("not a value per model point")
+        try:
+            Block = Input.np.stack([Input.np.asarray(v, dtype = float) for v in x], axis = 1)
+        except ValueError:
+            raise TypeError("not a numeric value")
+        Block[Input.np.isnan(Block)] = 0
+        return Input.np.bincount(Segments, weights = Block.ravel(), minlength = Size).reshape(len(CohortSet), -1)
 
-    for userspace in elements:
-        for cell in elements[userspace]:
-            if eval(f"{userspace}.{cell}.parameters == ('t',)"):
-                DataColumns.append(f"{userspace}.{cell}")
-            elif eval(f"{userspace}.{cell}.parameters == ()"):
-                pass
-            elif f"{userspace}.{cell}" not in ForbiddenCells:
-                ExtendedFx.append(f"{userspace}.{cell}")
+    def CellName(Column: str, Args: tuple):
+        ## the column without the arguments of its cell, e.g. "IFRS17_Calc.RollForward.Total.ASSM_CHG"
+        return Column[:Column.rfind("(")] if Args else Column
 
     #### main loop starts here ####
 
-    for DataColumn in tqdm(DataColumns+ExtendedFx):
-        if DataColumn not in ExtendedFx:
-            Multi_Str = "".join([f"Data_{i}['{DataColumn}']," for i in CohortSet])
-            try:
-                temp = Input.np.array(Input.pd.Series([eval(f"{DataColumn}({t})") for t in t_len], index = t_len).apply(CohortSum)).transpose()
-                exec(f"{Multi_Str} = temp"); del(temp)
-            except (TypeError, AttributeError, ValueError):
-                for i in CohortSet:
-                    temp = Input.pd.Series([eval(f"{DataColumn}({t})") for t in t_len], index = t_len)
-                    exec(f"Data_{i}['{DataColumn}'] = temp"); del(temp)
-
-        ### parameterized formulas ###
+    ## (column, cell, args): the columns of RESULT_PLAN("IFRS17_Calc"), less the forbidden cells and spaces
+    Plan = [(Column, Cell, Args) for Column, Cell, Args in RESULT_PLAN("IFRS17_Calc")
+            if CellName(Column, Args) not in ForbiddenCells
+            and CellName(Column, Args).rsplit(".", 1)[0].split("(")[0] not in ForbiddenSpaces]
+    Columns = [Column for Column, Cell, Args in Plan]
 
-        else:
-            ## args = eval(f'{DataColumn}.doc.replace(" ", "").split(",")')
-            params = eval(f'{DataColumn}.parameters')
-            for param in params[1:]:
-                doc = eval(f'{DataColumn}.doc')
-                args = doc[doc.find(param)+len(param)+1:].replace(" ", "").split(",")
-
-                for arg in args:
-                    Multi_Str = "".join([f"Data_{i}['{DataColumn}({arg})']," for i in CohortSet])
-                    try:
-                        ## print("TESTING LOG: ", arg, type(arg))
-                        ## print("TESTING CMD: ", f"{DataColumn}(t, '{arg}')")
-                        temp = Input.np.array(Input.pd.Series([eval(f"{DataColumn}({t}, '{arg}')") for t in t_len], index = t_len).apply(CohortSum)).transpose()
-                        exec(f"{Multi_Str} = temp"); del(temp)
-                    except (TypeError, AttributeError):
-                        for i in CohortSet:
-                            temp = Input.pd.Series([eval(f"{DataColumn}({t}, '{arg}')") for t in t_len], index = t_len)
-                            exec(f"Data_{i}['{DataColumn}({arg})'] = temp"); del(temp)
+    ## (cohort x column x month); values that are not per cohort are the same for every cohort
+    Data = Input.np.zeros((len(CohortSet), len(Plan), len(t_len)))
+    for j, (Column, Cell, Args) in enumerate(tqdm(Plan)):
+        Values = [Cell(t, *Args) for t in t_len]
+        try:
+            Data[:, j, :] = CohortSum(Values)
+        except (TypeError, AttributeError):
+            Data[:, j, :] = Input.np.asarray(Values, dtype = float)
+        del(Values)
 
     #### export methods ####
 
     if export == False:
-        DF_Dict = dict()
-        for i in CohortSet:
-            DF = eval(f"Input.pd.DataFrame.from_dict(Data_{i})"); exec(f"del(Data_{i})")
-            DF_Dict[i] = DF; del(DF)
-        return DF_Dict
+        ## per-cohort views of the (cohort x column x month) array
+        return {i: Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns) for k, i in enumerate(CohortSet)}
 
     elif export == True:
         if file_type == ".csv":
-            for i in CohortSet:
-                DF = eval(f"Input.pd.DataFrame.from_dict(Data_{i})"); exec(f"del(Data_{i})")
+            for k, i in enumerate(CohortSet):
+                DF = Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns)
                 filename = f"{name}_{i}" + file_type
                 path = Input.os.path.join(Input.Path["Results"], filename)
                 try:
@@ -374,13 +381,33 @@ def IFRS_RESULTS(export = None, name: str = "ifrs_results", file_type: str = ".x
                     raise PermissionError(f"The file '{filename}' is being used by another process")
                 del(DF, path, filename)
             return f"{Input.inspect.stack()[0][3]} exported successfully!"
+        elif file_type in (".parquet", ".feather"):
+            ## long format: one row per (cohort, cell, t), written cohort by cohort
+            import pyarrow as pa, pyarrow.parquet as pq
+            filename = f"{name}" + file_type
+            path = Input.os.path.join(Input.Path["Results"], filename)
+            Writer = None
+            try:
+                for k, i in enumerate(CohortSet):
+                    DF = Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns)
+                    DF = DF.rename_axis("t").melt(ignore_index = False, var_name = "cell", value_name = "value").reset_index()
+                    DF.insert(0, "cohort", i)
+                    Table = pa.Table.from_pandas(DF[["cohort", "cell", "t", "value"]].astype({"value": float}), preserve_index = False)
+                    if Writer is None:
+                        Writer = pq.ParquetWriter(path, Table.schema) if file_type == ".parquet" else pa.ipc.new_file(path, Table.schema)
+                    Writer.write_table(Table); del(DF, Table)
+                return f"{Input.inspect.stack()[0][3]} exported to '{filename}' successfully!"
+            except PermissionError:
+                raise PermissionError(f"The file '{filename}' is being used by another process")
+            finally:
+                if Writer is not None: Writer.close()
         elif file_type == ".xlsx":
             filename = f"{name}" + file_type
             path = Input.os.path.join(Input.Path["Results"], filename)
             with Input.pd.ExcelWriter(path) as w:
                 try:
-                    for i in CohortSet:
-                        DF = eval(f"Input.pd.DataFrame.from_dict(Data_{i})"); exec(f"del(Data_{i})")
+                    for k, i in enumerate(CohortSet):
+                        DF = Input.pd.DataFrame(Data[k].T, index = t_len, columns = Columns)
                         DF.to_excel(w, sheet_name = f"{i}")
                     return f"{Input.inspect.stack()[0][3]} exported to '{filename}' successfully!"
                 except PermissionError:
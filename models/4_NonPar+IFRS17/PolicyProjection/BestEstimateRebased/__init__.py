@@ -197,6 +197,9 @@ _spaces = []
 def COMM(t): 
     """Total commission"""
 
+    if not CHANGED("Mortality"):
+        return PREV().COMM(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     elif t <= Input.VAL_M().max():
@@ -208,6 +211,9 @@ def COMM(t):
 def COMM_INIT(t): 
     """Initial commission"""
 
+    if not CHANGED("Mortality"):
+        return PREV().COMM_INIT(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -217,6 +223,9 @@ def COMM_INIT(t):
 def COMM_REN(t): 
     """Renewal commission"""
 
+    if not CHANGED("Mortality"):
+        return PREV().COMM_REN(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -226,6 +235,9 @@ def COMM_REN(t):
 def DTH_BEN(t):
     """Death claims"""
 
+    if not CHANGED("Mortality"):
+        return PREV().DTH_BEN(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -236,6 +248,9 @@ def EXPS(t):
     """Total expenses accounting for acquisition,
         maintenance and claim expenses"""
 
+    if not (CHANGED("Mortality") or CHANGED("Inflation")):
+        return PREV().EXPS(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -249,6 +264,9 @@ def EXPS(t):
 def EXPS_ACQ(t):
     """Acquisition expense per policy"""
 
+    if PREV():
+        return PREV().EXPS_ACQ(t)
+
     if t != 1:
         return Input.pd.Series(0, index = Input.MP().index)
     elif t <= Input.VAL_M().max():
@@ -258,15 +276,15 @@ def EXPS_ACQ(t):
 def EXPS_CLAIM_DTH(t):
     """Expenses incured at death"""
 
+    if not (CHANGED("Mortality") or CHANGED("Inflation")):
+        return PREV().EXPS_CLAIM_DTH(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     elif t <= Input.VAL_M().max():
         return Actuals.EXPS_CLAIM_DTH(t)
     else:
-        try:
-            basis = Input.AssumptionsMatrix["Inflation"][scen]
-        except KeyError:
-            basis = "Previous"
+        basis = BASIS("Inflation")
 
         flag = (Input.DUR_M(t) <= Input.POL_TERM_M() + 1)
         ## Inflation adjustment for EOM
@@ -277,15 +295,15 @@ def EXPS_CLAIM_DTH(t):
 def EXPS_CLAIM_MAT(t):
     """Expenses incured at maturity"""
 
+    if not (CHANGED("Mortality") or CHANGED("Inflation")):
+        return PREV().EXPS_CLAIM_MAT(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     elif t <= Input.VAL_M().max():
         return Actuals.EXPS_CLAIM_MAT(t)
     else:
-        try:
-            basis = Input.AssumptionsMatrix["Inflation"][scen]
-        except KeyError:
-            basis = "Previous"
+        basis = BASIS("Inflation")
 
         flag = (Input.DUR_M(t) <= Input.POL_TERM_M() + 1)
 
@@ -295,15 +313,15 @@ def EXPS_CLAIM_MAT(t):
 def EXPS_CLAIM_SURR(t):
     """Expenses incured at surrender"""
 
+    if not (CHANGED("Mortality") or CHANGED("Inflation")):
+        return PREV().EXPS_CLAIM_SURR(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     elif t <= Input.VAL_M().max():
         return Actuals.EXPS_CLAIM_SURR(t)
     else:
-        try:
-            basis = Input.AssumptionsMatrix["Inflation"][scen]
-        except KeyError:
-            basis = "Previous"
+        basis = BASIS("Inflation")
 
     ## Inflation adjustment for EOM
         flag = IND_ACTIVE_POL(t) * (SURR_BEN(t) > 0)
@@ -314,15 +332,15 @@ def EXPS_CLAIM_SURR(t):
 def EXPS_MAINT(t):
     """Annual maintenance expense per policy"""
 
+    if not (CHANGED("Mortality") or CHANGED("Inflation")):
+        return PREV().EXPS_MAINT(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     elif t <= Input.VAL_M().max():
         return Actuals.EXPS_MAINT(t)
     else:
-        try:
-            basis = Input.AssumptionsMatrix["Inflation"][scen]
-        except KeyError:
-            basis = "Previous"
+        basis = BASIS("Inflation")
 
         e           = Input.Exp_Maint_A["Fixed"]/12 * Input.INFL_FAC(t, basis)
         per_prem    = Input.Exp_Maint_A["% of Premium"]
@@ -333,6 +351,9 @@ def EXPS_MAINT(t):
 def GSV(t):
     """Guaranteed Surrender Value"""
 
+    if PREV():
+        return PREV().GSV(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -348,6 +369,9 @@ def INCM_BEN(t):
     """Expected income benefit:
         best estimate"""
 
+    if not CHANGED("Mortality"):
+        return PREV().INCM_BEN(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -357,6 +381,9 @@ def INCM_BEN(t):
 def INCM_VAL(t):
     """Income benefit amount"""
 
+    if PREV():
+        return PREV().INCM_VAL(t)
+
     if t <= 0:
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -366,6 +393,9 @@ def INCM_VAL(t):
 def IND_ACTIVE_POL(t):
     """Indicator if the policy is active"""
 
+    if PREV():
+        return PREV().IND_ACTIVE_POL(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -375,6 +405,9 @@ def IND_ACTIVE_POL(t):
 def IND_ACTIVE_PREM(t):
     """Indicator if the premium term is active"""
 
+    if PREV():
+        return PREV().IND_ACTIVE_PREM(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -384,6 +417,9 @@ def IND_ACTIVE_PREM(t):
 def INS_AFT_PROB(t):
     """Investment Component after probability"""
 
+    if not CHANGED("Mortality"):
+        return PREV().INS_AFT_PROB(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -393,6 +429,9 @@ def INS_AFT_PROB(t):
 def INS_BEF_PROB(t):
     """Insurance Expense"""
 
+    if PREV():
+        return PREV().INS_BEF_PROB(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -402,6 +441,9 @@ def INS_BEF_PROB(t):
 def INV_AFT_PROB(t):
     """Insurance expense after probability"""
 
+    if not CHANGED("Mortality"):
+        return PREV().INV_AFT_PROB(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -415,6 +457,9 @@ def INV_AFT_PROB(t):
 def INV_BEF_PROB(t):
     """Investment Component"""
 
+    if PREV():
+        return PREV().INV_BEF_PROB(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -425,12 +470,18 @@ def INV_BEF_PROB(t):
 def MAT_BEN(t):
     """Maturity benefit"""
 
+    if not CHANGED("Mortality"):
+        return PREV().MAT_BEN(t)
+
     return Input.TERMINAL_BEN() * POLS_MAT(t)
 
 
 def NET_CF(t):
     """Net cashflow"""
 
+    if not (CHANGED("Mortality") or CHANGED("Inflation")):
+        return PREV().NET_CF(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -446,15 +497,15 @@ def NET_CF(t):
 def POLS_DTH(t):
     """Number of death occurring at time t"""
 
+    if not CHANGED("Mortality"):
+        return PREV().POLS_DTH(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     elif t <= Input.VAL_M().max():
         return Actuals.POLS_DTH(t)
     else:
-        try:
-            basis = Input.AssumptionsMatrix["Mortality"][scen]
-        except KeyError:
-            basis = "Previous"
+        basis = BASIS("Mortality")
 
         return IND_ACTIVE_POL(t) * POLS_IF(t) * Input.MORT_RATE_MLY(t, basis)
 
@@ -466,6 +517,9 @@ def POLS_IF(t):
     initial value is read from :func:`pols_if_init`.
     Subsequent values are defined recursively."""
 
+    if not CHANGED("Mortality"):
+        return PREV().POLS_IF(t)
+
     if t < 0:
         raise ValueError("t cannot be less than 0.")
     elif t == 0 or t > Input.MAX_PROJ_LEN():
@@ -480,6 +534,9 @@ def POLS_IF(t):
 def POLS_LAPSE(t):
     """Number of lapse occurring at time t"""
 
+    if not CHANGED("Mortality"):
+        return PREV().POLS_LAPSE(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     elif t <= Input.VAL_M().max():
@@ -498,6 +555,9 @@ def POLS_MAT(t):
 
     otherwise ``0``."""
 
+    if not CHANGED("Mortality"):
+        return PREV().POLS_MAT(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -511,6 +571,9 @@ def PREM_PAYBL_M(t):
 
        premium_pp(t)/premium frequency * pols_if(t)"""
 
+    if not CHANGED("Mortality"):
+        return PREV().PREM_PAYBL_M(t)
+
     if t < 0:
         raise ValueError("t cannot be less than 0.")
     elif t == 0 or t > Input.MAX_PROJ_LEN():
@@ -523,6 +586,9 @@ def PV_DB(t):
     """Present value of death benefit
     for the calculation of surrender value"""
 
+    if PREV():
+        return PREV().PV_DB(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -538,6 +604,9 @@ def PV_INCM_BEN(t):
     """Present Value of Income Benefit
     for the calculation of surrender value"""
 
+    if PREV():
+        return PREV().PV_INCM_BEN(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -552,6 +621,9 @@ def PV_INCM_BEN(t):
 def RA_MORT(t):
     """Risk adjustment: mortality"""
 
+    if not CHANGED("Mortality"):
+        return PREV().RA_MORT(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -562,6 +634,9 @@ def RA_MORT(t):
 def SSV(t):
     """Special surrender values"""
 
+    if PREV():
+        return PREV().SSV(t)
+
     y = (Input.DUR_M(t)/12).apply(Input.math.ceil)
 
     ratio = Input.np.minimum(1, y/Input.PREM_TERM_Y())
@@ -571,6 +646,9 @@ def SSV(t):
 def SURR_BEN(t):
     """Surrender benefit"""
 
+    if not CHANGED("Mortality"):
+        return PREV().SURR_BEN(t)
+
     return SURR_VAL(t) * POLS_LAPSE(t)
 
 
@@ -579,12 +657,18 @@ def SURR_VAL(t):
         defined as: Min(Max(SSV, GSV), 0.95 * SA)
         A factor is multiplied with SA to always have SURR_VAL < SA"""
 
+    if PREV():
+        return PREV().SURR_VAL(t)
+
     return Input.np.minimum(Input.np.maximum(SSV(t), GSV(t)), 0.95 * Input.SUM_ASSURED()) * (Input.DUR_M(t) > Input.SURR_TERM())
 
 
 def PV_PREM(t):
     """Present value of premium payable"""
 
+    if not CHANGED("Mortality"):
+        return PREV().PV_PREM(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -594,6 +678,9 @@ def PV_PREM(t):
 def PV_DTH_BEN(t):
     """Present value of death benefits"""
 
+    if not CHANGED("Mortality"):
+        return PREV().PV_DTH_BEN(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -603,6 +690,9 @@ def PV_DTH_BEN(t):
 def PV_OTH_BEN(t):
     """Present value of surrender, income and maturity benefits"""
 
+    if not CHANGED("Mortality"):
+        return PREV().PV_OTH_BEN(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -613,6 +703,9 @@ def PV_OTH_BEN(t):
 def PV_COMM(t):
     """Present value of commission"""
 
+    if not CHANGED("Mortality"):
+        return PREV().PV_COMM(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -622,6 +715,9 @@ def PV_COMM(t):
 def PV_EXPS(t):
     """Present value of maintenance and claim expenses"""
 
+    if not (CHANGED("Mortality") or CHANGED("Inflation")):
+        return PREV().PV_EXPS(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -633,6 +729,9 @@ def PV_EXPS(t):
 def PV_EXPS_ACQ(t):
     """Present value of aquisition expenses"""
 
+    if PREV():
+        return PREV().PV_EXPS_ACQ(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -642,6 +741,9 @@ def PV_EXPS_ACQ(t):
 def PV_RA_CF(t):
     """Present value of all risk adjusment cashflows"""
 
+    if not CHANGED("Mortality"):
+        return PREV().PV_RA_CF(t)
+
     if t <= 0 or t > Input.MAX_PROJ_LEN():
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -651,6 +753,9 @@ def PV_RA_CF(t):
 def BEL(t):
     """Best estimated liabilities at valuation"""
 
+    if not (CHANGED("Mortality") or CHANGED("Inflation")):
+        return PREV().BEL(t)
+
     if t != 1:
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -665,6 +770,9 @@ def BEL(t):
 def RA(t):
     """Risk adjustment at valuation"""
 
+    if not CHANGED("Mortality"):
+        return PREV().RA(t)
+
     if t != 1:
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -674,6 +782,9 @@ def RA(t):
 def CSM(t):
     """Contractual Service Margin at valuation"""
 
+    if not (CHANGED("Mortality") or CHANGED("Inflation")):
+        return PREV().CSM(t)
+
     if t != 1:
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -683,6 +794,9 @@ def CSM(t):
 def LIAB(t):
     """Total Liability at initial recognisation"""
 
+    if not (CHANGED("Mortality") or CHANGED("Inflation")):
+        return PREV().LIAB(t)
+
     if t != 1:
         return Input.pd.Series(0, index = Input.MP().index)
     else:
@@ -703,9 +817,58 @@ def COHORT():
     return Input.COHORT()
 
 
+def BASIS(assm):
+    """Basis of the assumption in this scenario,
+        as set in Input.AssumptionsMatrix
+
+    assm: Inflation, Mortality"""
+
+    try:
+        return Input.AssumptionsMatrix[assm][scen]
+    except KeyError:
+        return "Previous"
+
+
+def PREV():
+    """The previous scenario, whose cells are reused by this scenario
+
+    Each scenario of Input.AssumptionsMatrix changes the basis of
+    one assumption at a time. A cell which is not downstream of a
+    changed assumption is read from the previous scenario instead of
+    being projected again. Returns False for the first scenario,
+    for scenarios outside the matrix and when Incremental is False.
+
+    The cells only know which of them are downstream of Mortality and
+    Inflation: if any other column of the matrix changes, nothing is
+    reused and the scenario is projected in full."""
+
+    Matrix = Input.AssumptionsMatrix
+    if not (Incremental and scen in Matrix.index and scen - 1 in Matrix.index):
+        return False
+
+    Others = Matrix.columns.difference(["Inflation", "Mortality"])
+    if (Matrix.loc[scen, Others] != Matrix.loc[scen - 1, Others]).any():
+        return False
+    else:
+        return Rebased(scen - 1)
+
+
+def CHANGED(assm):
+    """Indicator if the basis of the assumption differs from the
+        previous scenario; True if there is no previous scenario
+
+    assm: Inflation, Mortality"""
+
+    return not PREV() or BASIS(assm) != PREV().BASIS(assm)
+
+
 # ---------------------------------------------------------------------------
 # References
 
 Input = ("Interface", ("...", "Input"), "auto")
 
-Actuals = ("Interface", ("..", "Actuals"), "auto")
\ No newline at end of file
+Actuals = ("Interface", ("..", "Actuals"), "auto")
+
+Rebased = ("Interface", ("..", "BestEstimateRebased"), "auto")
+
+Incremental = True
\ No newline at end of file
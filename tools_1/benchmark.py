@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:40:27 2026
+
+benchmark suite: times the output functions of the models on synthetic
+portfolios of increasing size and appends the results to a file that can be
+compared between commits
+
+    python -m tools_1.benchmark --sizes 1000 10000 --out results/benchmarks.csv
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import argparse
+import subprocess
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import modelx as mx
+import numpy as np
+import pandas as pd
+
+SIZES = (int(1e3), int(1e4), int(1e5), int(1e6))
+
+## output functions timed per model; RESULTS and AGGREGATE_CF run batch-wise through run_model,
+## COHORT through cohort_model
+TARGETS = {"1_Traditional": ("RESULTS", "COHORT"),
+           "2_Participating": ("RESULTS", "COHORT"),
+           "3_UnitLinked": ("RESULTS", "COHORT"),
+           "4_NonPar+IFRS17": ("AGGREGATE_CF", "COHORT_CF")}
+
+## models whose model points are not held in Input.model_point_table
+MP_TABLES = {"4_NonPar+IFRS17": "ModelPointsFile"}
+
+## column of the synthetic portfolios holding the ID of the model point each row was drawn from,
+## for the models which look up per-policy data by model point ID (the actuals of IFRS17)
+SOURCE_IDS = {"4_NonPar+IFRS17": "SourceID"}
+
+## largest portfolio of the targets which run on the whole portfolio at once
+UNBATCHED = ("COHORT_CF",)
+UNBATCHED_CAP = int(1e4)
+
+def synthetic_portfolio(Table: pd.DataFrame, size: int, seed: int = 0, source_col: str = None):
+    """builds a portfolio of a given size shaped like a model point table,
+    by drawing its rows with replacement and numbering them from 1
+
+    Args:
+        Table (pd.Dataframe): the model's own model point table
+        size (int): number of model points
+        seed (int, optional): seed of the random draw. Defaults to 0.
+        source_col (str, optional): column to keep the ID of the model point each row was drawn from in.
+            Defaults to none
+    Returns:
+        pd.Dataframe: the synthetic portfolio
+    """
+
+    Rows = np.random.default_rng(seed).integers(0, len(Table), size)
+    Portfolio = Table.iloc[Rows].copy()
+    if source_col is not None:
+        Portfolio[source_col] = Table.index[Rows]
+    Portfolio.index = pd.RangeIndex(1, size + 1, name = Table.index.name)
+
+    return Portfolio
+
+def _peak_rss_mb():
+    """peak resident set size of this process in MB; NaN if it cannot be read"""
+
+    try:
+        import resource
+        PeakRSS = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return PeakRSS / 2**20 if sys.platform == "darwin" else PeakRSS / 2**10
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / 2**20
+        except (ImportError, AttributeError):
+            return np.nan
+
+def _run_case(modelpath: str, target: str, PortfolioFile: str, OutputPath: str, batchsize: int, engine: str):
+    """worker of run_benchmarks: runs one output function on one portfolio in a fresh process,
+    so that the peak RSS belongs to this case only
+
+    Returns:
+        tuple: wall time (s) and peak RSS (MB); the wall time includes reading the model and the portfolio
+    """
+
+    StartTime = time.perf_counter()
+    if target == "RESULTS":
+        from tools_1.run_methods import run_model
+        run_model(modelpath, False, OutputPath, batchsize, engine = engine, mp_file = PortfolioFile)
+    elif target == "AGGREGATE_CF":
+        from tools_1.run_methods import run_model
+        run_model(modelpath, False, OutputPath, batchsize, mp_file = PortfolioFile)
+    elif target == "COHORT":
+        from tools_1.run_methods import cohort_model
+        cohort_model(modelpath, OutputPath, ".parquet", batchsize, mp_file = PortfolioFile)
+    else:
+        ## no batched path: capped at UNBATCHED_CAP policies by run_benchmarks
+        MyModel = mx.read_model(modelpath)
+        modelname = os.path.basename(os.path.normpath(modelpath))
+        setattr(MyModel.Input, MP_TABLES.get(modelname, "model_point_table"), pd.read_parquet(PortfolioFile))
+        MyModel.Input.point_id = 0
+        getattr(MyModel.Output, target)(False)
+        del(MyModel)
+
+    return time.perf_counter() - StartTime, _peak_rss_mb()
+
+def _commit():
+    """current git commit of the repository; '' outside a git checkout"""
+
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output = True, text = True,
+                              cwd = os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+def run_benchmarks(ModelsPath: str, ResultsFile: str, models: list = None, sizes: tuple = SIZES,
+                   batchsize: int = int(5e4), engine: str = "modelx", seed: int = 0):
+    """times the output functions in TARGETS on synthetic portfolios of each size
+    and appends one row per case to ResultsFile; the targets in UNBATCHED are
+    recorded as skipped above UNBATCHED_CAP policies
+
+    Args:
+        ModelsPath (str): folder holding the model folders
+        ResultsFile (str): '.csv' file the results are appended to
+        models (list, optional): model folders to run. Defaults to all models in TARGETS
+        sizes (tuple, optional): portfolio sizes. Defaults to 1k, 10k, 100k and 1M policies
+        batchsize (int, optional): batch size of RESULTS, AGGREGATE_CF and COHORT. Defaults to 5e4.
+        engine (str, optional): engine of RESULTS; passed on to run_model. Defaults to 'modelx'.
+        seed (int, optional): seed of the synthetic portfolios. Defaults to 0.
+    Returns:
+        pd.Dataframe: the rows appended to ResultsFile
+    """
+
+    Commit = _commit(); Rows = list()
+    WorkPath = tempfile.mkdtemp(prefix = "benchmark_")
+
+    def Record(modelname, target, size, WallTime, PeakRSS, Status):
+        ## appended case by case, so that a long run keeps the cases it finished
+        Row = {"timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+               "commit": Commit, "model": modelname, "target": target,
+               "engine": engine if target == "RESULTS" else "modelx",
+               "policies": size, "batchsize": batchsize if target not in UNBATCHED else np.nan, "wall_time_s": WallTime,
+               "peak_rss_mb": PeakRSS, "policies_per_s": size / WallTime, "status": Status}
+        pd.DataFrame([Row]).to_csv(ResultsFile, mode = "a", index = False, header = not os.path.exists(ResultsFile))
+        Rows.append(Row)
+
+    for modelname in (models or list(TARGETS)):
+        modelpath = os.path.join(ModelsPath, modelname)
+        try:
+            MyModel = mx.read_model(modelpath)
+            Table = getattr(MyModel.Input, MP_TABLES.get(modelname, "model_point_table")).copy()
+            MyModel.close(); del(MyModel)
+        except Exception as e:
+            for size in sizes:
+                for target in TARGETS[modelname]:
+                    Record(modelname, target, size, np.nan, np.nan, f"{type(e).__name__}: {e}".splitlines()[0])
+            continue
+
+        for size in sizes:
+            PortfolioFile = os.path.join(WorkPath, f"{modelname}_{size}.parquet")
+            synthetic_portfolio(Table, size, seed, SOURCE_IDS.get(modelname)).to_parquet(PortfolioFile)
+
+            for target in TARGETS[modelname]:
+                if target in UNBATCHED and size > UNBATCHED_CAP:
+                    Record(modelname, target, size, np.nan, np.nan, f"skipped: runs unbatched, capped at {UNBATCHED_CAP} policies")
+                    continue
+                print(f"Benchmark: {modelname}.{target} on {size} policies")
+                try:
+                    ## a new (spawned) process per case, so that peak RSS is not carried over
+                    with ProcessPoolExecutor(max_workers = 1, mp_context = multiprocessing.get_context("spawn")) as Pool:
+                        WallTime, PeakRSS = Pool.submit(_run_case, modelpath, target, PortfolioFile,
+                                                        WorkPath, batchsize, engine).result()
+                    Status = "ok"
+                except Exception as e:
+                    WallTime, PeakRSS, Status = np.nan, np.nan, f"{type(e).__name__}: {e}".splitlines()[0]
+                Record(modelname, target, size, WallTime, PeakRSS, Status)
+            os.remove(PortfolioFile)
+        del(Table)
+
+    shutil.rmtree(WorkPath, ignore_errors = True); del(WorkPath)
+
+    return pd.DataFrame(Rows)
+
+def compare_benchmarks(ResultsFile: str, base: str, head: str):
+    """compares the benchmarks of two commits, case by case
+
+    Args:
+        ResultsFile (str): '.csv' file written by run_benchmarks
+        base (str): commit to compare against
+        head (str): commit to compare
+    Returns:
+        pd.Dataframe: wall time and peak RSS of both commits and their ratios (head / base)
+    """
+
+    df = pd.read_csv(ResultsFile, dtype = {"commit": str})
+    Keys = ["model", "target", "engine", "policies"]
+    ## the latest run of each case per commit
+    Base = df[df["commit"] == base].groupby(Keys)[["wall_time_s", "peak_rss_mb"]].last()
+    Head = df[df["commit"] == head].groupby(Keys)[["wall_time_s", "peak_rss_mb"]].last()
+
+    Comparison = Base.join(Head, lsuffix = "_base", rsuffix = "_head", how = "inner")
+    Comparison["wall_time_ratio"] = Comparison["wall_time_s_head"] / Comparison["wall_time_s_base"]
+    Comparison["peak_rss_ratio"] = Comparison["peak_rss_mb_head"] / Comparison["peak_rss_mb_base"]
+
+    return Comparison
+
+if __name__ == "__main__":
+    Parser = argparse.ArgumentParser(description = "benchmark suite of the models")
+    Parser.add_argument("--models", nargs = "+", default = None, help = "model folders; default: all")
+    Parser.add_argument("--sizes", nargs = "+", type = int, default = SIZES, help = "portfolio sizes")
+    Parser.add_argument("--batchsize", type = int, default = int(5e4))
+    Parser.add_argument("--engine", default = "modelx")
+    Parser.add_argument("--seed", type = int, default = 0)
+    Parser.add_argument("--out", default = os.path.join("results", "benchmarks.csv"), help = "results file")
+    Args = Parser.parse_args()
+
+    RepoPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    print(run_benchmarks(os.path.join(RepoPath, "models"), Args.out, Args.models, Args.sizes,
+                         Args.batchsize, Args.engine, Args.seed).to_string())
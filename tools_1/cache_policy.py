@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:02:41 2026
+
+memory-bounded cache of modelx cell results: keeps the cached cell(t) values of
+the projection spaces within a memory budget
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+from modelx.core.system import mxsys
+from modelx.core.node import OBJ, KEY
+from tools_1.profiler import _nbytes
+
+## spaces whose cells are not projected over t
+UNMANAGED = ("Input", "Output")
+
+class _Evicted:
+    """placeholder left in the cache of a cell in place of an evicted value;
+    the value is read back from file, or recomputed if it was not spilled"""
+
+    __slots__ = ("file",)
+
+    def __init__(self, file = None):
+        self.file = file
+
+class CachePolicy:
+    """context manager keeping the cell(t) values cached by modelx inside the with
+    block within a memory budget
+
+    Values are accounted for as they are cached. Once the budget is exceeded, the
+    values furthest in t from the month a cell was last evaluated at are evicted
+    first, down to low_water of the budget: a sliding window over t, that fits
+    forward recursions (POLS_IF(t-1)) as well as backward ones (RESERVE(t+1)).
+    Evicted values are spilled to a temporary folder and read back when called
+    again, or dropped and recomputed if spill is False.
+
+    Only cells whose first parameter is t are managed, e.g. FUND_STEP(t) of the
+    unit funds; the arrays of a dict, tuple or list value are added up. Cells
+    without parameters, e.g. the grids of Projection_Vec and Reserves_Vec, the
+    *_SWEEP cells, PVFCF.VALUES or COV_UNIT_REMAINING, hold a whole batch at once
+    and sit outside the budget; run_methods.plan_batchsize counts them in the bytes
+    per policy-month it measures, so that batches are sized for them.
+
+    The trace of modelx is left untouched, so that clearing a cell still clears
+    its dependents. Values still evicted at the end of the block are cleared
+    together with their dependents, and the spill folder is deleted.
+
+    Args:
+        model: the modelx model
+        memory_budget (float): memory budget of the cached values (MB)
+        spaces (tuple, optional): names of the top-level spaces whose cells are managed.
+            Defaults to all spaces but Input and Output.
+        spill (bool, optional): whether evicted values are spilled to disk (True) or
+            recomputed when called again (False). Defaults to True. Recomputing runs back
+            through the recursions of the evicted months and only pays off with a budget
+            close to the working set of the model: at half of it, a run is about 5 times slower.
+        low_water (float, optional): share of the budget kept after an eviction. Defaults to 0.75.
+    """
+
+    def __init__(self, model, memory_budget: float, spaces: tuple = None,
+                 spill: bool = True, low_water: float = 0.75):
+        self.model = model
+        self.budget = memory_budget * 2**20
+        self.spaces = tuple(spaces) if spaces is not None else tuple(
+            name for name in model.spaces if name not in UNMANAGED)
+        self.spill = spill
+        self.low_water = low_water
+        self.held, self.entries, self.frontier = 0, dict(), dict()
+        self.evicted = dict()
+        self.evictions, self.restores = 0, 0
+        self._managed = dict()
+
+    def __enter__(self):
+        if not mxsys.callstack.is_empty():
+            raise RuntimeError("cannot start a cache policy during formula execution")
+        self._folder = tempfile.mkdtemp(prefix = "modelx_spill_") if self.spill else None
+
+        ## chained with any eval_node already wrapped, e.g. by CellProfiler
+        self._eval_node = mxsys.executor.__dict__.get("eval_node")
+        EvalNode = mxsys.executor.eval_node
+        def eval_node(node):
+            cells, key = node[OBJ], node[KEY]
+            if not self._manages(cells):
+                return EvalNode(node)
+            if cells.has_node(key):
+                if isinstance(cells.data[key], _Evicted):
+                    self._restore(node)
+                else:
+                    return EvalNode(node)
+            value = EvalNode(node)
+            self._account(node, value)
+            return value
+        mxsys.executor.eval_node = eval_node
+
+        return self
+
+    def __exit__(self, *exc):
+        if self._eval_node is None:
+            del(mxsys.executor.eval_node)
+        else:
+            mxsys.executor.eval_node = self._eval_node
+        del(self._eval_node)
+
+        ## no placeholder may outlive the block
+        for node in list(self.evicted):
+            if node[OBJ].has_node(node[KEY]):
+                node[OBJ].clear_value_at(node[KEY])
+        if self._folder is not None:
+            shutil.rmtree(self._folder, ignore_errors = True)
+        self.held, self.entries, self.frontier, self.evicted = 0, dict(), dict(), dict()
+
+        return False
+
+    def _manages(self, cells):
+        try:
+            return self._managed[cells]
+        except KeyError:
+            name = cells.get_repr(fullname = True, add_params = False)
+            name = name[name.find(".") + 1:]
+            managed = self._managed[cells] = (name.split(".")[0] in self.spaces
+                                              and cells.formula.parameters[:1] == ("t",))
+            return managed
+
+    def _account(self, node, value):
+        nbytes = _nbytes(value)
+        if not nbytes:
+            return
+        self.entries[node] = nbytes; self.held += nbytes
+        self.frontier[node[OBJ]] = node[KEY][0]
+        if self.held > self.budget:
+            self._evict()
+
+    def _evict(self):
+        ## furthest from the month each cell was last evaluated at first
+        Order = sorted(self.entries, key = lambda node: abs(node[KEY][0] - self.frontier[node[OBJ]]), reverse = True)
+        for node in Order:
+            if self.held <= self.low_water * self.budget:
+                break
+            cells, key = node[OBJ], node[KEY]
+            nbytes = self.entries.pop(node); self.held -= nbytes
+            ## cleared by modelx in the meantime
+            if not cells.has_node(key) or isinstance(cells.data[key], _Evicted):
+                continue
+            if self._folder is not None:
+                file = os.path.join(self._folder, f"{self.evictions}.pkl")
+                with open(file, "wb") as f:
+                    pickle.dump(cells.data[key], f, protocol = pickle.HIGHEST_PROTOCOL)
+            else:
+                file = None
+            cells.data[key] = self.evicted[node] = _Evicted(file)
+            self.evictions += 1
+
+    def _restore(self, node):
+        cells, key = node[OBJ], node[KEY]
+        Evicted = self.evicted.pop(node, cells.data[key])
+        if Evicted.file is None:
+            ## recomputed by modelx on the next call
+            del(cells.data[key])
+        else:
+            with open(Evicted.file, "rb") as f:
+                cells.data[key] = pickle.load(f)
+            os.remove(Evicted.file)
+        self.restores += 1
+
+    def stats(self):
+        """evictions and restores so far, and memory held by the cached values (MB)"""
+
+        return {"evictions": self.evictions, "restores": self.restores,
+                "held_mb": self.held / 2**20, "budget_mb": self.budget / 2**20}
+
+def cached_bytes(model, spaces: tuple = None):
+    """memory held by the values cached in the cells of a model, including those
+    of item spaces and of cells without parameters (e.g. the grids of the numpy engine)
+
+    Args:
+        model: the modelx model
+        spaces (tuple, optional): names of the top-level spaces to count.
+            Defaults to all spaces but Input and Output.
+    Returns:
+        int: bytes
+    """
+
+    if spaces is None:
+        spaces = tuple(name for name in model.spaces if name not in UNMANAGED)
+    Stack = [model.spaces[name]._impl for name in spaces]
+    nbytes = 0
+    while Stack:
+        Space = Stack.pop()
+        nbytes += sum(_nbytes(value) for Cells in Space.cells.values() for value in Cells.data.values())
+        Stack.extend(Space.spaces.values()); Stack.extend(Space.named_itemspaces.values())
+
+    return nbytes
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 18:02:41 2026
+
+streaming readers for model point files (.csv / .parquet)
+"""
+
+import os
+import pandas as pd
+
+def read_model_points(path: str, chunksize: int = int(5e4), index_col: str = None):
+    """reads a model point file in chunks of fixed size, so that peak memory
+    depends on the chunk size and not on the size of the portfolio
+
+    Args:
+        path (str): path to the model point file; '.csv' or '.parquet'
+        chunksize (int, optional): number of model points per chunk. Defaults to 5e4.
+        index_col (str, optional): column holding the model point IDs. Defaults to the first column
+            of a '.csv' file, and to the index stored by pandas in a '.parquet' file, restored on every chunk
+    Yields:
+        pd.Dataframe: the next chunk of model points
+    """
+
+    file_type = os.path.splitext(path)[1].lower()
+
+    if file_type == ".csv":
+        if index_col is None: index_col = 0
+        with pd.read_csv(path, chunksize = chunksize, index_col = index_col) as Reader:
+            for Chunk in Reader:
+                yield Chunk
+    elif file_type == ".parquet":
+        import pyarrow.parquet as pq
+        ParquetFile = pq.ParquetFile(path)
+        ## a RangeIndex is stored by pandas as metadata only, which the batches do not carry:
+        ## it is rebuilt from the row offset of each batch
+        Indexes = (ParquetFile.schema_arrow.pandas_metadata or dict()).get("index_columns", [])
+        Range = Indexes[0] if len(Indexes) == 1 and isinstance(Indexes[0], dict) and Indexes[0]["kind"] == "range" else None
+        Start = 0
+        for Batch in ParquetFile.iter_batches(batch_size = chunksize):
+            Chunk = Batch.to_pandas()
+            if index_col is not None and index_col in Chunk.columns:
+                Chunk = Chunk.set_index(index_col)
+            elif Range is not None:
+                Chunk.index = pd.RangeIndex(Range["start"] + Start * Range["step"], Range["start"] + (Start + len(Chunk)) * Range["step"],
+                                            Range["step"], name = Range["name"])
+            Start += len(Chunk)
+            yield Chunk
+    else:
+        raise TypeError(f"invalid file type passed: {file_type}")
+
+def count_model_points(path: str):
+    """number of model points in a model point file without loading it
+
+    Args:
+        path (str): path to the model point file; '.csv' or '.parquet'
+    Returns:
+        int: number of model points
+    """
+
+    file_type = os.path.splitext(path)[1].lower()
+
+    if file_type == ".csv":
+        with open(path, "rb") as f:
+            return sum(1 for line in f if line.strip()) - 1
+    elif file_type == ".parquet":
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    else:
+        raise TypeError(f"invalid file type passed: {file_type}")
+
+## keyword arguments of compress_model_points per model folder, for the models whose model points can be grouped:
+## Participating and UnitLinked have no count column (one policy per model point), and IFRS17 looks its actuals
+## up per PolicyID, which a group does not have
+GROUPING = {"1_Traditional": {"keys": ("age_at_entry", "sex", "policy_term", "prem_paying_term", "dur_elapsed", "PCODE"),
+                              "count_col": "policy_count", "amount_cols": ("sum_assured", "ann_prem")}}
+
+def compress_model_points(Table: pd.DataFrame, keys: tuple, count_col: str, amount_cols: tuple, bands: dict = None):
+    """groups the model points which share the values of the keys into one model point each;
+    the counts of a group are added up and its per-policy amounts averaged weighted by the counts,
+    so that the totals of counts and of amounts times counts are kept
+
+    The result is exact for the cells which are linear in the amounts (premiums, benefits,
+    expenses, reserves) and approximate for the others, e.g. surrender values floored or capped
+    per policy; run_methods.grouping_error measures the difference on a sample.
+
+    Args:
+        Table (pd.Dataframe): model point table
+        keys (tuple): columns shared by the model points of a group, e.g. GROUPING[model]["keys"];
+            the columns outside keys, count_col and amount_cols take the value of the first model point of a group
+        count_col (str): column holding the number of policies
+        amount_cols (tuple): columns holding per-policy amounts
+        bands (dict, optional): widths of the bands numeric keys are clustered in, e.g. {"age_at_entry": 5};
+            the model point of a group takes the count-weighted mean of a banded key, rounded for integer columns.
+            Defaults to exact keys
+    Returns:
+        pd.Dataframe: the compressed model point table, numbered from 1
+    """
+
+    if count_col not in Table.columns:
+        raise ValueError(f"the model point table has no count column: {count_col}")
+    bands = bands or dict()
+
+    Labels = [Table[key] // bands[key] if key in bands else Table[key] for key in keys]
+    ## model points with a missing key form groups of their own rather than being dropped
+    GroupID = Table.groupby(Labels, sort = True, dropna = False).ngroup().to_numpy()
+    Counts = Table[count_col].groupby(GroupID).sum()
+
+    Compressed = Table.groupby(GroupID).first()
+    Compressed[count_col] = Counts
+    for col in list(amount_cols) + list(bands):
+        Mean = (Table[col] * Table[count_col]).groupby(GroupID).sum() / Counts
+        Mean = Mean.where(Counts != 0, Compressed[col])
+        Compressed[col] = Mean.round().astype(Table[col].dtype) if col in bands and Table[col].dtype.kind in "iu" else Mean
+
+    Compressed.index = pd.RangeIndex(1, len(Compressed) + 1, name = Table.index.name)
+
+    return Compressed
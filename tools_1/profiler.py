@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:12:05 2026
+
+per-cell profiling of modelx formula evaluations with bounded memory
+"""
+
+import time
+import pandas as pd
+from modelx.core.system import mxsys, CallStack
+from modelx.core.node import OBJ, KEY
+
+class _ProfilingCallStack(CallStack):
+    """modelx call stack that folds every formula evaluation into per-cell
+    statistics as it exits, instead of keeping a trace of every call
+
+    Memory is bounded by the number of cells and, for the flame graph, by
+    max_paths distinct call paths; calls beyond max_paths are charged to the
+    deepest path already recorded.
+    """
+
+    def __init__(self, executor, profiler, maxdepth = None):
+        CallStack.__init__(self, executor, maxdepth)
+        self.profiler = profiler
+        self.frames = []
+
+    def append(self, item):
+        CallStack.append(self, item)
+        Profiler = self.profiler
+        name = Profiler._name(item[OBJ])
+        if self.frames:
+            ParentPath = self.frames[-1][2]
+            ## recursion is folded into the first frame of the cell on the path
+            path = ParentPath if name in ParentPath else Profiler._path(ParentPath, name)
+        else:
+            path = Profiler._path((), name)
+        Profiler.active[name] = Profiler.active.get(name, 0) + 1
+        self.frames.append([name, time.perf_counter(), path, 0.0])
+
+    def pop(self):
+        node = CallStack.pop(self)
+        name, start, path, ChildTime = self.frames.pop()
+        elapsed = time.perf_counter() - start
+        Profiler = self.profiler
+
+        Stat = Profiler._stat(name)
+        Stat["calls"] += 1
+        Stat["self_time"] += elapsed - ChildTime
+        Stat["bytes"] += _nbytes(node[OBJ].data.get(node[KEY]))
+        Profiler.active[name] -= 1
+        if not Profiler.active[name]:
+            Stat["cum_time"] += elapsed
+        Profiler.paths[path] = Profiler.paths.get(path, 0.0) + elapsed - ChildTime
+        if self.frames:
+            self.frames[-1][3] += elapsed
+
+        return node
+
+    def rollback(self):
+        CallStack.rollback(self)
+        name = self.frames.pop()[0]
+        self.profiler.active[name] -= 1
+
+def _nbytes(value):
+    """memory held by a cached value, added up over the values of a dict, tuple or list;
+    0 for values which do not report it"""
+
+    if isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+    elif isinstance(value, (tuple, list)):
+        return sum(_nbytes(item) for item in value)
+    elif hasattr(value, "memory_usage") and callable(value.memory_usage):
+        Usage = value.memory_usage(index = True)
+        return int(Usage.sum()) if hasattr(Usage, "sum") else int(Usage)
+    elif hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    else:
+        return 0
+
+class CellProfiler:
+    """context manager reporting per-cell statistics of every modelx formula
+    evaluated inside the with block; statistics are added up over repeated
+    blocks, e.g. over the batches of a run
+
+    Reported per cell:
+        calls: number of formula evaluations (cache misses)
+        hits: number of values read from the cache
+        hit_ratio: hits / (hits + calls)
+        cum_time: time spent in the cell and the cells it called (s)
+        self_time: time spent in the cell's own formula (s)
+        bytes: memory held by the values the cell returned
+
+    Args:
+        max_paths (int, optional): maximum number of distinct call paths kept for
+            the flame graph. Defaults to 1e4.
+    """
+
+    def __init__(self, max_paths: int = int(1e4)):
+        self.max_paths = max_paths
+        self.cells, self.paths, self.active = dict(), dict(), dict()
+        self._names = dict()
+
+    def __enter__(self):
+        if not mxsys.callstack.is_empty():
+            raise RuntimeError("cannot start profiling during formula execution")
+        self._callstack = mxsys.callstack
+        mxsys.callstack = mxsys.executor.callstack = _ProfilingCallStack(
+            mxsys.executor, self, maxdepth = self._callstack.maxdepth)
+
+        EvalNode = mxsys.executor.eval_node
+        def eval_node(node):
+            if node[OBJ].has_node(node[KEY]):
+                self._stat(self._name(node[OBJ]))["hits"] += 1
+            return EvalNode(node)
+        mxsys.executor.eval_node = eval_node
+
+        return self
+
+    def __exit__(self, *exc):
+        del(mxsys.executor.eval_node)
+        mxsys.callstack = mxsys.executor.callstack = self._callstack
+        del(self._callstack)
+
+        return False
+
+    def _name(self, cells):
+        try:
+            return self._names[cells]
+        except KeyError:
+            name = cells.get_repr(fullname = True, add_params = False)
+            name = self._names[cells] = name[name.find(".") + 1:]
+            return name
+
+    def _stat(self, name):
+        try:
+            return self.cells[name]
+        except KeyError:
+            Stat = self.cells[name] = {"calls": 0, "hits": 0, "cum_time": 0.0, "self_time": 0.0, "bytes": 0}
+            return Stat
+
+    def _path(self, parent, name):
+        path = parent + (name,)
+        if path in self.paths or len(self.paths) < self.max_paths:
+            self.paths.setdefault(path, 0.0)
+            return path
+        else:
+            return parent
+
+    def stats(self, sort_by: str = "self_time"):
+        """per-cell statistics
+
+        Args:
+            sort_by (str, optional): column to sort by, in descending order. Defaults to 'self_time'.
+        Returns:
+            pd.Dataframe: one row per cell
+        """
+
+        df = pd.DataFrame.from_dict(self.cells, orient = "index",
+                                    columns = ["calls", "hits", "cum_time", "self_time", "bytes"])
+        df.insert(2, "hit_ratio", df["hits"]/(df["hits"] + df["calls"]).where(lambda x: x > 0))
+        df.index.name = "cell"
+
+        return df.sort_values(sort_by, ascending = False)
+
+    def to_folded(self, path: str):
+        """writes the call paths in the folded stack format read by flamegraph.pl
+        and speedscope: one line 'cell;cell;...;cell microseconds' per path
+
+        Args:
+            path (str): path to the file
+        """
+
+        with open(path, "w") as f:
+            for CallPath, SelfTime in sorted(self.paths.items()):
+                f.write(f"{';'.join(CallPath)} {max(int(SelfTime * 1e6), 0)}\n")
+
+    def export(self, OutputPath: str, name: str, file_type: str = ".csv"):
+        """exports the per-cell statistics and the flame graph file
+
+        Args:
+            OutputPath (str): folder to export to
+            name (str): name of the files; '_flamegraph.txt' is appended for the flame graph
+            file_type (str, optional): default is '.csv'; other options are '.xlsx', '.parquet' and '.feather'
+        """
+
+        df = self.stats()
+        try:
+            if file_type == ".csv":
+                df.to_csv(f"{OutputPath}/{name}.csv")
+            elif file_type == ".xlsx":
+                df.to_excel(f"{OutputPath}/{name}.xlsx")
+            elif file_type == ".parquet":
+                df.to_parquet(f"{OutputPath}/{name}.parquet")
+            elif file_type == ".feather":
+                df.reset_index().to_feather(f"{OutputPath}/{name}.feather")
+            else:
+                raise TypeError(f"invalid file type passed: {file_type}")
+            self.to_folded(f"{OutputPath}/{name}_flamegraph.txt")
+        except PermissionError as e:
+            raise PermissionError(f"{e}: File is currently being used by another process.")
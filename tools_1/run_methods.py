@@ -3,53 +3,326 @@
 Created on Sun Dec 11 19:19:12 2022
 """
 
+import os
 import time
-import modelx as mx
 import numpy as np
 from math import ceil
+from itertools import count, repeat
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+from tools_1.model_points import read_model_points, count_model_points, compress_model_points, GROUPING
+from tools_1.profiler import CellProfiler
+from tools_1.cache_policy import CachePolicy, cached_bytes
+from tools_1.snapshot import load_model
 
-def run_model(modelpath: str, export: bool, OutputPath: str, batchsize: int = int(5e4),
-              file_type: str = ".csv"):
-    """calls RESULTS function from model; if model point table is too large, runs batch-wise
+## batch size cap of runs without a memory budget
+BATCHSIZE_CAP = int(2e5)
+
+## values (model points x months x cells) in a block of months written by seriatim_model
+SERIATIM_BLOCK = int(2**22)
+
+## share of the available memory taken as the budget when none is given
+AVAILABLE_SHARE = 0.5
+
+def _available_memory_mb():
+    """memory available to new processes in MB; None if it cannot be read"""
+
+    try:
+        import psutil
+        return psutil.virtual_memory().available / 2**20
+    except ImportError:
+        try:
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 2**20
+        except (AttributeError, ValueError, OSError):
+            return None
+
+def _model_point_table(MyModel):
+    """name of the Input reference holding the model points: Input.model_point_table, or
+    Input.ModelPointsFile in the IFRS17 model"""
+
+    return "model_point_table" if "model_point_table" in MyModel.Input.refs else "ModelPointsFile"
+
+def _aggregate(MyModel):
+    """the cell of the aggregate results: Output.RESULTS, or Output.AGGREGATE_CF in the IFRS17 model;
+    both take (export, name, file_type) and return one row per month"""
+
+    return MyModel.Output.RESULTS if "RESULTS" in MyModel.Output.cells else MyModel.Output.AGGREGATE_CF
+
+def _grouping(modelname: str, grouping: dict):
+    """keyword arguments of compress_model_points for a model: its entry in GROUPING, updated with grouping
+
+    Raises:
+        ValueError: if the model points of the model cannot be grouped
+    """
+
+    if modelname not in GROUPING:
+        raise ValueError(f"the model points of the model cannot be grouped: {modelname}")
+
+    return {**GROUPING[modelname], **grouping}
+
+def _set_output_path(MyModel, OutputPath: str):
+    """points the exports of the model to OutputPath: Input.model_path, or Input.Path in the IFRS17 model"""
+
+    if "model_path" in MyModel.Input.refs:
+        MyModel.Input.model_path["Path"] = OutputPath
+    else:
+        MyModel.Input.Path["Results"] = OutputPath
+
+def _projection_months(MyModel, mp_file: str = None):
+    """months projected for the selected model points: Projection.PROJ_LEN().max(),
+    or Input.MAX_PROJ_LEN() in the IFRS17 model; with mp_file, for all the model points
+    of the file, read chunk by chunk"""
+
+    if mp_file is not None:
+        MPTable = _model_point_table(MyModel); Table = getattr(MyModel.Input, MPTable); Months = 0
+        for Chunk in read_model_points(mp_file, index_col = Table.index.name):
+            setattr(MyModel.Input, MPTable, Chunk); MyModel.Input.point_id = 0; del(Chunk)
+            Months = max(Months, _projection_months(MyModel))
+        setattr(MyModel.Input, MPTable, Table); del(Table)
+        return Months
+    if "MAX_PROJ_LEN" in MyModel.Input.cells:
+        return int(MyModel.Input.MAX_PROJ_LEN())
+    return int(MyModel.Projection.PROJ_LEN().max())
+
+def plan_batchsize(MyModel, memory_budget: float = None, workers: int = 1, sample: int = 100,
+                   EngineArgs: dict = None, policies: int = None, seed: int = 0, output: str = "RESULTS"):
+    """profiles a calibration batch of the model points and picks the largest batch size
+    whose cached cell results fit the memory budget, shared by the worker processes
+
+    The calibration batch is drawn from the model point table and run through the output
+    the batches will run; the memory held by the cached values, over the policies and months
+    of the batch, gives the bytes per policy-month of the model. A batch is sized for the
+    months of the whole model point table.
+
+    Args:
+        MyModel: the modelx model, with the model points in Input.model_point_table (Input.ModelPointsFile)
+        memory_budget (float, optional): memory budget (MB) of all the processes together.
+            Defaults to half of the available memory.
+        workers (int, optional): number of worker processes. Defaults to 1.
+        sample (int, optional): size of the calibration batch. Defaults to 100.
+        EngineArgs (dict, optional): keyword arguments passed on to RESULTS
+        policies (int, optional): number of model points to be run. Defaults to the length
+            of the model point table
+        seed (int, optional): seed of the calibration batch. Defaults to 0.
+        output (str, optional): output the calibration batch is run through: 'RESULTS' (AGGREGATE_CF in
+            the IFRS17 model) or 'COHORT'. Defaults to 'RESULTS'.
+    Returns:
+        dict: the plan: batchsize, batches, bytes_per_policy_month, months and estimate_mb
+            (estimated memory of the cache of a full batch)
+    """
+
+    if memory_budget is None:
+        Available = _available_memory_mb()
+        if Available is None:
+            raise ValueError("the available memory cannot be read: a memory_budget has to be given")
+        memory_budget = AVAILABLE_SHARE * Available; del(Available)
+    if output not in ("RESULTS", "COHORT"):
+        raise ValueError(f"invalid output passed: {output}")
+    AllModelPoints = getattr(MyModel.Input, _model_point_table(MyModel)).index
+    policies = len(AllModelPoints) if policies is None else policies
+    MyModel.Input.point_id = 0; months = _projection_months(MyModel)
+
+    Sample = np.random.default_rng(seed).choice(AllModelPoints, min(sample, len(AllModelPoints)), replace = False)
+    MyModel.Input.point_id = list(Sample)
+    if output == "RESULTS":
+        _aggregate(MyModel)(False, "calibration", **(EngineArgs or dict()))
+    else:
+        MyModel.Output.COHORT("calibration", "", False)
+    BytesPerPolicyMonth = cached_bytes(MyModel) / (len(Sample) * _projection_months(MyModel))
+    MyModel.Input.point_id = 0
+    del(AllModelPoints, Sample)
+
+    batchsize = int(memory_budget * 2**20 / max(workers, 1) / (BytesPerPolicyMonth * months))
+    batchsize = max(min(batchsize, ceil(policies / max(workers, 1))), 1)
+    Plan = {"batchsize": batchsize, "batches": ceil(policies / batchsize),
+            "bytes_per_policy_month": BytesPerPolicyMonth, "months": months,
+            "estimate_mb": BytesPerPolicyMonth * months * batchsize / 2**20}
+    print(f"Calibration: {BytesPerPolicyMonth:.1f} bytes per policy-month over {months} months")
+    print(f"Batch plan: {Plan['batches']} batches of up to {batchsize} policies on {max(workers, 1)} process(es), "
+          f"estimated cache {Plan['estimate_mb']:.0f} MB per process of a {memory_budget:.0f} MB budget")
+
+    return Plan
+
+def _planned_batchsize(MyModel, memory_budget: float, workers: int, mp_file: str = None,
+                       grouping: dict = None, EngineArgs: dict = None, output: str = "RESULTS"):
+    """plan_batchsize over the model point table of the model, or over the first chunk of mp_file
+
+    Returns:
+        int: the planned batch size
+    """
+
+    if mp_file is None:
+        return plan_batchsize(MyModel, memory_budget, workers, EngineArgs = EngineArgs, output = output)["batchsize"]
+
+    ## calibrated on the first chunk of the file
+    MPTable = _model_point_table(MyModel); Table = getattr(MyModel.Input, MPTable)
+    setattr(MyModel.Input, MPTable, next(read_model_points(mp_file, 100, Table.index.name)))
+    if grouping is not None:
+        setattr(MyModel.Input, MPTable, compress_model_points(getattr(MyModel.Input, MPTable), **grouping))
+    try:
+        return plan_batchsize(MyModel, memory_budget, workers, EngineArgs = EngineArgs,
+                              policies = count_model_points(mp_file), output = output)["batchsize"]
+    finally:
+        setattr(MyModel.Input, MPTable, Table); del(Table)
+
+def _run_shard(modelpath: str, PointIDs: list, MAX: int, EngineArgs: dict, grouping: dict = None,
+               memory_budget: float = None):
+    """worker for the parallel mode of run_model: reads its own copy of the model
+    and projects one shard of model points batch-wise
+
+    Args:
+        modelpath (string): Path to the model folder
+        PointIDs (list): model points in the shard
+        MAX (int): Maximum size of a batch
+        EngineArgs (dict): keyword arguments passed on to RESULTS
+        grouping (dict, optional): keyword arguments of compress_model_points, as passed to run_model
+        memory_budget (float, optional): memory budget of the worker's cache (MB), its share of run_model's
+    Returns:
+        pd.Dataframe: partial aggregate of the shard
+    """
+
+    MyModel = load_model(modelpath); del(modelpath)
+    MPTable = _model_point_table(MyModel); Results = _aggregate(MyModel)
+    if grouping is not None:
+        setattr(MyModel.Input, MPTable, compress_model_points(getattr(MyModel.Input, MPTable), **grouping))
+    Cache = nullcontext() if memory_budget is None else CachePolicy(MyModel, memory_budget)
+    MPBatches = np.array_split(PointIDs, ceil(len(PointIDs)/MAX))
+    for i in range(len(MPBatches)):
+        MyModel.Input.point_id = list(MPBatches[i])
+        with Cache:
+            if i == 0:
+                df = Results(False, f"shard {PointIDs[0]}: {i+1}/{len(MPBatches)}", **EngineArgs)
+            else:
+                df = df.add(Results(False, f"shard {PointIDs[0]}: {i+1}/{len(MPBatches)}", **EngineArgs), fill_value = 0)
+    MyModel.Input.point_id = 0
+    del(i, MPBatches, Cache, Results, MyModel)
+
+    return df
+
+def run_model(modelpath: str, export: bool, OutputPath: str, batchsize: int = None,
+              file_type: str = ".csv", engine: str = "modelx", workers: int = 1, mp_file: str = None,
+              grouping: dict = None, memory_budget: float = None):
+    """calls RESULTS function from model (AGGREGATE_CF in the IFRS17 model); if model point table
+    is too large, runs batch-wise (in parallel across worker processes if workers > 1)
 
     Args:
         modelpath (string): Path to the model folder
         export (bool): Whether the results are to be exported
         OutputPath (str): a single folder to all the results
-        batchsize (int, optional): Maximum size of a batch. Defaults to 5e4.
-        file_type (str, optional): default is '.csv'; another option is '.xlsx'
+        batchsize (int, optional): Maximum size of a batch. Defaults to None: one batch per process if the model
+            points fit under 2e5 without a memory budget, and otherwise picked by plan_batchsize from a calibration
+            batch, to fit the memory budget and the number of workers. A given batchsize is capped at 2e5 without
+            a memory budget, and at the batch size planned for the budget otherwise
+        file_type (str, optional): default is '.csv'; other options are '.xlsx', '.parquet' and '.feather'
+        engine (str, optional): default is 'modelx'; another option is 'numpy' (vectorised grid engine,
+            only for models whose RESULTS accept an 'engine' argument)
+        workers (int, optional): number of worker processes. Defaults to 1 (runs in this process).
+            Each worker reads its own copy of the model and projects a shard of the model points;
+            the partial aggregates are added up at the end
+        mp_file (str, optional): a model point file (.csv or .parquet) to be streamed in chunks of batchsize
+            in place of the model's own model point table; peak memory then depends on the batchsize only
+        grouping (dict, optional): keyword arguments of compress_model_points over those of the model in GROUPING,
+            e.g. {"bands": {"age_at_entry": 5}}; the model points (or each chunk of mp_file) are grouped ahead of the
+            projection. Only the models in GROUPING can be grouped. Defaults to None (seriatim)
+        memory_budget (float, optional): memory budget of the cached cell results (MB), shared by the processes;
+            the cache of the projection spaces is kept within it by a CachePolicy. Defaults to None (everything
+            is cached, and batches are sized to half of the available memory)
     Returns:
         pd.Dataframe: if export is False
     """
  
     StartTime = time.time()
     
-    MAX = min(batchsize, int(float(2e5))); modelname = modelpath[modelpath.rfind("\\") + 1:]
+    modelname = os.path.basename(os.path.normpath(modelpath))
     print(f"Running model: {modelname}")
+    if grouping is not None:
+        grouping = _grouping(modelname, grouping)
 
-    MyModel = mx.read_model(modelpath); del(modelpath)
-    MyModel.Input.model_path["Path"] = OutputPath
-    AllModelPoints = MyModel.Input.model_point_table.index
+    MyModel = load_model(modelpath)
+    _set_output_path(MyModel, OutputPath)
+    MPTable = _model_point_table(MyModel); Results = _aggregate(MyModel)
+    if engine == "modelx":
+        EngineArgs = dict()
+    elif "engine" in Results.parameters:
+        EngineArgs = {"engine": engine}
+    else:
+        raise ValueError(f"engine '{engine}' is not supported by the model: {modelname}")
+    if mp_file is not None and workers > 1:
+        raise ValueError("a model point file cannot be streamed with more than one worker")
+    if mp_file is not None and count_model_points(mp_file) <= 0:
+        raise ValueError(f"the model point file holds no model points: {mp_file}")
+    if grouping is not None and mp_file is None:
+        LengthMPTable = len(getattr(MyModel.Input, MPTable).index)
+        setattr(MyModel.Input, MPTable, compress_model_points(getattr(MyModel.Input, MPTable), **grouping))
+        print(f"Grouped {LengthMPTable} model points into {len(getattr(MyModel.Input, MPTable).index)}")
+    AllModelPoints = getattr(MyModel.Input, MPTable).index
     LengthMPTable = len(AllModelPoints)
+    Policies = LengthMPTable if mp_file is None else count_model_points(mp_file)
+
+    ## memory budget of each process
+    Budget = None if memory_budget is None else memory_budget / max(workers, 1)
+    Cache = nullcontext() if Budget is None else CachePolicy(MyModel, Budget)
+    if batchsize is None and Budget is None and Policies <= BATCHSIZE_CAP:
+        ## no calibration: one batch per process
+        MAX = ceil(Policies / max(workers, 1))
+    elif batchsize is not None and Budget is None:
+        MAX = min(batchsize, BATCHSIZE_CAP)
+    else:
+        ## sized from the bytes per policy-month measured on a calibration batch
+        MAX = _planned_batchsize(MyModel, memory_budget, workers, mp_file, grouping, EngineArgs)
+        if batchsize is not None:
+            MAX = min(batchsize, MAX)
+            print(f"Memory budget: {Budget:.0f} MB per process, maximum batchsize: {MAX}")
 
     FileName = modelname+"_aggregate"
-    if LengthMPTable <= MAX:
+    if mp_file is None and LengthMPTable <= MAX and workers <= 1:
         MyModel.Input.point_id = 0
-        MyModel.Output.RESULTS(export, FileName, file_type)
+        with Cache:
+            df = Results(export, FileName, file_type, **EngineArgs)
         MyModel.Input.point_id = 0
-        del(AllModelPoints, LengthMPTable, FileName, MyModel, export)
+        del(AllModelPoints, LengthMPTable, FileName, Cache, Results, MyModel)
+        if not export:
+            return df
     else:
-        MPBatches = np.array_split(AllModelPoints, ceil(LengthMPTable/MAX))
-        del(AllModelPoints, LengthMPTable)
-        for i in range(len(MPBatches)):
-            MyModel.Input.point_id = list(MPBatches[i])
-            if i == 0:
-                df = MyModel.Output.RESULTS(False, f"{i+1}/{len(MPBatches)}")
-            else:
-                df = df.add(MyModel.Output.RESULTS(False, f"{i+1}/{len(MPBatches)}"))
-        MyModel.Input.point_id = 0
-        del(i)
+        if mp_file is not None:
+            n = ceil(Policies/MAX)
+            IndexName = getattr(MyModel.Input, MPTable).index.name
+            del(AllModelPoints, LengthMPTable)
+            for i, Chunk in enumerate(read_model_points(mp_file, MAX, IndexName)):
+                if grouping is not None:
+                    Chunk = compress_model_points(Chunk, **grouping)
+                setattr(MyModel.Input, MPTable, Chunk); del(Chunk)
+                MyModel.Input.point_id = 0
+                with Cache:
+                    if i == 0:
+                        df = Results(False, f"{i+1}/{n}", **EngineArgs)
+                    else:
+                        df = df.add(Results(False, f"{i+1}/{n}", **EngineArgs), fill_value = 0)
+            del(i, n, IndexName)
+        elif workers > 1:
+            Shards = [list(Shard) for Shard in np.array_split(AllModelPoints, min(workers, LengthMPTable))]
+            del(AllModelPoints, LengthMPTable)
+            print(f"Running {len(Shards)} shards in parallel")
+            with ProcessPoolExecutor(max_workers = len(Shards)) as Pool:
+                Partials = Pool.map(_run_shard, repeat(modelpath), Shards, repeat(MAX), repeat(EngineArgs), repeat(grouping),
+                                    repeat(Budget))
+                for i, Partial in enumerate(Partials):
+                    df = Partial if i == 0 else df.add(Partial, fill_value = 0)
+            del(i, Partial, Partials, Shards)
+        else:
+            MPBatches = np.array_split(AllModelPoints, ceil(LengthMPTable/MAX))
+            del(AllModelPoints, LengthMPTable)
+            for i in range(len(MPBatches)):
+                MyModel.Input.point_id = list(MPBatches[i])
+                with Cache:
+                    if i == 0:
+                        df = Results(False, f"{i+1}/{len(MPBatches)}", **EngineArgs)
+                    else:
+                        df = df.add(Results(False, f"{i+1}/{len(MPBatches)}", **EngineArgs), fill_value = 0)
+            MyModel.Input.point_id = 0
+            del(i)
+        del(Results)
 
         if export:
             try:
@@ -57,6 +330,17 @@ def run_model(modelpath: str, export: bool, OutputPath: str, batchsize: int = in
                     df.to_csv(f"{OutputPath}/{FileName}.csv"); del(FileName, df, OutputPath)
                 elif file_type == ".xlsx":
                     df.to_excel(f"{OutputPath}/{FileName}.xlsx"); del(FileName, df, OutputPath)
+                elif file_type in (".parquet", ".feather"):
+                    ## long format, as written by the models' RESULTS
+                    df = df.rename_axis("t").melt(ignore_index = False, var_name = "cell", value_name = "value").reset_index()
+                    df = df[["cell", "t", "value"]].astype({"value": float})
+                    if file_type == ".parquet":
+                        df.to_parquet(f"{OutputPath}/{FileName}.parquet", index = False)
+                    else:
+                        df.to_feather(f"{OutputPath}/{FileName}.feather")
+                    del(FileName, df, OutputPath)
+                else:
+                    raise TypeError(f"invalid file type passed: {file_type}")
                 MyModel.Input.point_id = 0; del(MyModel)
             except PermissionError as e:
                 MyModel.Input.point_id = 0; del(MyModel)
@@ -67,75 +351,372 @@ def run_model(modelpath: str, export: bool, OutputPath: str, batchsize: int = in
     
     print(f"\nTotal time taken: {round(time.time()-StartTime, 2)}s"); del(StartTime)
 
-def stack_tracing(modelpath: str, export: bool, OutputPath: str, file_type: str = ".csv"):
-    """Generates runtime report for Python models
+def stack_tracing(modelpath: str, export: bool, OutputPath: str, file_type: str = ".csv",
+                  batchsize: int = None, engine: str = "modelx", mp_file: str = None,
+                  memory_budget: float = None):
+    """Generates runtime report for Python models: runs the model batch-wise as run_model does,
+    with per-cell statistics (calls, cache hits, cumulative and self time, bytes) added up over
+    all batches, and exports them as a table sorted by self time and a flame graph file
 
     Args:
         modelpath (string): path to the model folder
         export (bool): Whether the results file are to be exported
         OutputPath (str): a single folder to all the results
-        file_type (str, optional): default is '.csv'; another option is '.xlsx'
+        file_type (str, optional): default is '.csv'; other options are '.xlsx', '.parquet' and '.feather'
+        batchsize (int, optional): Maximum size of a batch; passed on to run_model. Defaults to None (planned).
+        engine (str, optional): default is 'modelx'; passed on to run_model
+        mp_file (str, optional): a model point file to be streamed; passed on to run_model
+        memory_budget (float, optional): memory budget of the cached cell results (MB); passed on to run_model
+    Returns:
+        pd.Dataframe: per-cell statistics
     """
 
     StartTime = time.time()
-    modelname = modelpath[modelpath.rfind("\\") + 1:]
-    FileName = modelname+"_aggregate"; del(modelname)
-    StackTraceFile = f"{FileName}_report"
-    
-    ## read the model
-    MyModel = mx.read_model(modelpath); del(modelpath)
-    MyModel.Input.model_path["Path"] = OutputPath
+    modelname = os.path.basename(os.path.normpath(modelpath))
+    StackTraceFile = f"{modelname}_aggregate_report"; del(modelname)
 
-    ## setup formula trace
-    MyModel.time = time
-    mx.start_stacktrace(maxlen = None)
+    ## run the model with the profiler active
+    with CellProfiler() as Profiler:
+        run_model(modelpath, export, OutputPath, batchsize, file_type, engine, 1, mp_file, memory_budget = memory_budget)
+    del(modelpath)
+    print(f"Model run time: {round(time.time() - StartTime, 2)}s")
 
-    ## run the model
-    MyModel.Input.point_id = 0
+    ## export post runtime data
+    Profiler.export(OutputPath, StackTraceFile, file_type)
+    df = Profiler.stats(); del(Profiler)
+
+    print(f"\nTotal time taken: {round(time.time()-StartTime, 2)}s")
+    del(StackTraceFile, StartTime)
+
+    return df
     
-    MyModel.Output.RESULTS(export, FileName, file_type)
+def _cohort_shard(modelpath: str, PointIDs: list, MAX: int, memory_budget: float = None, months: int = None):
+    """worker for the parallel mode of cohort_model: reads its own copy of the model
+    and runs COHORT on one shard of model points batch-wise
+
+    Args:
+        modelpath (string): Path to the model folder
+        PointIDs (list): model points in the shard
+        MAX (int): Maximum size of a batch
+        memory_budget (float, optional): memory budget of the worker's cache (MB), its share of cohort_model's
+        months (int, optional): months projected, those of the whole model point table
+    Returns:
+        tuple: per-cohort partial sums of the shard and the values common to all cohorts, as returned by COHORT
+    """
+
+    MyModel = load_model(modelpath); del(modelpath)
+    Cache = nullcontext() if memory_budget is None else CachePolicy(MyModel, memory_budget)
+    MPBatches = np.array_split(PointIDs, ceil(len(PointIDs)/MAX))
+    for i in range(len(MPBatches)):
+        MyModel.Input.point_id = list(MPBatches[i])
+        with Cache:
+            Partial = MyModel.Output.COHORT(f"shard {PointIDs[0]}: {i+1}/{len(MPBatches)}", "", False, months)
+        df = Partial if i == 0 else _add_cohorts(df, Partial)
     MyModel.Input.point_id = 0
+    del(i, MPBatches, Cache, MyModel)
 
-    print(f"Model run time: {round(time.time() - StartTime, 2)}s")
-    df = pd.DataFrame.from_dict(mx.get_stacktrace(summarize = True))
+    return df
+
+def _add_cohorts(df: tuple, Partial: tuple):
+    """adds up the per-cohort results of two batches (or shards), as returned by COHORT: a cohort may
+    span both; the values common to all cohorts are the same in both and are taken once
+
+    Returns:
+        tuple: per-cohort sums, cohorts in order and cells in the order of the model, and the common values
+    """
+
+    (Sums, Common), (PartialSums, PartialCommon) = df, Partial
+    Cells = list(dict.fromkeys(list(Sums.index.get_level_values(1)) + list(PartialSums.index.get_level_values(1))))
+    Cohorts = sorted(set(Sums.index.get_level_values(0)) | set(PartialSums.index.get_level_values(0)))
+    Sums = Sums.add(PartialSums, fill_value = 0).sort_index(axis = 1)
+
+    return (Sums.reindex(pd.MultiIndex.from_product([Cohorts, Cells], names = Sums.index.names)),
+            Common.combine_first(PartialCommon))
+
+def _join_cohorts(df: tuple):
+    """per-cohort results of COHORT batches in one pd.Dataframe: the values common to all cohorts
+    fill the rows COHORT leaves empty
+
+    Returns:
+        pd.Dataframe: one row per (cohort, cell), one column per month
+    """
+
+    Sums, Common = df
+    Rows = Sums.index.get_level_values(1).isin(Common.index)
+    Sums.loc[Rows] = Common.reindex(index = Sums.index.get_level_values(1)[Rows], columns = Sums.columns).to_numpy()
+
+    return Sums
 
-    ## format dataframe and export post runtime data
+def _export_cohorts(df: pd.DataFrame, OutputPath: str, FileName: str, file_type: str):
+    """exports per-cohort results as Output.COHORT does: a file per cohort ('.csv'), a sheet per
+    cohort ('.xlsx') or a single file in long format ('.parquet', '.feather')"""
+
+    CohortName = df.index.names[0]
     try:
         if file_type == ".csv":
-            df[:-2].transpose().to_csv(f"{OutputPath}/{StackTraceFile}.csv")
+            for i in df.index.get_level_values(0).unique():
+                df.loc[i].T.to_csv(f"{OutputPath}/{FileName}_{i}.csv")
         elif file_type == ".xlsx":
-            df[:-2].transpose().to_xlsx(f"{OutputPath}/{StackTraceFile}.xlsx")
-        MyModel.Input.point_id = 0; del(MyModel)
+            with pd.ExcelWriter(f"{OutputPath}/{FileName}.xlsx") as w:
+                for i in df.index.get_level_values(0).unique():
+                    df.loc[i].T.to_excel(w, sheet_name = f"{CohortName}_{i}")
+        elif file_type in (".parquet", ".feather"):
+            ## long format, as written by the models' COHORT
+            df = df.rename_axis(["cohort", "cell"]).rename_axis("t", axis = 1).stack().rename("value").reset_index()
+            df = df[["cohort", "cell", "t", "value"]].astype({"value": float})
+            if file_type == ".parquet":
+                df.to_parquet(f"{OutputPath}/{FileName}.parquet", index = False)
+            else:
+                df.to_feather(f"{OutputPath}/{FileName}.feather")
+        else:
+            raise TypeError(f"invalid file type passed: {file_type}")
     except PermissionError as e:
-        MyModel.Input.point_id = 0; del(MyModel)
         raise PermissionError(f"{e}: File is currently being used by another process.")
-    mx.stop_stacktrace()
 
-    print(f"\nTotal time taken: {round(time.time()-StartTime, 2)}s")
-    del(df, StackTraceFile, StartTime)
-    
-def cohort_model(modelpath: str, OutputPath: str, file_type: str = ".xlsx"):
-    """calls COHORT function from model
+def cohort_model(modelpath: str, OutputPath: str, file_type: str = ".xlsx", batchsize: int = None,
+                 workers: int = 1, mp_file: str = None, memory_budget: float = None):
+    """calls COHORT function from model; if model point table is too large, runs batch-wise
+    (in parallel across worker processes if workers > 1) and adds up the per-cohort results
 
     Args:
         modelpath (string): Path to the model folder
         OutputPath (str): a single folder to all the results
-        file_type (str, optional): default is '.csv'; another option is '.xlsx'
-    Returns:
-        pd.Dataframe: if export is False
+        file_type (str, optional): default is '.xlsx'; other options are '.csv', '.parquet' and '.feather'
+        batchsize (int, optional): Maximum size of a batch. Defaults to None: as in run_model, with the
+            calibration batch run through COHORT
+        workers (int, optional): number of worker processes. Defaults to 1 (runs in this process).
+            Each worker reads its own copy of the model and runs a shard of the model points
+        mp_file (str, optional): a model point file (.csv or .parquet) to be streamed in chunks of batchsize
+            in place of the model's own model point table
+        memory_budget (float, optional): memory budget of the cached cell results (MB), shared by the processes;
+            as in run_model
     """
  
     StartTime = time.time()
-    modelname = modelpath[modelpath.rfind("\\") + 1:]
+    modelname = os.path.basename(os.path.normpath(modelpath))
     print(f"Running model: {modelname}")
 
-    MyModel = mx.read_model(modelpath); del(modelpath)
-    MyModel.Input.model_path["Path"] = OutputPath; del(OutputPath)
+    MyModel = load_model(modelpath)
+    _set_output_path(MyModel, OutputPath)
+    MPTable = _model_point_table(MyModel)
+    if "COHORT" not in MyModel.Output.cells:
+        raise ValueError(f"the model has no Output.COHORT to be run: {modelname}")
+    if mp_file is not None and workers > 1:
+        raise ValueError("a model point file cannot be streamed with more than one worker")
+    if mp_file is not None and count_model_points(mp_file) <= 0:
+        raise ValueError(f"the model point file holds no model points: {mp_file}")
+    AllModelPoints = getattr(MyModel.Input, MPTable).index
+    LengthMPTable = len(AllModelPoints)
+    Policies = LengthMPTable if mp_file is None else count_model_points(mp_file)
+
+    ## memory budget of each process
+    Budget = None if memory_budget is None else memory_budget / max(workers, 1)
+    Cache = nullcontext() if Budget is None else CachePolicy(MyModel, Budget)
+    if batchsize is None and Budget is None and Policies <= BATCHSIZE_CAP:
+        ## no calibration: one batch per process
+        MAX = ceil(Policies / max(workers, 1))
+    elif batchsize is not None and Budget is None:
+        MAX = min(batchsize, BATCHSIZE_CAP)
+    else:
+        ## sized from the bytes per policy-month measured on a calibration batch
+        MAX = _planned_batchsize(MyModel, memory_budget, workers, mp_file, output = "COHORT")
+        if batchsize is not None:
+            MAX = min(batchsize, MAX)
+            print(f"Memory budget: {Budget:.0f} MB per process, maximum batchsize: {MAX}")
 
     FileName = modelname+"_cohort"
+    if mp_file is None and LengthMPTable <= MAX and workers <= 1:
+        MyModel.Input.point_id = 0
+        with Cache:
+            MyModel.Output.COHORT(FileName, file_type)
+        MyModel.Input.point_id = 0
+        del(AllModelPoints, LengthMPTable, Cache, MyModel)
+    else:
+        ## every batch runs over the months of the whole model point table
+        MyModel.Input.point_id = 0; Months = _projection_months(MyModel, mp_file)
+        if mp_file is not None:
+            n = ceil(Policies/MAX)
+            IndexName = getattr(MyModel.Input, MPTable).index.name
+            del(AllModelPoints, LengthMPTable)
+            for i, Chunk in enumerate(read_model_points(mp_file, MAX, IndexName)):
+                setattr(MyModel.Input, MPTable, Chunk); del(Chunk)
+                MyModel.Input.point_id = 0
+                with Cache:
+                    Partial = MyModel.Output.COHORT(f"{i+1}/{n}", "", False, Months)
+                df = Partial if i == 0 else _add_cohorts(df, Partial)
+            del(i, n, IndexName, Partial)
+        elif workers > 1:
+            Shards = [list(Shard) for Shard in np.array_split(AllModelPoints, min(workers, LengthMPTable))]
+            del(AllModelPoints, LengthMPTable)
+            print(f"Running {len(Shards)} shards in parallel")
+            with ProcessPoolExecutor(max_workers = len(Shards)) as Pool:
+                Partials = Pool.map(_cohort_shard, repeat(modelpath), Shards, repeat(MAX), repeat(Budget), repeat(Months))
+                for i, Partial in enumerate(Partials):
+                    df = Partial if i == 0 else _add_cohorts(df, Partial)
+            del(i, Partial, Partials, Shards)
+        else:
+            MPBatches = np.array_split(AllModelPoints, ceil(LengthMPTable/MAX))
+            del(AllModelPoints, LengthMPTable)
+            for i in range(len(MPBatches)):
+                MyModel.Input.point_id = list(MPBatches[i])
+                with Cache:
+                    Partial = MyModel.Output.COHORT(f"{i+1}/{len(MPBatches)}", "", False, Months)
+                df = Partial if i == 0 else _add_cohorts(df, Partial)
+            del(i, Partial, MPBatches)
+
+        MyModel.Input.point_id = 0; del(MyModel, Months)
+        _export_cohorts(_join_cohorts(df), OutputPath, FileName, file_type); del(df)
+    del(FileName, modelpath, OutputPath)
+    
+    print(f"\nTotal time taken: {round(time.time()-StartTime, 2)}s"); del(StartTime)
+
+def seriatim_model(modelpath: str, OutputPath: str, cells: list = None, batchsize: int = int(2e3),
+                   mp_file: str = None, compression: str = "zstd"):
+    """calls SERIATIM function from model batch-wise and streams the per-policy results of
+    every batch to a single '.parquet' file, a block of months at a time, each block
+    holding up to SERIATIM_BLOCK values; peak memory depends on the batchsize and the
+    number of cells, not on the size of the portfolio
+
+    Args:
+        modelpath (string): Path to the model folder
+        OutputPath (str): a single folder to all the results
+        cells (list, optional): columns of the model's RESULT_PLAN to be written, e.g. ["Projection.NET_CF"].
+            Defaults to all columns
+        batchsize (int, optional): Maximum size of a batch. Defaults to 2e3: the cached cell results of a batch
+            still run over all its months
+        mp_file (str, optional): a model point file (.csv or .parquet) to be streamed in chunks of batchsize
+            in place of the model's own model point table
+        compression (str, optional): compression of the '.parquet' file. Defaults to 'zstd'.
+    Returns:
+        str: path to the '.parquet' file, with one row per model point and month, in blocks of months
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    StartTime = time.time()
+    MAX = min(batchsize, BATCHSIZE_CAP); modelname = os.path.basename(os.path.normpath(modelpath))
+    print(f"Running model: {modelname}")
+
+    MyModel = load_model(modelpath)
+    MPTable = _model_point_table(MyModel)
+    Cells = tuple(cells or ()); Columns = len(Cells) or len(MyModel.Output.RESULT_PLAN())
+
+    if mp_file is not None:
+        if count_model_points(mp_file) <= 0:
+            raise ValueError(f"the model point file holds no model points: {mp_file}")
+        n = ceil(count_model_points(mp_file)/MAX)
+        Batches = read_model_points(mp_file, MAX, getattr(MyModel.Input, MPTable).index.name)
+    else:
+        AllModelPoints = getattr(MyModel.Input, MPTable).index
+        n = ceil(len(AllModelPoints)/MAX)
+        Batches = (list(Batch) for Batch in np.array_split(AllModelPoints, n))
+        del(AllModelPoints)
+
+    path = f"{OutputPath}/{modelname}_seriatim.parquet"; Writer = None
+    try:
+        for i, Batch in enumerate(Batches):
+            print(f"Seriatim batch {i+1}/{n}")
+            ## months per block, so that a block holds up to SERIATIM_BLOCK values
+            Step = max(SERIATIM_BLOCK // (len(Batch) * Columns), 1)
+            if mp_file is not None:
+                setattr(MyModel.Input, MPTable, Batch); MyModel.Input.point_id = 0
+            else:
+                MyModel.Input.point_id = Batch
+            del(Batch)
+
+            for Start in count(0, Step):
+                Block = MyModel.Output.SERIATIM(Cells, Start, Start + Step)
+                MyModel.Output.SERIATIM.clear()
+                if Block.empty:
+                    break
+                Table = pa.Table.from_pandas(Block.reset_index(), preserve_index = False); del(Block)
+                if Writer is None:
+                    Writer = pq.ParquetWriter(path, Table.schema, compression = compression)
+                Writer.write_table(Table); del(Table)
+            del(Block, Start, Step)
+    except PermissionError as e:
+        raise PermissionError(f"{e}: File is currently being used by another process.")
+    finally:
+        if Writer is not None: Writer.close()
+        MyModel.Input.point_id = 0; del(MyModel)
+
+    print(f"\nTotal time taken: {round(time.time()-StartTime, 2)}s"); del(StartTime)
+
+    return path
+
+def grouping_error(modelpath: str, sample: int = int(1e3), seed: int = 0, **grouping):
+    """reports the approximation error of grouping model points: runs RESULTS on a sample of the
+    model point table seriatim and grouped by compress_model_points, and compares the two; only the
+    models in GROUPING can be grouped
+
+    Args:
+        modelpath (string): Path to the model folder
+        sample (int, optional): number of model points drawn from the model point table. Defaults to 1e3.
+        seed (int, optional): seed of the draw. Defaults to 0.
+        **grouping: keyword arguments of compress_model_points over those of the model in GROUPING
+    Returns:
+        pd.Dataframe: per column of RESULTS, the totals over all months seriatim and grouped,
+            their relative difference and the largest absolute difference in a month
+    """
+
+    grouping = _grouping(os.path.basename(os.path.normpath(modelpath)), grouping)
+    MyModel = load_model(modelpath); del(modelpath)
+    MPTable = _model_point_table(MyModel); Results = _aggregate(MyModel)
+    Table = getattr(MyModel.Input, MPTable)
+    Sample = Table.sample(min(sample, len(Table.index)), random_state = seed); del(Table)
+    Grouped = compress_model_points(Sample, **grouping)
+    print(f"Grouped {len(Sample.index)} model points into {len(Grouped.index)}")
+
     MyModel.Input.point_id = 0
-    MyModel.Output.COHORT(FileName, file_type)
+    setattr(MyModel.Input, MPTable, Sample)
+    Seriatim = Results(False, "seriatim").select_dtypes("number")
+    setattr(MyModel.Input, MPTable, Grouped)
+    Grouped = Results(False, "grouped").select_dtypes("number")
+    del(MyModel, MPTable, Results, Sample)
+
+    Diff = Grouped.sub(Seriatim, fill_value = 0)
+    Report = pd.DataFrame({"seriatim": Seriatim.sum(), "grouped": Grouped.sum()})
+    Report["rel_error"] = (Report["grouped"] - Report["seriatim"]) / Report["seriatim"].abs().where(lambda x: x > 0)
+    Report["max_abs_error"] = Diff.abs().max()
+    Report.index.name = "column"
+
+    return Report
+
+def batching_error(modelpath: str, sample: int = int(1e3), batchsize: int = 100, seed: int = 0):
+    """checks that cohort results run batch-wise match those of a single run: runs COHORT on a sample
+    of the model point table in one batch and in batches of batchsize, combined as cohort_model does,
+    and compares the two
+
+    Args:
+        modelpath (string): Path to the model folder
+        sample (int, optional): number of model points drawn from the model point table. Defaults to 1e3.
+        batchsize (int, optional): size of the batches. Defaults to 100.
+        seed (int, optional): seed of the draw. Defaults to 0.
+    Returns:
+        pd.Dataframe: per cell, the largest absolute difference over the cohorts and months, and
+            the same relative to the largest absolute value of the single run
+    """
+
+    MyModel = load_model(modelpath); del(modelpath)
+    MPTable = _model_point_table(MyModel); Table = getattr(MyModel.Input, MPTable)
+    setattr(MyModel.Input, MPTable, Table.sample(min(sample, len(Table.index)), random_state = seed)); del(Table)
+    AllModelPoints = getattr(MyModel.Input, MPTable).index
+
+    MyModel.Input.point_id = 0; Months = _projection_months(MyModel)
+    Single = _join_cohorts(MyModel.Output.COHORT("single", "", False, Months))
+    MPBatches = np.array_split(AllModelPoints, ceil(len(AllModelPoints)/batchsize))
+    for i in range(len(MPBatches)):
+        MyModel.Input.point_id = list(MPBatches[i])
+        Partial = MyModel.Output.COHORT(f"{i+1}/{len(MPBatches)}", "", False, Months)
+        df = Partial if i == 0 else _add_cohorts(df, Partial)
     MyModel.Input.point_id = 0
-    del(FileName, MyModel)
-    
-    print(f"\nTotal time taken: {round(time.time()-StartTime, 2)}s"); del(StartTime)
\ No newline at end of file
+    Batched = _join_cohorts(df).reindex_like(Single)
+    del(i, Partial, df, MPBatches, AllModelPoints, Months, MyModel)
+
+    Diff = (Batched - Single).abs().groupby(level = "cell", sort = False).max().max(axis = 1)
+    Scale = Single.abs().groupby(level = "cell", sort = False).max().max(axis = 1)
+    Report = pd.DataFrame({"max_abs_error": Diff, "rel_error": Diff / Scale.where(Scale > 0)})
+    Report.index.name = "cell"
+
+    return Report
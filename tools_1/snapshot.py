@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:10:52 2026
+
+compiled snapshots of modelx models: reading a model spends most of its time
+re-parsing the source of every formula and re-reading the input tables; a
+snapshot keeps what these produce, keyed by the content hash of the model
+folder, so that repeated runs and worker processes skip the work
+"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+import pandas as pd
+import modelx as mx
+import modelx.core.formula as mxformula
+from modelx.io.pandasio import PandasData
+
+def _cache_path():
+    """per-user cache folder: snapshots are unpickled on loading, so they must not live
+    in a folder other users can write to"""
+
+    if os.name == "nt":
+        Base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        Base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+
+    return os.path.join(Base, "modelx_snapshots")
+
+## default folder of the snapshots
+SNAPSHOT_PATH = _cache_path()
+
+def model_hash(modelpath: str):
+    """content hash of a model folder: the sources, the pickled data and the input tables;
+    hidden files and folders and compiled python files are left out, as they change
+    without the model changing (e.g. the .tables.pickle sidecars of READ_TABLES)
+
+    Args:
+        modelpath (string): Path to the model folder
+    Returns:
+        str: sha256 hex digest
+    """
+
+    Hash = hashlib.sha256()
+    for Root, Dirs, Files in os.walk(modelpath):
+        Dirs[:] = sorted(Dir for Dir in Dirs if Dir != "__pycache__" and not Dir.startswith("."))
+        for File in sorted(Files):
+            if File.startswith(".") or File.endswith((".pyc", ".pyo")):
+                continue
+            Path = os.path.join(Root, File)
+            Hash.update(os.path.relpath(Path, modelpath).replace("\\", "/").encode())
+            with open(Path, "rb") as f:
+                for Block in iter(lambda: f.read(2**20), b""):
+                    Hash.update(Block)
+
+    return Hash.hexdigest()
+
+class _Snapshot:
+    """context manager serving the formula sources and input tables of a model from a
+    snapshot while modelx reads the model, and recording whatever it had to produce
+
+    Formula sources are stored with their decorators removed and their names replaced,
+    the two steps of modelx parsing every formula through asttokens; input tables are
+    stored as read by their IOSpecs.
+    """
+
+    def __init__(self, file: str):
+        self.file = file
+        try:
+            with open(file, "rb") as f:
+                self.sources, self.tables = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.sources, self.tables = dict(), dict()
+        self.misses = 0
+
+    def __enter__(self):
+        self._remove_decorator = RemoveDecorator = mxformula.remove_decorator
+        self._replace_funcname = ReplaceFuncname = mxformula.replace_funcname
+        self._read_pandas = ReadPandas = PandasData._read_pandas
+
+        def remove_decorator(source):
+            try:
+                return self.sources[source]
+            except KeyError:
+                self.misses += 1
+                result = self.sources[source] = RemoveDecorator(source)
+                return result
+
+        def replace_funcname(source, name):
+            try:
+                return self.sources[(source, name)]
+            except KeyError:
+                self.misses += 1
+                result = self.sources[(source, name)] = ReplaceFuncname(source, name)
+                return result
+
+        def read_pandas(data):
+            key = (str(data._io.path), data._io.file_type, repr(data._read_args), data._squeeze)
+            if key not in self.tables:
+                self.misses += 1
+                ReadPandas(data)
+                self.tables[key] = data._value.copy()
+                return
+            ## as left by PandasData._read_pandas
+            data._value = self.tables[key].copy()
+            if isinstance(data._value, pd.Series):
+                data._value.name = data.name
+            if hasattr(data, "_is_hidden") and data._is_hidden:
+                data._value._mx_dataclient = data
+
+        mxformula.remove_decorator, mxformula.replace_funcname = remove_decorator, replace_funcname
+        PandasData._read_pandas = read_pandas
+
+        return self
+
+    def __exit__(self, *exc):
+        mxformula.remove_decorator, mxformula.replace_funcname = self._remove_decorator, self._replace_funcname
+        PandasData._read_pandas = self._read_pandas
+        del(self._remove_decorator, self._replace_funcname, self._read_pandas)
+
+        if exc[0] is None and self.misses:
+            ## written to a temporary file first: other processes may be reading the snapshot
+            os.makedirs(os.path.dirname(self.file), mode = 0o700, exist_ok = True)
+            Handle, Temp = tempfile.mkstemp(dir = os.path.dirname(self.file), suffix = ".tmp")
+            with os.fdopen(Handle, "wb") as f:
+                pickle.dump((self.sources, self.tables), f, protocol = pickle.HIGHEST_PROTOCOL)
+            os.replace(Temp, self.file)
+
+        return False
+
+def load_model(modelpath: str, SnapshotPath: str = None):
+    """reads a model as mx.read_model does, from its compiled snapshot if the model folder
+    is unchanged since the snapshot was taken; otherwise the snapshot is (re)built on the way
+    and the snapshots of earlier versions of the folder are removed
+
+    Args:
+        modelpath (string): Path to the model folder
+        SnapshotPath (str, optional): folder of the snapshots. Defaults to SNAPSHOT_PATH in the user's cache folder
+    Returns:
+        the modelx model
+    """
+
+    modelpath = os.path.normpath(modelpath)
+    SnapshotPath = SnapshotPath or SNAPSHOT_PATH
+    ## the same model folder always has the same prefix, whatever its content
+    Prefix = f"{os.path.basename(modelpath)}_{hashlib.sha256(os.path.abspath(modelpath).encode()).hexdigest()[:8]}_"
+    File = os.path.join(SnapshotPath, f"{Prefix}{model_hash(modelpath)[:16]}.pickle")
+    with _Snapshot(File):
+        MyModel = mx.read_model(modelpath)
+
+    ## superseded snapshots of the folder
+    if os.path.isfile(File):
+        for Old in os.listdir(SnapshotPath):
+            if Old.startswith(Prefix) and Old.endswith(".pickle") and Old != os.path.basename(File):
+                try:
+                    os.remove(os.path.join(SnapshotPath, Old))
+                except OSError:
+                    pass
+
+    return MyModel
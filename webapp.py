@@ -76,7 +76,7 @@ else:
 
 currwd = os.path.dirname(__file__); os.chdir(currwd)
 st.header("Milliman Interactive User Space")
-FileExtnSupported = [".xlsx", ".csv"]
+FileExtnSupported = [".xlsx", ".csv", ".parquet", ".feather"]
 
 # Layout for theme toggle button
 col1, col2 = st.columns([9, 1])
@@ -120,29 +120,41 @@ with ModelsCol1:
 with ModelsCol2:
     st.subheader("Run settings")
     OutputPath = st.text_input("Output Path", value = os.path.join(currwd,"results"))
-    BatchSize = st.text_input("Maximum batchsize (cannot exceed 2x10^5)", value = 10000)
+    BatchSize = st.text_input("Maximum batchsize (optional; sized from the memory budget if blank)", value = "")
+    MemoryBudget = st.text_input("Memory budget in MB (optional; half of the available memory if blank)", value = "")
     StackTracing = st.checkbox("Stack Tracing (run-time report)", value = False)
+    Engine = st.radio("Projection engine (numpy: Traditional only):", ["modelx", "numpy"])
+    Workers = st.number_input("Parallel worker processes", min_value = 1, max_value = os.cpu_count(), value = 1)
+    MPFile = st.text_input("Model point file to stream (optional, .csv/.parquet)", value = "")
 
 with ModelsCol3:
     def RunModels():
         try:
-            n = int(float(BatchSize))
+            n = int(float(BatchSize)) if BatchSize.strip() else None
         except ValueError:
             raise ValueError("Cannot convert this type into int")
+        Budget = float(MemoryBudget) if MemoryBudget.strip() else None
 
         for i, model in zip(range(len(ModelsList)), ModelsList):
             if eval(f"ModelCheck{i} == True"):
                 st.write("Running: " + os.path.join(currwd, "models", model))
                 if StackTracing:
-                    stack_tracing(os.path.join(currwd, "models", model), ExportCB, OutputPath, FileTypeRadio)
+                    stack_tracing(os.path.join(currwd, "models", model), ExportCB, OutputPath, FileTypeRadio, n, Engine, MPFile or None, Budget)
                 else:
-                    run_model(os.path.join(currwd, "models", model), ExportCB, OutputPath, n, FileTypeRadio)
+                    run_model(os.path.join(currwd, "models", model), ExportCB, OutputPath, n, FileTypeRadio, Engine, int(Workers), MPFile or None,
+                              memory_budget = Budget)
 
     def CohortModels():
+        try:
+            n = int(float(BatchSize)) if BatchSize.strip() else None
+        except ValueError:
+            raise ValueError("Cannot convert this type into int")
+        Budget = float(MemoryBudget) if MemoryBudget.strip() else None
+
         for i, model in zip(range(len(ModelsList)), ModelsList):
             if eval(f"ModelCheck{i} == True"):
                 st.write("Running: " + os.path.join(currwd, "models", model))
-                cohort_model(os.path.join(currwd, "models", model), OutputPath, FileTypeRadio)
+                cohort_model(os.path.join(currwd, "models", model), OutputPath, FileTypeRadio, n, int(Workers), MPFile or None, Budget)
 
     ModelsCol31, ModelsCol32 = ModelsCol3.columns(2)
     with ModelsCol31:
@@ -150,7 +162,7 @@ with ModelsCol3:
     with ModelsCol32:
         CohortButton = st.button("Cohort", on_click = CohortModels)
     
-    st.write("Note: Batch-wise execution is not functional for Stack Tracing or Cohort")
+    st.write("Note: Stack Tracing runs in a single process")
     ExportCB = st.checkbox("Export aggregate results", value = True)        
     FileTypeRadio = st.radio("File type:", FileExtnSupported)
 